@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+마크다운 전처리 시간 비교: 줄 단위 루프(이전 방식) vs 결합 정규식 한 번 통과
+
+사용법:
+    uv run python benchmarks/bench_preprocess.py [--lines 1000000] [-n 5]
+
+- line loop: 줄마다 무시 패턴 검사 + 이미지 정규식 (이전 _preprocess)
+- _preprocess(str): 결합 정규식으로 문자열 전체를 한 번에 처리
+- preprocess_buffer(mmap): 파일을 mmap으로 열어 바이트 위에서 바로 처리
+"""
+
+import argparse
+import mmap
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.markdown_parser import MarkdownParser
+
+
+def legacy_preprocess(parser: MarkdownParser, content: str) -> str:
+    """이전 구현 (비교 기준)"""
+    lines = content.split('\n')
+    result_lines = []
+    image_pattern = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            result_lines.append(line)
+            continue
+        if any(regex.match(stripped) for regex in parser._ignore_regex):
+            continue
+
+        def encode_image_path(match):
+            return f'![{match.group(1)}]({match.group(2).replace(" ", "%20")})'
+
+        result_lines.append(image_pattern.sub(encode_image_path, line))
+
+    return '\n'.join(result_lines)
+
+
+def synthetic_markdown(line_count: int) -> str:
+    """본문/빈 줄/페이지 구분자/이미지가 섞인 합성 마크다운"""
+    random.seed(0)
+    samples = [
+        '보고서 본문 문장입니다. **강조**와 *기울임*이 섞인 일반 문단 텍스트.',
+        'Plain body text with `inline code` and a [link](https://example.com).',
+        '',
+        '- 목록 항목',
+        '## 2. 소제목',
+        '- Page 12 -',
+        '- Slide 3 -',
+        '![차트 이미지](report assets/page_3/chart 1.png)',
+        '| 항목 | 값 |',
+    ]
+    weights = [30, 20, 25, 8, 3, 3, 1, 5, 5]
+    return '\n'.join(random.choices(samples, weights, k=line_count))
+
+
+def measure(label: str, func, repeat: int) -> float:
+    func()  # 워밍업
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    median = statistics.median(times)
+    print(f"{label:<26} median {median * 1000:9.1f} ms   min {min(times) * 1000:9.1f} ms")
+    return median
+
+
+def main():
+    parser = argparse.ArgumentParser(description='마크다운 전처리 시간 비교')
+    parser.add_argument('--lines', type=int, default=1_000_000, help='합성 입력 줄 수')
+    parser.add_argument('-n', '--repeat', type=int, default=5, help='반복 횟수')
+    args = parser.parse_args()
+
+    md_parser = MarkdownParser()
+    content = synthetic_markdown(args.lines)
+    size_mb = len(content.encode('utf-8')) / (1024 * 1024)
+    print(f"입력: {args.lines:,}줄, {size_mb:.1f} MB (반복 {args.repeat}회)\n")
+
+    expected = legacy_preprocess(md_parser, content)
+    assert md_parser._preprocess(content) == expected
+
+    with tempfile.TemporaryFile() as f:
+        f.write(content.encode('utf-8'))
+        f.flush()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            assert md_parser.preprocess_buffer(mapped) == expected
+
+            t_legacy = measure('line loop (이전)', lambda: legacy_preprocess(md_parser, content), args.repeat)
+            t_str = measure('_preprocess(str)', lambda: md_parser._preprocess(content), args.repeat)
+            t_mmap = measure('preprocess_buffer(mmap)', lambda: md_parser.preprocess_buffer(mapped), args.repeat)
+
+    print(f"\n_preprocess(str)는 {t_legacy / t_str:.1f}배, "
+          f"preprocess_buffer(mmap)는 {t_legacy / t_mmap:.1f}배 빠름")
+
+
+if __name__ == '__main__':
+    main()
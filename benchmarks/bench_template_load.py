@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+템플릿 구조 준비 시간 비교: analyze() vs load()
+
+사용법:
+    uv run python benchmarks/bench_template_load.py template.docx [-n 20]
+
+- analyze: 매번 TemplatePackage를 새로 열어 docx 분석 (캐시 미사용)
+- analyze (streaming): iterparse 스트리밍 분석
+- load: save()로 만든 template_structure.json 로드 (해시 확인 포함)
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.asset_store import AssetStore
+from src.template_analyzer import DocxTemplateAnalyzer, TemplateStructure
+from src.template_package import TemplatePackage
+
+
+def measure(label: str, func, repeat: int) -> float:
+    func()  # 워밍업 (import, 파일 시스템 캐시)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    median = statistics.median(times)
+    print(f"{label:<22} median {median * 1000:8.2f} ms   min {min(times) * 1000:8.2f} ms")
+    return median
+
+
+def main():
+    parser = argparse.ArgumentParser(description='템플릿 analyze() vs load() 시간 비교')
+    parser.add_argument('template', help='DOCX 템플릿 파일')
+    parser.add_argument('-n', '--repeat', type=int, default=20, help='반복 횟수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AssetStore(Path(tmp) / 'assets')
+        json_path = Path(tmp) / 'template_structure.json'
+
+        def analyze(streaming: bool = False):
+            package = TemplatePackage(args.template)
+            return DocxTemplateAnalyzer(
+                args.template, package=package, asset_store=store, streaming=streaming
+            ).analyze()
+
+        analyze().save(str(json_path))
+        size_kb = json_path.stat().st_size / 1024
+        print(f"템플릿: {args.template}  (구조 파일 {size_kb:.1f} KB, 반복 {args.repeat}회)\n")
+
+        t_analyze = measure('analyze()', analyze, args.repeat)
+        measure('analyze(streaming)', lambda: analyze(streaming=True), args.repeat)
+        t_load = measure(
+            'load()',
+            lambda: TemplateStructure.load(str(json_path), args.template, asset_store=store),
+            args.repeat,
+        )
+
+        print(f"\nload()가 analyze()보다 {t_analyze / t_load:.1f}배 빠름")
+
+
+if __name__ == '__main__':
+    main()
@@ -18,9 +18,18 @@ MD → DOCX 변환기
     # 템플릿 분석 (플레이스홀더 확인)
     uv run python main.py --analyze template.docx
 
+    # 본문이 아주 큰 템플릿 분석 (스트리밍)
+    uv run python main.py --analyze template.docx --streaming
+
+    # 아주 큰 마크다운 변환 (스트리밍)
+    uv run python main.py huge.md output.docx -t template.docx --streaming
+
     # 마크다운 분석
     uv run python main.py --parse input.md
 
+    # 파싱 캐시 없이 변환 (마크다운을 항상 다시 파싱)
+    uv run python main.py input.md output.docx -t template.docx --no-cache
+
 """
 
 import argparse
@@ -35,19 +44,24 @@ from src.markdown_parser import MarkdownParser
 from src.docx_generator import DocxGenerator
 
 
-def analyze_template(template_path: str, show_placeholders: bool = True):
+def analyze_template(template_path: str, show_placeholders: bool = True, streaming: bool = False):
     """템플릿 분석"""
-    analyzer = DocxTemplateAnalyzer(template_path)
+    from src.template_package import TemplatePackage
+
+    # 템플릿 패키지는 한 번만 열어서 분석기/파서가 공유
+    package = TemplatePackage(template_path)
+    analyzer = DocxTemplateAnalyzer(template_path, package=package, streaming=streaming)
     analyzer.analyze()
     analyzer.print_summary()
     output = analyzer.save_structure()
-    print(f"\n📁 에셋 저장: {analyzer.output_dir}")
+    print(f"\n📁 구조 저장: {output}")
+    print(f"🖼️ 에셋 저장소: {analyzer.asset_store.directory}")
 
     # 플레이스홀더 분석 추가
     if show_placeholders:
         try:
             from src.template_parser import TemplateParser
-            parser = TemplateParser(template_path)
+            parser = TemplateParser(template_path, package=package)
             result = parser.parse()
 
             print(f"\n📌 플레이스홀더 분석:")
@@ -72,7 +86,7 @@ def parse_markdown(md_path: str):
 
     for i, section in enumerate(doc.sections[:5]):
         print(f"\n  Section {i+1}: {section.heading or '(no heading)'}")
-        print(f"    Blocks: {len(section.blocks)}")
+        print(f"    Blocks: {len(section)}")
 
     print(f"\n📊 Total blocks: {len(doc.raw_blocks)}")
     block_types = {}
@@ -82,15 +96,17 @@ def parse_markdown(md_path: str):
         print(f"    {bt}: {count}")
 
 
-def convert_file(md_path: str, output_path: str, template_path: str = None):
+def convert_file(md_path: str, output_path: str, template_path: str = None, streaming: bool = False,
+                 writer: str = 'ooxml'):
     """단일 파일 변환"""
-    generator = DocxGenerator(template_path)
-    result = generator.generate_from_file(md_path, output_path)
+    generator = DocxGenerator(template_path, writer=writer)
+    result = generator.generate_from_file(md_path, output_path, streaming=streaming)
     print(f"✅ {Path(md_path).name} → {Path(output_path).name}")
     return result
 
 
-def convert_directory(input_dir: str, output_dir: str, template_path: str = None):
+def convert_directory(input_dir: str, output_dir: str, template_path: str = None, streaming: bool = False,
+                      writer: str = 'ooxml'):
     """디렉토리 일괄 변환"""
     input_path = Path(input_dir)
     output_path = Path(output_dir)
@@ -102,7 +118,7 @@ def convert_directory(input_dir: str, output_dir: str, template_path: str = None
     for md_file in md_files:
         output_file = output_path / f"{md_file.stem}.docx"
         try:
-            result = convert_file(str(md_file), str(output_file), template_path)
+            result = convert_file(str(md_file), str(output_file), template_path, streaming, writer)
             results.append(result)
         except Exception as e:
             print(f"❌ {md_file.name}: {e}")
@@ -176,6 +192,12 @@ def main():
     parser.add_argument('-o', '--out', dest='output_alt', help='출력 파일 경로 (--pipeline 모드용)')
     parser.add_argument('--analyze', metavar='DOCX', help='템플릿 분석 모드')
     parser.add_argument('--parse', metavar='MD', help='마크다운 분석 모드')
+    parser.add_argument('--streaming', action='store_true',
+                        help='스트리밍 처리 (--analyze: 본문이 큰 템플릿 분석, 변환: 아주 큰 마크다운)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='마크다운 파싱 캐시 사용 안 함 (항상 다시 파싱, 캐시에 저장하지 않음)')
+    parser.add_argument('--writer', choices=DocxGenerator.WRITERS, default='ooxml',
+                        help='본문 기록 방식 (ooxml: 요소 직접 생성, python-docx: 기존 API 경로 - 결과는 같음)')
 
     # 파이프라인 모드 옵션
     parser.add_argument('--pipeline', action='store_true', help='플레이스홀더 기반 파이프라인 모드')
@@ -189,9 +211,13 @@ def main():
     if args.output_alt and not args.output:
         args.output = args.output_alt
 
+    if args.no_cache:
+        from src.parse_cache import set_parse_cache_enabled
+        set_parse_cache_enabled(False)
+
     # 템플릿 분석 모드
     if args.analyze:
-        analyze_template(args.analyze)
+        analyze_template(args.analyze, streaming=args.streaming)
         print(f"\n⏱️ 소요 시간: {time.perf_counter()-s:.2f}s")
         return
 
@@ -222,11 +248,11 @@ def main():
     if input_path.is_dir():
         if not output_path:
             output_path = str(input_path) + '_converted'
-        convert_directory(str(input_path), output_path, args.template)
+        convert_directory(str(input_path), output_path, args.template, args.streaming, args.writer)
     else:
         if not output_path:
             output_path = input_path.stem + '.docx'
-        convert_file(str(input_path), output_path, args.template)
+        convert_file(str(input_path), output_path, args.template, args.streaming, args.writer)
 
     print(f"\n⏱️ 소요 시간: {time.perf_counter()-s:.2f}s")
 
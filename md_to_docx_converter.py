@@ -7,17 +7,22 @@
 - 하드코딩된 텍스트 지표 없이 마크다운 문법만으로 매핑
 """
 
-from docx import Document
 from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
-from markdown_it import MarkdownIt
 from markdown_it.token import Token
 from pathlib import Path
 from typing import List, Dict, Optional
 import re
 import copy
 
+from src.inline_renderer import add_runs, runs_from_tokens
+from src.markdown_parser import get_markdown_engine
+from src.ooxml_writer import TABLE_STYLE_NAME, add_table
+from src.style_table import StyleTable
+from src.template_package import TemplatePackage
+from src.template_pool import get_template_pool
+
 
 class MarkdownToDocxConverter:
     """마크다운을 DOCX로 변환하는 클래스"""
@@ -44,14 +49,16 @@ class MarkdownToDocxConverter:
             template_path: DOCX 템플릿 파일 경로 (None이면 빈 문서 생성)
         """
         self.template_path = template_path
-        self.md_parser = MarkdownIt('commonmark', {'breaks': True, 'html': True})
-        self.md_parser.enable('table')  # 테이블 지원
+        self.md_parser = get_markdown_engine()  # 공유 엔진 (commonmark + 테이블)
 
-        # 템플릿 로드 또는 새 문서 생성
+        # 템플릿 로드 또는 새 문서 생성 (풀의 마스터에서 트리 복사, 템플릿당 파싱 1회)
         if template_path and Path(template_path).exists():
-            self.doc = Document(template_path)
+            self.doc = get_template_pool().checkout(TemplatePackage(template_path))
         else:
-            self.doc = Document()
+            self.doc = get_template_pool().checkout_default()
+
+        # 문서 스타일 해결 표 (표 스타일 등을 스타일별 한 번만 조회)
+        self._styles = StyleTable.from_document(self.doc)
 
         self.style_map = self.DEFAULT_STYLE_MAP.copy()
 
@@ -377,21 +384,9 @@ class MarkdownToDocxConverter:
 
             i += 1
 
-        # DOCX 테이블 생성
+        # DOCX 테이블 생성 (w:tbl 전체를 한 번에 구성)
         if rows:
-            num_cols = max(len(row[0]) for row in rows) if rows else 0
-            table = self.doc.add_table(rows=len(rows), cols=num_cols)
-            table.style = 'Table Grid'
-
-            for row_idx, (cells, is_header) in enumerate(rows):
-                for col_idx, cell_text in enumerate(cells):
-                    if col_idx < num_cols:
-                        cell = table.rows[row_idx].cells[col_idx]
-                        cell.text = cell_text
-                        if is_header:
-                            for para in cell.paragraphs:
-                                for run in para.runs:
-                                    run.bold = True
+            add_table(self.doc, rows, self._styles, self.style_map.get('table', TABLE_STYLE_NAME))
 
         return consumed
 
@@ -438,82 +433,13 @@ class MarkdownToDocxConverter:
         return ''.join(text_parts)
 
     def _add_formatted_text(self, para, inline_token: Token):
-        """인라인 토큰의 서식을 적용하며 텍스트 추가"""
+        """인라인 토큰의 서식을 적용하며 텍스트 추가 (서식이 같은 구간은 run 하나)"""
         if not inline_token.children:
             if inline_token.content:
                 para.add_run(inline_token.content)
             return
 
-        self._process_inline_children(para, inline_token.children, {})
-
-    def _process_inline_children(self, para, children: List[Token], format_state: dict):
-        """인라인 자식 토큰 처리 (재귀)"""
-        for child in children:
-            if child.type == 'text':
-                run = para.add_run(child.content)
-                self._apply_format(run, format_state)
-
-            elif child.type == 'code_inline':
-                run = para.add_run(child.content)
-                run.font.name = 'Consolas'
-                run.font.size = Pt(10)
-
-            elif child.type == 'softbreak':
-                para.add_run(' ')
-
-            elif child.type == 'hardbreak':
-                para.add_run('\n')
-
-            elif child.type == 'strong_open':
-                new_state = format_state.copy()
-                new_state['bold'] = True
-                # 다음 토큰들 처리
-                idx = children.index(child)
-                inner_children = []
-                for j in range(idx + 1, len(children)):
-                    if children[j].type == 'strong_close':
-                        break
-                    inner_children.append(children[j])
-                self._process_inline_children(para, inner_children, new_state)
-
-            elif child.type == 'em_open':
-                new_state = format_state.copy()
-                new_state['italic'] = True
-                idx = children.index(child)
-                inner_children = []
-                for j in range(idx + 1, len(children)):
-                    if children[j].type == 'em_close':
-                        break
-                    inner_children.append(children[j])
-                self._process_inline_children(para, inner_children, new_state)
-
-            elif child.type == 'link_open':
-                # 링크는 텍스트만 추출
-                pass
-
-            elif child.type in ('strong_close', 'em_close', 'link_close'):
-                pass  # 이미 처리됨
-
-            elif child.type == 's_open':  # 취소선
-                new_state = format_state.copy()
-                new_state['strike'] = True
-                idx = children.index(child)
-                inner_children = []
-                for j in range(idx + 1, len(children)):
-                    if children[j].type == 's_close':
-                        break
-                    inner_children.append(children[j])
-                self._process_inline_children(para, inner_children, new_state)
-
-    def _apply_format(self, run, format_state: dict):
-        """run에 서식 적용"""
-        if format_state.get('bold'):
-            run.bold = True
-        if format_state.get('italic'):
-            run.italic = True
-        if format_state.get('strike'):
-            run.font.strike = True
-
+        add_runs(para, runs_from_tokens(inline_token.children))
 
 def main():
     """테스트 실행"""
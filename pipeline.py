@@ -19,6 +19,7 @@ from src.template_parser import TemplateParser
 from src.markdown_parser import MarkdownParser, DocumentStructure
 from src.llm_content_mapper import LLMContentMapper, ContentMapperSync
 from src.docx_composer import DocxComposer
+from src.template_package import TemplatePackage
 from src.models import ParsedTemplate, ContentMappingPlan
 
 
@@ -75,10 +76,14 @@ class DocumentAutomationPipeline:
             PipelineResult 객체
         """
         try:
+            # 템플릿 패키지는 한 번만 열어서 파서/조립기가 공유
+            package = TemplatePackage(template_path)
+
             # 1. 템플릿 파싱
             template_parser = TemplateParser(
                 template_path,
-                placeholder_pattern=self.config.placeholder_pattern
+                placeholder_pattern=self.config.placeholder_pattern,
+                package=package,
             )
             template_info = template_parser.parse()
 
@@ -108,7 +113,8 @@ class DocumentAutomationPipeline:
             output_dir = Path(output_path).parent if output_path else None
             composer = DocxComposer(
                 template_path,
-                output_dir=str(output_dir) if output_dir else None
+                output_dir=str(output_dir) if output_dir else None,
+                package=package,
             )
 
             final_output = composer.compose(
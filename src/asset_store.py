@@ -0,0 +1,80 @@
+"""
+콘텐츠 주소 기반 에셋 저장소
+
+- 템플릿 미디어(word/media/*)를 내용 해시 이름의 파일로 보관
+- 같은 내용의 파일은 한 번만 기록 (이미 있으면 건너뜀)
+- 경로는 해시만으로 결정되므로 실제 기록은 경로가 요청될 때까지 지연
+- 템플릿 디렉토리가 읽기 전용이어도 동작 (캐시 디렉토리에 기록)
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Callable, Optional
+
+from .cache import DEFAULT_CACHE_DIR
+
+
+class AssetStore:
+    """해시 이름 blob 저장소 (<dir>/<hash[:2]>/<hash><ext>)"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: 저장 디렉토리 (기본: ~/.cache/md-to-docx/assets)
+        """
+        self.directory = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR / 'assets'
+
+        # 계측용 카운터
+        self.writes = 0
+        self.skipped = 0
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def digest_stream(stream: IO[bytes], chunk_size: int = 1 << 20) -> str:
+        """스트림 내용의 해시 (전체를 메모리에 올리지 않음)"""
+        h = hashlib.sha256()
+        for chunk in iter(lambda: stream.read(chunk_size), b''):
+            h.update(chunk)
+        return h.hexdigest()
+
+    def path_for(self, digest: str, ext: str = '') -> Path:
+        """해시에 해당하는 저장 경로 (파일 존재 여부와 무관)"""
+        return self.directory / digest[:2] / f"{digest}{ext}"
+
+    def put(self, data: bytes, ext: str = '') -> str:
+        """blob 저장 후 경로 반환 (이미 있으면 기록 생략)"""
+        path = self.path_for(self.digest(data), ext)
+        return self.ensure(str(path), lambda: data)
+
+    def ensure(self, path: str, loader: Callable[[], bytes]) -> str:
+        """경로에 파일이 없을 때만 loader()로 내용을 가져와 기록"""
+        target = Path(path)
+        if target.exists():
+            self.skipped += 1
+            return str(target)
+
+        data = loader()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # 임시 파일에 쓴 뒤 교체 (동시 실행 시에도 깨진 파일이 보이지 않도록)
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, target)
+        self.writes += 1
+        return str(target)
+
+
+_default_store: Optional[AssetStore] = None
+
+
+def get_asset_store() -> AssetStore:
+    """프로세스 공용 에셋 저장소"""
+    global _default_store
+    if _default_store is None:
+        _default_store = AssetStore()
+    return _default_store
@@ -0,0 +1,173 @@
+"""
+열 단위(columnar) 블록 저장소
+
+- 블록 유형/목록 유형/레벨은 바이트 배열, 본문 텍스트는 문자열 버퍼 하나 + 끝 오프셋 배열
+- 인라인 서식은 array('I') 하나에 (start, end, format) 정수 세 개씩 이어 붙이고 블록별 끝 오프셋으로 구분
+- 자식/속성이 있는 블록(리스트, 표, 코드, 이미지)만 원래 ContentBlock을 따로 보관
+- 순회하면 BlockRow(테이블 + 인덱스) 뷰만 생성 - 매퍼/생성기에 ContentBlock 대신 그대로 전달 가능
+
+사용 예:
+    table = BlockTable.from_blocks(parser.iter_file_blocks('huge.md'))
+    pages = StyleMapper(template).iter_pages(doc_header, table)
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence
+
+from .markdown_parser import (
+    NO_ATTRIBUTES,
+    NO_CHILDREN,
+    NO_FORMATS,
+    ContentBlock,
+    InlineFormats,
+)
+
+
+class BlockTable:
+    """ContentBlock 목록의 열 단위 표현 (추가 전용)"""
+
+    def __init__(self):
+        # 유형 이름 <-> 코드 (테이블마다 등장 순서대로 부여)
+        self._type_names: List[str] = []
+        self._type_codes: Dict[str, int] = {}
+
+        self._types = array('B')
+        self._list_types = array('B')
+        self._levels = array('B')
+
+        # 본문 텍스트: 확정된 버퍼 + 아직 합치지 않은 조각
+        self._text = ''
+        self._pending: List[str] = []
+        self._text_ends = array('Q')
+        self._text_size = 0
+
+        self._formats = array('I')
+        self._format_ends = array('Q')
+
+        # 자식/속성이 있는 블록 원본 (인덱스 -> ContentBlock)
+        self._objects: Dict[int, ContentBlock] = {}
+
+    @classmethod
+    def from_blocks(cls, blocks: Iterable[ContentBlock]) -> 'BlockTable':
+        """블록 이터러블로 테이블 생성 (이터레이터를 넘기면 블록 객체를 쌓아 두지 않음)"""
+        table = cls()
+        for block in blocks:
+            table.append(block)
+        return table
+
+    def _code(self, name: str) -> int:
+        code = self._type_codes.get(name)
+        if code is None:
+            code = len(self._type_names)
+            self._type_names.append(name)
+            self._type_codes[name] = code
+        return code
+
+    def append(self, block: ContentBlock):
+        """블록 추가"""
+        index = len(self._types)
+        self._types.append(self._code(block.block_type))
+        self._list_types.append(self._code(block.list_type))
+        self._levels.append(block.level)
+
+        self._pending.append(block.content)
+        self._text_size += len(block.content)
+        self._text_ends.append(self._text_size)
+
+        if block.inline_formats:
+            self._formats.extend(block.inline_formats.raw)
+        self._format_ends.append(len(self._formats))
+
+        if block.children or block.attributes:
+            self._objects[index] = block
+
+    @property
+    def text(self) -> str:
+        """모든 블록 본문을 이어 붙인 버퍼"""
+        if self._pending:
+            self._text += ''.join(self._pending)
+            self._pending = []
+        return self._text
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def __getitem__(self, index: int) -> 'BlockRow':
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('BlockTable index out of range')
+        return BlockRow(self, index)
+
+    def __iter__(self) -> Iterator['BlockRow']:
+        for index in range(len(self._types)):
+            yield BlockRow(self, index)
+
+    def block(self, index: int) -> ContentBlock:
+        """index번째 블록을 ContentBlock으로 복원"""
+        row = self[index]
+        return ContentBlock(
+            block_type=row.block_type,
+            content=row.content,
+            level=row.level,
+            list_type=row.list_type,
+            children=row.children,
+            attributes=row.attributes,
+            inline_formats=row.inline_formats,
+        )
+
+    def nbytes(self) -> int:
+        """열 배열과 텍스트 버퍼의 대략적인 크기 (별도 보관 블록 제외)"""
+        arrays = (self._types, self._list_types, self._levels,
+                  self._text_ends, self._formats, self._format_ends)
+        return sum(a.itemsize * len(a) for a in arrays) + len(self.text.encode('utf-8'))
+
+
+class BlockRow:
+    """BlockTable의 블록 하나에 대한 읽기 전용 뷰 (ContentBlock과 같은 속성 제공)"""
+
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: BlockTable, index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def block_type(self) -> str:
+        return self._table._type_names[self._table._types[self._index]]
+
+    @property
+    def list_type(self) -> str:
+        return self._table._type_names[self._table._list_types[self._index]]
+
+    @property
+    def level(self) -> int:
+        return self._table._levels[self._index]
+
+    @property
+    def content(self) -> str:
+        table, index = self._table, self._index
+        start = table._text_ends[index - 1] if index else 0
+        return table.text[start:table._text_ends[index]]
+
+    @property
+    def inline_formats(self) -> InlineFormats:
+        table, index = self._table, self._index
+        start = table._format_ends[index - 1] if index else 0
+        end = table._format_ends[index]
+        if start == end:
+            return NO_FORMATS
+        return InlineFormats(table._formats[start:end])
+
+    @property
+    def children(self) -> Sequence[ContentBlock]:
+        block = self._table._objects.get(self._index)
+        return block.children if block is not None else NO_CHILDREN
+
+    @property
+    def attributes(self) -> Mapping[str, Any]:
+        block = self._table._objects.get(self._index)
+        return block.attributes if block is not None else NO_ATTRIBUTES
+
+    def __repr__(self) -> str:
+        return f'BlockRow({self._index}, {self.block_type!r}, {self.content[:30]!r})'
@@ -0,0 +1,273 @@
+"""
+분석 결과 캐시
+
+- 템플릿 바이트의 SHA-256 + 분석기 버전을 키로 사용
+- 프로세스 내 LRU 캐시 + 디스크(pickle) 캐시 2단계 구성
+- 템플릿 내용이 바뀌면 해시가 달라지므로 자동으로 무효화
+- 적중/미스 카운터 및 최대 개수 제한(LRU 제거) 제공
+- 템플릿 옆에 미리 만든 구조 파일(template_structure.json)이 있으면 분석 대신 로드
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+# 캐시 루트 디렉토리 (환경 변수로 변경 가능)
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get('MD_TO_DOCX_CACHE_DIR', Path.home() / '.cache' / 'md-to-docx')
+)
+
+
+def file_sha256(path: str) -> str:
+    """파일 내용의 SHA-256 해시"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """캐시 통계"""
+    hits: int = 0          # 메모리 적중
+    disk_hits: int = 0     # 디스크 적중 (메모리 미스 후)
+    misses: int = 0        # 완전 미스 (재계산)
+    evictions: int = 0     # LRU 제거 횟수
+
+    @property
+    def total_hits(self) -> int:
+        return self.hits + self.disk_hits
+
+
+class LRUCache:
+    """프로세스 내 LRU 캐시 (OrderedDict 기반)"""
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._data: 'OrderedDict[Any, Any]' = OrderedDict()
+        self.evictions = 0
+
+    def get(self, key: Any) -> Optional[Any]:
+        if key not in self._data:
+            return None
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def put(self, key: Any, value: Any):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._data.clear()
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """디스크 캐시 (pickle 파일, 수정 시각 기준 LRU 제거)"""
+
+    SUFFIX = '.pkl'
+
+    def __init__(self, directory: Path, max_entries: int = 256, max_bytes: Optional[int] = None):
+        """
+        Args:
+            max_entries: 최대 파일 수
+            max_bytes: 전체 파일 크기 상한 (None이면 개수만 제한)
+        """
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evictions = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # 손상된 캐시 파일은 무시하고 재생성
+            self._unlink(path)
+            return None
+
+        # 최근 사용 시각 갱신 (LRU)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key: str, value: Any):
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # 임시 파일에 쓴 뒤 교체 (동시 실행 시에도 깨진 파일이 보이지 않도록)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            # 읽기 전용 환경 등에서는 디스크 캐시 없이 동작
+            return
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for path in self.directory.glob(f'*{self.SUFFIX}'):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        count = len(entries)
+        total = sum(size for _, size, _ in entries)
+        if count <= self.max_entries and (self.max_bytes is None or total <= self.max_bytes):
+            return
+
+        # 오래 쓰지 않은 파일부터 개수/크기 상한 안으로 들어올 때까지 제거
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if count <= self.max_entries and (self.max_bytes is None or total <= self.max_bytes):
+                break
+            self._unlink(path)
+            self.evictions += 1
+            count -= 1
+            total -= size
+
+    def _unlink(self, path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def clear(self):
+        for path in self.directory.glob(f'*{self.SUFFIX}'):
+            self._unlink(path)
+
+
+class TemplateCache:
+    """
+    템플릿 분석 결과 캐시
+
+    TemplateStructure, ParsedTemplate을 템플릿 바이트 해시 기준으로 보관.
+    반환되는 객체는 여러 호출자가 공유하므로 읽기 전용으로 취급해야 함.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_memory_entries: int = 32,
+        max_disk_entries: int = 256,
+        use_disk: bool = True,
+    ):
+        """
+        Args:
+            cache_dir: 디스크 캐시 디렉토리 (기본: ~/.cache/md-to-docx/templates)
+            max_memory_entries: 메모리 캐시 최대 항목 수
+            max_disk_entries: 디스크 캐시 최대 항목 수
+            use_disk: False면 메모리 캐시만 사용
+        """
+        directory = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR / 'templates'
+        self.memory = LRUCache(max_memory_entries)
+        self.disk = DiskCache(directory, max_disk_entries) if use_disk else None
+        self.stats = CacheStats()
+
+    def get_or_compute(self, kind: Tuple, digest: str, compute: Callable[[], Any]) -> Any:
+        """
+        캐시 조회, 없으면 compute() 실행 후 저장
+
+        Args:
+            kind: 결과 종류 (예: ('structure',), ('parsed', 'default'))
+            digest: 템플릿 바이트의 SHA-256
+            compute: 미스 시 호출할 분석 함수
+        """
+        from .template_analyzer import ANALYZER_VERSION
+
+        key = (ANALYZER_VERSION, digest) + tuple(kind)
+        value = self.memory.get(key)
+        if value is not None:
+            self.stats.hits += 1
+            return value
+
+        disk_key = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+        if self.disk is not None:
+            value = self.disk.get(disk_key)
+            if value is not None:
+                self.stats.disk_hits += 1
+                self._remember(key, value)
+                return value
+
+        self.stats.misses += 1
+        value = compute()
+        self._remember(key, value)
+        if self.disk is not None:
+            self.disk.put(disk_key, value)
+        return value
+
+    def _remember(self, key: Tuple, value: Any):
+        self.memory.put(key, value)
+        self.stats.evictions = self.memory.evictions + (self.disk.evictions if self.disk else 0)
+
+    def get_structure(self, template_path: str, package=None, streaming: bool = False):
+        """
+        템플릿 구조(TemplateStructure) 조회 (미스 시 분석)
+
+        Args:
+            template_path: 템플릿 파일 경로
+            package: 공유 TemplatePackage (있으면 해시/분석에 재사용)
+            streaming: 미스 시 스트리밍 분석 사용 (결과는 같으므로 캐시 키는 공유)
+        """
+        from .template_analyzer import (
+            DocxTemplateAnalyzer, TemplateStructure, default_structure_path,
+        )
+
+        digest = package.sha256 if package is not None else file_sha256(template_path)
+
+        def compute():
+            # 템플릿과 함께 배포된 구조 파일이 내용 해시까지 일치하면 재분석 없이 사용
+            sidecar = default_structure_path(template_path)
+            if sidecar.exists():
+                try:
+                    return TemplateStructure.load(str(sidecar), template_path, expected_sha256=digest)
+                except (OSError, ValueError, KeyError, TypeError):
+                    pass
+            return DocxTemplateAnalyzer(template_path, package=package, streaming=streaming).analyze()
+
+        structure = self.get_or_compute(('structure',), digest, compute)
+        # 같은 내용의 템플릿이 다른 경로에 있을 수 있으므로 경로만 교체한 사본 반환
+        if structure.file_path != str(template_path):
+            structure = replace(structure, file_path=str(template_path))
+        return structure
+
+    def clear(self):
+        """메모리/디스크 캐시 모두 비우기"""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+_default_cache: Optional[TemplateCache] = None
+
+
+def get_template_cache() -> TemplateCache:
+    """프로세스 공용 템플릿 캐시"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TemplateCache()
+    return _default_cache
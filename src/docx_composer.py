@@ -8,7 +8,6 @@ DOCX 조립기 (Composer)
 """
 
 import re
-import shutil
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from copy import deepcopy
@@ -25,7 +24,10 @@ from .models import (
     Placeholder, PlaceholderType, PLACEHOLDER_PATTERNS
 )
 from .markdown_parser import ContentBlock, DocumentStructure
-from .template_analyzer import DocxTemplateAnalyzer, TemplateStructure
+from .template_analyzer import TemplateStructure
+from .cache import get_template_cache
+from .template_package import TemplatePackage
+from .template_pool import get_template_pool
 
 
 class DocxComposer:
@@ -39,18 +41,22 @@ class DocxComposer:
         self,
         template_path: str,
         output_dir: Optional[str] = None,
+        package: Optional[TemplatePackage] = None,
     ):
         """
         Args:
             template_path: 템플릿 DOCX 파일 경로
             output_dir: 출력 디렉토리 (기본: 템플릿과 같은 폴더)
+            package: 공유 템플릿 패키지 (없으면 새로 열기)
         """
         self.template_path = Path(template_path)
         self.output_dir = Path(output_dir) if output_dir else self.template_path.parent
+        self.package = package or TemplatePackage(str(self.template_path))
 
-        # 템플릿 분석
-        self._analyzer = DocxTemplateAnalyzer(str(self.template_path))
-        self.template_structure = self._analyzer.analyze()
+        # 템플릿 분석 (템플릿 해시 기준 캐시 사용)
+        self.template_structure = get_template_cache().get_structure(
+            str(self.template_path), package=self.package
+        )
 
         # 플레이스홀더 패턴
         self.placeholder_regex = re.compile(PLACEHOLDER_PATTERNS["default"])
@@ -78,9 +84,8 @@ class DocxComposer:
         else:
             output_path = self.output_dir / f"{self.template_path.stem}_output.docx"
 
-        # 템플릿 복사하여 열기
-        shutil.copy(self.template_path, output_path)
-        doc = Document(str(output_path))
+        # 템플릿 사본 (풀의 마스터에서 트리 복사)
+        doc = get_template_pool().checkout(self.package)
 
         # 문단별로 플레이스홀더 교체
         self._replace_placeholders_in_document(doc, mapping_plan, content)
@@ -200,12 +205,11 @@ class DocxComposer:
     def _get_block_text(self, block: ContentBlock) -> str:
         """ContentBlock에서 텍스트 추출"""
         if block.block_type == "list":
-            # 리스트는 자식 아이템들의 텍스트
-            items = []
-            for child in block.children:
-                prefix = "- " if block.list_type == "bullet" else f"{len(items)+1}. "
-                items.append(prefix + child.content)
-            return "\n".join(items)
+            # 리스트는 자식 아이템들의 텍스트 (중첩 리스트는 들여쓰기)
+            return "\n".join(self._list_lines(block))
+        elif block.block_type == "blockquote":
+            # 인용문은 중첩 인용문 텍스트까지 줄마다
+            return "\n".join(self._quote_lines(block))
         elif block.block_type == "table":
             # 테이블은 간단한 텍스트 표현
             rows = block.attributes.get("rows", [])
@@ -217,6 +221,31 @@ class DocxComposer:
         else:
             return block.content
 
+    def _list_lines(self, block: ContentBlock, numbered: bool = True) -> List[str]:
+        """리스트 항목 줄 (중첩 리스트는 레벨마다 두 칸 들여쓰기)"""
+        lines = []
+        for i, child in enumerate(block.children):
+            if child.content or not child.children:
+                if block.list_type == "bullet":
+                    prefix = "- "
+                else:
+                    prefix = f"{i + 1}. " if numbered else ""
+                lines.append("  " * child.level + prefix + child.content)
+            for nested in child.children:
+                if nested.block_type == "list":
+                    lines.extend(self._list_lines(nested, numbered))
+                elif nested.block_type == "blockquote":
+                    indent = "  " * (child.level + 1)
+                    lines.extend(indent + line for line in self._quote_lines(nested))
+        return lines
+
+    def _quote_lines(self, block: ContentBlock) -> List[str]:
+        """인용문 줄 (중첩 인용문 포함, 문서 순서)"""
+        lines = [block.content] if block.content else []
+        for child in block.children:
+            lines.extend(self._quote_lines(child))
+        return lines
+
     def _replace_text_in_paragraph(
         self,
         para: Paragraph,
@@ -248,10 +277,11 @@ class DocxComposer:
             style_name = f"Heading {block.level}" if block.level <= 6 else None
             new_para = doc.add_paragraph(block.content, style=style_name)
         elif block.block_type == "list":
-            # 리스트 아이템들 추가
-            for child in block.children:
-                prefix = "- " if block.list_type == "bullet" else ""
-                new_para = doc.add_paragraph(prefix + child.content)
+            # 리스트 아이템들 추가 (중첩 항목 포함)
+            for line in self._list_lines(block, numbered=False):
+                new_para = doc.add_paragraph(line)
+        elif block.block_type == "blockquote":
+            new_para = doc.add_paragraph("\n".join(self._quote_lines(block)))
         elif block.block_type == "code":
             new_para = doc.add_paragraph()
             run = new_para.add_run(block.content)
@@ -273,8 +303,7 @@ class DocxComposer:
         """
         output_path = self.output_dir / (output_filename or f"{self.template_path.stem}_output.docx")
 
-        shutil.copy(self.template_path, output_path)
-        doc = Document(str(output_path))
+        doc = get_template_pool().checkout(self.package)
 
         # 문서 분석 결과 활용
         page_structure = self.template_structure.page_structure
@@ -340,8 +369,11 @@ def compose_document(
     from .markdown_parser import MarkdownParser
     from .llm_content_mapper import LLMContentMapper, ContentMapperSync
 
+    # 템플릿 패키지는 한 번만 열어서 파서/조립기가 공유
+    package = TemplatePackage(template_path)
+
     # 1. 템플릿 파싱
-    template_parser = TemplateParser(template_path)
+    template_parser = TemplateParser(template_path, package=package)
     template = template_parser.parse()
 
     # 2. 마크다운 파싱
@@ -360,7 +392,7 @@ def compose_document(
         mapping_plan = mapper.create_mapping_plan(template, content)
 
     # 4. 문서 조립
-    composer = DocxComposer(template_path)
+    composer = DocxComposer(template_path, package=package)
     return composer.compose(
         mapping_plan=mapping_plan,
         content=content,
@@ -9,59 +9,131 @@ DOCX 생성기 (개선된 버전)
 """
 
 from docx import Document
-from docx.shared import Pt, Inches, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Pt, Inches
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK
+from docx.oxml import OxmlElement
 from docx.oxml.ns import qn, nsmap
+from docx.text.paragraph import Paragraph
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-
-from .template_analyzer import TemplateStructure, DocxTemplateAnalyzer
-from .markdown_parser import DocumentStructure
+from typing import Iterable, Optional, Dict, Any
+
+from .template_analyzer import TemplateStructure
+from .cache import get_template_cache
+from .template_package import TemplatePackage
+from .template_pool import get_template_pool
+from .inline_renderer import runs_from_spans
+from .ooxml_writer import OoxmlBodyWriter, RunPropertiesCache, add_table, insert_block
+from .style_table import StyleTable
+from .markdown_parser import DocumentStructure, InlineFormats
 from .style_mapper import StyleMapper, MappedStyle, PageContent, ContentBlock
 
+
 class DocxGenerator:
     """DOCX 문서 생성기"""
 
-    def __init__(self, template_path: Optional[str] = None):
+    # 본문 기록 방식: 'ooxml' (요소 직접 생성, 빠름) / 'python-docx' (프록시 API) - 결과 XML은 같음
+    WRITERS = ('ooxml', 'python-docx')
+
+    def __init__(self, template_path: Optional[str] = None, writer: str = 'ooxml'):
+        if writer not in self.WRITERS:
+            raise ValueError(f"writer는 {self.WRITERS} 중 하나여야 합니다: {writer!r}")
         self.template_path = template_path
+        self.writer = writer
         self.template_structure: Optional[TemplateStructure] = None
+        self.package: Optional[TemplatePackage] = None
         self.md_base_path: Optional[Path] = None
         
         # 보존된 섹션 브레이크 문단들 (삽입 위치 지표)
         self.preserved_section_breaks = []
 
+        # 페이지 유형 -> 삽입 기준 요소 (그 앞에 삽입, 없으면 본문 끝) - generate()마다 계산
+        self.anchors: Dict[str, Any] = {}
+        # 현재 삽입 기준 요소 (_insert_before() 안에서만 설정, None이면 본문 끝)
+        self._anchor = None
+
+        # 현재 문서의 스타일 해결 표 / OOXML 기록기 (writer='ooxml'일 때) - generate()마다 생성
+        self._styles: Optional[StyleTable] = None
+        self._ooxml: Optional[OoxmlBodyWriter] = None
+
+        # (스타일 서식 값, 인라인 서식)별 w:rPr 템플릿 - 생성기 수명 동안 문서 사이에 공유
+        self._run_props = RunPropertiesCache()
+
         if template_path and Path(template_path).exists():
-            analyzer = DocxTemplateAnalyzer(template_path)
-            self.template_structure = analyzer.analyze()
-
-    def generate(self, pages: List[PageContent], output_path: str) -> str:
-        """페이지 콘텐츠로부터 DOCX 생성"""
-        if self.template_path and Path(self.template_path).exists():
-            doc = Document(self.template_path)
-            self._clear_body_content_smart(doc)
+            self.package = TemplatePackage(template_path)
+            self.template_structure = get_template_cache().get_structure(
+                template_path, package=self.package
+            )
+
+    def generate(self, pages: Iterable[PageContent], output_path: str) -> str:
+        """페이지 콘텐츠로부터 DOCX 생성 (pages는 이터레이터여도 됨 - 한 페이지씩 소비)"""
+        if self.package is not None:
+            doc = self._new_document_from_skeleton()
         else:
-            doc = Document()
+            doc = get_template_pool().checkout_default()
             self.preserved_section_breaks = []
+        self._styles = StyleTable.from_document(doc)
+        self._ooxml = OoxmlBodyWriter(doc, self._styles, self._run_props) if self.writer == 'ooxml' else None
+        self.anchors = self._find_anchors()
 
-        # 각 페이지 처리
+        # 각 페이지 처리 (기준 요소가 있는 페이지 유형은 그 앞에 삽입)
         for i, page in enumerate(pages):
-            # 삽입 위치 결정 (Target Paragraph)
-            target = None
-            if page.page_type == 'cover' and self.preserved_section_breaks:
-                # 표지는 첫 번째 섹션 브레이크(표지 구역 끝) 앞에 삽입
-                target = self.preserved_section_breaks[0]
-            
+            anchor = self.anchors.get(page.page_type)
             # 페이지 생성
             if page.page_type == 'cover':
-                self._generate_cover_page(doc, page, target_para=target)
-            elif page.page_type == 'section':
-                self._generate_section_page(doc, page)
-            else:
-                self._generate_body_content(doc, page)
+                self._generate_cover_page(doc, page, target_para=anchor)
+                continue
+            with self._insert_before(anchor):
+                if page.page_type == 'section':
+                    self._generate_section_page(doc, page)
+                else:
+                    self._generate_body_content(doc, page)
 
         doc.save(output_path)
         return output_path
 
+    def _find_anchors(self) -> Dict[str, Any]:
+        """
+        페이지 유형별 삽입 기준 요소 (문서당 한 번 계산)
+
+        표지는 첫 번째 섹션 브레이크(표지 구역 끝) 앞에 삽입. 목차 등 다른 삽입 위치도 여기에 추가하면
+        generate()가 해당 유형 페이지의 모든 블록(문단/표/이미지/코드/수평선/페이지 나누기)을 그 앞에 삽입.
+        """
+        anchors = {}
+        if self.preserved_section_breaks:
+            anchors['cover'] = self.preserved_section_breaks[0]
+        return anchors
+
+    @contextmanager
+    def _insert_before(self, anchor):
+        """with 블록 안에서 추가하는 모든 블록을 anchor 앞에 순서대로 삽입 (None이면 본문 끝)"""
+        previous, self._anchor = self._anchor, anchor
+        try:
+            if self._ooxml is not None:
+                with self._ooxml.insert_before(anchor):
+                    yield
+            else:
+                yield
+        finally:
+            self._anchor = previous
+
+    def _new_paragraph(self, doc: Document) -> Paragraph:
+        """현재 삽입 위치에 빈 문단 추가 (기준 요소가 없으면 doc.add_paragraph()와 같은 위치)"""
+        p = insert_block(doc.element.body, OxmlElement('w:p'), self._anchor)
+        return Paragraph(p, doc._body)
+
+    def _new_document_from_skeleton(self) -> Document:
+        """본문을 비운 템플릿 스켈레톤에서 새 문서 생성 (스켈레톤은 템플릿당 한 번만 계산)"""
+        doc = get_template_pool().checkout(
+            self.package, 'skeleton', self._clear_body_content_smart
+        )
+        # 스켈레톤에 남은 문단 중 섹션 브레이크를 가진 것이 보존된 브레이크
+        self.preserved_section_breaks = [
+            child for child in doc.element.body
+            if child.tag == qn('w:p') and child.find(f'.//{qn("w:sectPr")}') is not None
+        ]
+        return doc
+
     def _clear_body_content_smart(self, doc: Document):
         """본문 내용을 삭제하되, 섹션 구조와 배경 이미지는 보존"""
         body = doc.element.body
@@ -96,18 +168,36 @@ class DocxGenerator:
         for child in to_delete:
             body.remove(child)
 
-    def generate_from_file(self, md_file: str, output_path: str) -> str:
-        """마크다운 파일에서 DOCX 생성"""
+    # 스트리밍 변환: 타이틀/서브타이틀을 찾는 앞보기 블록 수, body 페이지 분할 단위
+    STREAM_LOOKAHEAD_BLOCKS = 64
+    STREAM_BODY_BLOCKS = 256
+
+    def generate_from_file(self, md_file: str, output_path: str, streaming: bool = False) -> str:
+        """
+        마크다운 파일에서 DOCX 생성
+
+        Args:
+            streaming: 마크다운을 나눠 읽으며 파싱/매핑/생성을 이어서 진행
+                (원문 전체와 토큰/블록 목록을 메모리에 두지 않음, 아주 큰 입력용).
+                타이틀/서브타이틀은 앞부분 STREAM_LOOKAHEAD_BLOCKS개 블록에서만 찾음.
+        """
         from .markdown_parser import MarkdownParser
         
         md_path = Path(md_file)
         self.md_base_path = md_path.parent
 
-        with open(md_file, 'r', encoding='utf-8') as f:
-            md_content = f.read()
+        if streaming:
+            doc_structure, blocks = MarkdownParser().stream_file(
+                md_file, lookahead=self.STREAM_LOOKAHEAD_BLOCKS
+            )
+            mapper = StyleMapper(self.template_structure)
+            pages = mapper.iter_pages(
+                doc_structure, blocks, max_body_blocks=self.STREAM_BODY_BLOCKS
+            )
+            return self.generate(pages, output_path)
 
-        parser = MarkdownParser()
-        doc_structure = parser.parse(md_content)
+        # 같은 마크다운은 파싱 캐시에서 로드 (set_parse_cache_enabled(False)면 매번 파싱)
+        doc_structure = MarkdownParser().parse_file(md_file)
 
         mapper = StyleMapper(self.template_structure)
         pages = mapper.map_document(doc_structure)
@@ -115,18 +205,19 @@ class DocxGenerator:
         return self.generate(pages, output_path)
 
     def _generate_cover_page(self, doc: Document, page: PageContent, target_para=None):
-        """표지 페이지 생성"""
-        for mapped_block in page.blocks:
-            block = mapped_block.original
-            style = mapped_block.style
+        """표지 페이지 생성 (target_para: 이 요소 앞에 삽입, 없으면 본문 끝)"""
+        with self._insert_before(target_para):
+            for mapped_block in page.blocks:
+                block = mapped_block.original
+                style = mapped_block.style
 
-            if block.block_type == 'heading':
-                para = self._add_paragraph_with_style(doc, block.content, style, target_para=target_para)
-                if style.alignment is None:
-                    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                if block.block_type == 'heading':
+                    para = self._add_paragraph_with_style(doc, block.content, style)
+                    if style.alignment is None:
+                        para.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
         # 섹션 브레이크를 재사용했다면 별도의 페이지 나누기가 필요 없음
-        if not target_para:
+        if target_para is None:
             self._add_page_break(doc)
 
     def _generate_section_page(self, doc: Document, page: PageContent):
@@ -152,7 +243,7 @@ class DocxGenerator:
             elif block.block_type == 'list_item':
                 self._add_paragraph_with_style(doc, block.content, style, inline_formats=block.inline_formats)
             elif block.block_type == 'blockquote':
-                self._add_paragraph_with_style(doc, block.content, style)
+                self._add_blockquote(doc, block, style)
             elif block.block_type == 'code':
                 self._add_code_block(doc, block)
             elif block.block_type == 'table':
@@ -163,43 +254,22 @@ class DocxGenerator:
                 self._add_horizontal_rule(doc)
 
     def _add_paragraph_with_style(self, doc: Document, text: str, style: MappedStyle, 
-                                  inline_formats: List[Dict] = None, target_para=None) -> Any:
-        """스타일이 적용된 문단 추가 (삽입 위치 지정 가능)"""
-        
-        # 1. 문단 생성 (위치에 따라)
-        if target_para:
-            # target_para는 OXML 요소이므로 이를 감싸는 Paragraph 객체를 만들어야 함
-            # 하지만 python-docx API로는 insert_paragraph_before가 텍스트/스타일만 받음
-            # 여기서는 약간의 트릭 사용:
-            # target_para(XML)를 가진 Paragraph 객체를 찾거나 새로 생성하는 대신
-            # doc.add_paragraph() 후 이동시키는 건 복잡함.
-            # 가장 쉬운 방법: target_para(XML 요소) 앞에 insert
-            
-            # python-docx의 프록시 객체 생성 없이 low-level insert
-            # 하지만 스타일 적용 편의를 위해 insert_paragraph_before API 사용 시도
-            # target_para가 doc.paragraphs 리스트에 있는 객체여야 함
-            
-            # OXML Element를 Paragraph 객체로 래핑하여 찾기 (비효율적이지만 확실)
-            found_p = None
-            for p in doc.paragraphs:
-                if p._element == target_para:
-                    found_p = p
-                    break
-            
-            if found_p:
-                para = found_p.insert_paragraph_before(style=style.style_id if style.style_id else None)
-            else:
-                # 못 찾으면 그냥 append
-                para = doc.add_paragraph(style=style.style_id if style.style_id else None)
-        else:
-            # 기본 append
-            try:
-                para = doc.add_paragraph(style=style.style_name)
-            except:
-                try:
-                    para = doc.add_paragraph(style=style.style_id)
-                except:
-                    para = doc.add_paragraph()
+                                  inline_formats: Optional[InlineFormats] = None, target_para=None) -> Any:
+        """스타일이 적용된 문단 추가 (target_para: 이 요소 앞에 삽입, 없으면 현재 삽입 위치)"""
+        if target_para is not None:
+            with self._insert_before(target_para):
+                return self._add_paragraph_with_style(doc, text, style, inline_formats)
+
+        if self._ooxml is not None:
+            return Paragraph(self._ooxml.add_paragraph(text, style, inline_formats), doc._body)
+
+        # 1. 문단 생성 - 기준 요소 앞에 바로 삽입 (문단 목록 탐색 없음)
+        para = self._new_paragraph(doc)
+
+        # 스타일은 문서별 해결 표에서 한 번만 해결한 ID를 w:pStyle로 바로 설정
+        style_id = self._styles.resolve(style)
+        if style_id is not None:
+            para._p.style = style_id
 
         # 2. 내용 채우기 (기존 코드와 동일)
         if inline_formats:
@@ -223,55 +293,50 @@ class DocxGenerator:
 
     # --- 이하 헬퍼 메서드들은 기존 코드와 동일 (생략 없이 사용하세요) ---
     def _apply_run_style(self, run, style: MappedStyle):
-        if not style.apply_direct:
-            if style.color_rgb: self._set_run_color(run, style.color_rgb)
-            return
-        if style.font_name:
-            run.font.name = style.font_name
-            run._element.rPr.rFonts.set(qn('w:eastAsia'), style.font_name)
-        if style.font_size_pt: run.font.size = Pt(style.font_size_pt)
-        if style.bold: run.bold = True
-        if style.italic: run.italic = True
-        if style.color_rgb: self._set_run_color(run, style.color_rgb)
-
-    def _set_run_color(self, run, color_rgb: str):
-        if color_rgb and color_rgb != 'auto':
-            try:
-                color_rgb = color_rgb.lstrip('#')
-                if len(color_rgb) == 6:
-                    run.font.color.rgb = RGBColor(int(color_rgb[:2], 16), int(color_rgb[2:4], 16), int(color_rgb[4:], 16))
-            except: pass
+        # 스타일 서식은 미리 만든 w:rPr 템플릿 복제 한 번으로 적용
+        self._run_props.apply(run._r, self._run_props.style_key(style))
 
-    def _apply_inline_formats(self, para, text: str, formats: List[Dict], base_style: MappedStyle):
+    def _apply_inline_formats(self, para, text: str, formats: InlineFormats, base_style: MappedStyle):
         if not formats:
             run = para.add_run(text)
             self._apply_run_style(run, base_style)
             return
-        formats = sorted(formats, key=lambda f: f['start'])
-        last_end = 0
-        for fmt in formats:
-            start, end, format_type = fmt['start'], fmt['end'], fmt['format']
-            if start > last_end:
-                run = para.add_run(text[last_end:start])
-                self._apply_run_style(run, base_style)
-            run = para.add_run(text[start:end])
-            self._apply_run_style(run, base_style)
-            if format_type == 'bold': run.bold = True
-            elif format_type == 'italic': run.italic = True
-            elif format_type == 'strike': run.font.strike = True
-            elif format_type == 'code': 
-                run.font.name = 'Consolas'; run.font.size = Pt(10)
-            last_end = end
-        if last_end < len(text):
-            run = para.add_run(text[last_end:])
-            self._apply_run_style(run, base_style)
+        # 서식 경계마다 run 하나 (중첩 서식도 텍스트 중복 없음), 서식 조합마다 템플릿 하나
+        templates = self._run_props
+        key = templates.style_key(base_style)
+        for item in runs_from_spans(text, formats):
+            run = para.add_run(item.text)
+            templates.apply(run._r, key, item.bold, item.italic, item.strike, item.code)
+
+    # 중첩 리스트/인용문 한 단계당 들여쓰기
+    NESTED_INDENT_INCHES = 0.25
 
     def _add_list(self, doc, block, style):
         for item in block.children:
-            self._add_paragraph_with_style(doc, item.content, style, inline_formats=item.inline_formats)
+            # 중첩 리스트만 있는 빈 항목은 문단 없이 자식만 추가
+            if item.content or not item.children:
+                para = self._add_paragraph_with_style(doc, item.content, style, inline_formats=item.inline_formats)
+                if item.level:
+                    para.paragraph_format.left_indent = Inches(self.NESTED_INDENT_INCHES * item.level)
+            for child in item.children:
+                if child.block_type == 'list':
+                    self._add_list(doc, child, style)
+                elif child.block_type == 'blockquote':
+                    self._add_blockquote(doc, child, style)
+
+    def _add_blockquote(self, doc, block, style):
+        if block.content or not block.children:
+            para = self._add_paragraph_with_style(doc, block.content, style)
+            if block.level:
+                para.paragraph_format.left_indent = Inches(self.NESTED_INDENT_INCHES * block.level)
+        for child in block.children:
+            self._add_blockquote(doc, child, style)
 
     def _add_code_block(self, doc, block):
-        para = doc.add_paragraph()
+        if self._ooxml is not None:
+            self._ooxml.add_code_block(block.content)
+            return
+        para = self._new_paragraph(doc)
         run = para.add_run(block.content)
         run.font.name = 'Consolas'; run.font.size = Pt(9)
         para.paragraph_format.left_indent = Inches(0.3)
@@ -279,23 +344,14 @@ class DocxGenerator:
     def _add_table(self, doc, block):
         rows_data = block.attributes.get('rows', [])
         if not rows_data: return
-        num_cols = max(len(r['cells']) for r in rows_data)
-        table = doc.add_table(rows=len(rows_data), cols=num_cols)
-        try: table.style = 'Table Grid'
-        except: pass
-        for r_idx, r_data in enumerate(rows_data):
-            for c_idx, text in enumerate(r_data['cells']):
-                if c_idx < num_cols:
-                    cell = table.rows[r_idx].cells[c_idx]
-                    cell.text = text
-                    if r_data.get('is_header'):
-                        for p in cell.paragraphs:
-                            for r in p.runs: r.bold = True
+        # w:tbl 전체를 행 데이터에서 한 번에 구성 (셀 프록시 접근 없음)
+        add_table(doc, [(r['cells'], r.get('is_header', False)) for r in rows_data], self._styles,
+                  anchor=self._anchor)
 
     def _add_image_placeholder(self, doc, block):
         from urllib.parse import unquote
         src = unquote(block.attributes.get('src', ''))
-        para = doc.add_paragraph()
+        para = self._new_paragraph(doc)
         image_path = None
         if src:
             p = Path(src)
@@ -311,7 +367,11 @@ class DocxGenerator:
         para.add_run(f"![Image]({src})").italic = True
 
     def _add_horizontal_rule(self, doc):
-        p = doc.add_paragraph(); p.add_run('─' * 50); p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        if self._ooxml is not None:
+            self._ooxml.add_horizontal_rule()
+            return
+        p = self._new_paragraph(doc); p.add_run('─' * 50); p.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     def _add_page_break(self, doc):
-        doc.add_page_break()
\ No newline at end of file
+        # doc.add_page_break()와 같은 문단을 현재 삽입 위치에 추가
+        self._new_paragraph(doc).add_run().add_break(WD_BREAK.PAGE)
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+증분 마크다운 파서
+
+- 최상위 헤딩('# ')마다 문서를 구간으로 나눔 (코드 펜스/HTML 블록 내부 등은 제외)
+- 구간 텍스트의 SHA-256을 키로 ContentBlock 목록을 LRU 캐시
+- 바뀐 구간만 다시 토큰화하고 나머지는 캐시된 블록을 재사용
+- 타이틀/섹션 구성은 전체 블록 목록으로 매번 다시 계산 (parse()와 같은 결과)
+
+사용 예:
+    parser = IncrementalMarkdownParser()
+    doc = parser.parse_file('report.md')   # 첫 파싱: 모든 구간 토큰화
+    ...                                    # 한 섹션만 수정
+    doc = parser.parse_file('report.md')   # 수정된 구간만 토큰화
+    print(parser.stats.hits, parser.stats.misses)
+"""
+
+import hashlib
+import re
+from typing import List
+
+from .cache import CacheStats, LRUCache
+from .markdown_parser import (
+    BlockBoundaryTracker,
+    ContentBlock,
+    DocumentIndex,
+    DocumentStructure,
+    MarkdownParser,
+)
+
+# 최상위 헤딩 줄 (들여쓰기 없는 '# ')
+_TOP_HEADING_RE = re.compile(r'#(?:[ \t]|$)')
+
+# 참조 링크 정의 ([id]: url) - 구간을 넘어 해석되므로 있으면 전체 파싱
+_REFERENCE_DEF_RE = re.compile(r'^ {0,3}\[[^\]\n]+\]:', re.MULTILINE)
+
+
+def split_top_level_sections(content: str) -> List[str]:
+    """
+    최상위 헤딩 앞에서 문서를 나눔 (각 구간을 따로 파싱해도 결과가 같은 위치만)
+
+    빈 줄 뒤에 오고, 코드 펜스나 빈 줄을 넘는 HTML 블록 내부가 아닌 '# ' 줄에서만 나눔.
+    """
+    tracker = BlockBoundaryTracker()
+    sections = []
+    current: List[str] = []
+
+    for line in content.split('\n'):
+        if current and _TOP_HEADING_RE.match(line) and tracker.can_split_before(line):
+            sections.append('\n'.join(current))
+            current = []
+        current.append(line)
+        tracker.feed(line)
+
+    sections.append('\n'.join(current))
+    return sections
+
+
+class IncrementalMarkdownParser(MarkdownParser):
+    """
+    구간 캐시를 쓰는 마크다운 파서 (같은 문서를 반복 변환할 때용)
+
+    stats는 구간 단위 통계 (hits: 재사용한 구간, misses: 다시 토큰화한 구간).
+    재사용한 구간의 블록 객체는 이전 결과와 공유되므로 읽기 전용으로 취급해야 함.
+    """
+
+    def __init__(self, max_chunks: int = 4096):
+        """
+        Args:
+            max_chunks: 보관할 구간 최대 개수 (초과 시 LRU 제거)
+        """
+        super().__init__()
+        self._chunks = LRUCache(max_chunks)
+        self.stats = CacheStats()
+
+    def parse(self, md_content: str) -> DocumentStructure:
+        """마크다운 파싱 (바뀐 구간만 토큰화)"""
+        # 전처리는 전체에 한 번 - 구간 경계도 parse()가 토큰화하는 텍스트 기준으로 판단
+        cleaned = self._preprocess(md_content)
+        if _REFERENCE_DEF_RE.search(cleaned):
+            return self._parse_cleaned(cleaned)
+
+        doc = DocumentStructure()
+        doc._index = index = DocumentIndex()
+        for chunk in split_top_level_sections(cleaned):
+            blocks = self._chunk_blocks(chunk)
+            doc.raw_blocks.extend(blocks)
+            index.extend(blocks)
+
+        # 타이틀/서브타이틀 추출
+        self._extract_title_subtitle(doc)
+
+        # 섹션 구조화
+        doc.sections = self._organize_sections(doc.raw_blocks, index)
+
+        return doc
+
+    def _chunk_blocks(self, chunk: str) -> List[ContentBlock]:
+        """전처리된 구간 하나의 블록 (캐시 조회, 없으면 토큰화)"""
+        key = hashlib.sha256(chunk.encode('utf-8')).hexdigest()
+        blocks = self._chunks.get(key)
+        if blocks is not None:
+            self.stats.hits += 1
+            return blocks
+
+        self.stats.misses += 1
+        blocks = self._tokens_to_blocks(self.md.parse(chunk))
+        self._chunks.put(key, blocks)
+        self.stats.evictions = self._chunks.evictions
+        return blocks
+
+    def clear(self):
+        self._chunks.clear()
@@ -0,0 +1,180 @@
+"""
+인라인 서식 렌더러
+
+- markdown-it 인라인 자식 토큰 또는 (텍스트, InlineFormats)를 서식이 같은 구간끼리 합친 run 목록으로 변환
+- 토큰은 한 번만 순회 (서식별 중첩 깊이 카운터), 구간은 경계 이벤트를 한 번 훑어 처리
+- 중첩/겹친 서식(굵게 안의 기울임 등)도 텍스트를 중복하지 않고 구간마다 run 하나
+- MarkdownToDocxConverter와 DocxGenerator가 같은 규칙으로 python-docx run을 추가 (add_runs)
+
+사용 예:
+    runs = runs_from_tokens(inline_token.children)
+    add_runs(paragraph, runs)
+"""
+
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+from docx.shared import Pt
+from markdown_it.token import Token
+
+from .markdown_parser import InlineFormat, InlineFormats
+
+# 인라인 코드 글꼴
+CODE_FONT_NAME = 'Consolas'
+CODE_FONT_SIZE_PT = 10
+
+
+class InlineRun(NamedTuple):
+    """서식이 같은 연속 텍스트 구간"""
+    text: str
+    bold: bool = False
+    italic: bool = False
+    strike: bool = False
+    code: bool = False
+    href: str = ''  # 링크 대상 (링크 안의 텍스트일 때)
+
+
+# 여는/닫는 토큰 -> 서식 카운터 위치 (bold, italic, strike)
+_OPEN = {'strong_open': 0, 'em_open': 1, 's_open': 2}
+_CLOSE = {'strong_close': 0, 'em_close': 1, 's_close': 2}
+
+# 서식 종류 -> 카운터 위치 (bold, italic, strike, code)
+_FORMAT_SLOT = {
+    InlineFormat.BOLD: 0,
+    InlineFormat.ITALIC: 1,
+    InlineFormat.STRIKE: 2,
+    InlineFormat.CODE: 3,
+}
+
+
+class _RunBuilder:
+    """서식이 같은 텍스트 조각을 모아 run으로 합침 (조각은 끝날 때 한 번만 join)"""
+
+    __slots__ = ('runs', 'pieces', 'key')
+
+    def __init__(self):
+        self.runs: List[InlineRun] = []
+        self.pieces: List[str] = []
+        self.key: Optional[Tuple] = None
+
+    def add(self, text: str, key: Tuple):
+        """key = (bold, italic, strike, code, href)"""
+        if not text:
+            return
+        if key != self.key:
+            self.flush()
+            self.key = key
+        self.pieces.append(text)
+
+    def flush(self):
+        if self.pieces:
+            self.runs.append(InlineRun(''.join(self.pieces), *self.key))
+            self.pieces = []
+
+    def result(self) -> List[InlineRun]:
+        self.flush()
+        return self.runs
+
+
+def runs_from_tokens(children: Optional[Iterable[Token]]) -> List[InlineRun]:
+    """
+    인라인 자식 토큰 -> run 목록 (토큰 수에 비례하는 한 번의 순회)
+
+    softbreak는 공백, hardbreak는 줄바꿈 문자로 현재 서식의 run에 포함.
+    이미지/HTML 인라인 토큰은 건너뜀.
+    """
+    if not children:
+        return []
+
+    builder = _RunBuilder()
+    depth = [0, 0, 0]        # bold, italic, strike 중첩 깊이
+    links: List[str] = []    # 열린 링크 href 스택
+    text_key = code_key = (False, False, False, False, '')  # 서식이 바뀔 때만 다시 계산
+
+    for child in children:
+        child_type = child.type
+
+        if child_type == 'text':
+            builder.add(child.content, text_key)
+
+        elif child_type == 'code_inline':
+            builder.add(child.content, code_key)
+
+        elif child_type == 'softbreak':
+            builder.add(' ', text_key)
+
+        elif child_type == 'hardbreak':
+            builder.add('\n', text_key)
+
+        else:
+            if child_type in _OPEN:
+                depth[_OPEN[child_type]] += 1
+            elif child_type in _CLOSE:
+                slot = _CLOSE[child_type]
+                if depth[slot]:
+                    depth[slot] -= 1
+            elif child_type == 'link_open':
+                links.append(child.attrGet('href') or '')
+            elif child_type == 'link_close':
+                if links:
+                    links.pop()
+            else:
+                continue  # 이미지/HTML 등
+
+            href = links[-1] if links else ''
+            text_key = (depth[0] > 0, depth[1] > 0, depth[2] > 0, False, href)
+            code_key = text_key[:3] + (True, href)
+
+    return builder.result()
+
+
+def runs_from_spans(text: str, formats: Optional[InlineFormats]) -> List[InlineRun]:
+    """
+    텍스트 + 서식 구간 -> run 목록
+
+    구간 경계(시작/끝)에서만 run을 나누므로 중첩/겹친 구간도 텍스트가 한 번만 나옴.
+    """
+    if not formats:
+        return [InlineRun(text)] if text else []
+
+    # (위치, 증감, 카운터 위치) 경계 이벤트 - 같은 위치에서는 끝(-1)을 먼저 처리
+    events = []
+    for start, end, fmt in formats:
+        if start < end:
+            slot = _FORMAT_SLOT[fmt]
+            events.append((start, 1, slot))
+            events.append((end, -1, slot))
+    events.sort()
+
+    builder = _RunBuilder()
+    depth = [0, 0, 0, 0]  # bold, italic, strike, code
+    pos = 0
+    for position, delta, slot in events:
+        if position > pos:
+            builder.add(text[pos:position], (depth[0] > 0, depth[1] > 0, depth[2] > 0, depth[3] > 0, ''))
+            pos = position
+        depth[slot] += delta
+    builder.add(text[pos:], (False, False, False, False, ''))
+    return builder.result()
+
+
+def add_runs(paragraph, runs: Iterable[InlineRun],
+             base_style: Optional[Callable[[object], None]] = None):
+    """
+    python-docx 문단에 run 추가
+
+    Args:
+        base_style: 각 run에 먼저 적용할 기본 서식 함수 (run -> None)
+    """
+    for item in runs:
+        run = paragraph.add_run(item.text)
+        if base_style is not None:
+            base_style(run)
+        if item.bold:
+            run.bold = True
+        if item.italic:
+            run.italic = True
+        if item.strike:
+            run.font.strike = True
+        if item.code:
+            run.font.name = CODE_FONT_NAME
+            run.font.size = Pt(CODE_FONT_SIZE_PT)
@@ -7,14 +7,14 @@ LLM 기반 콘텐츠 매핑
 """
 
 import re
-from typing import List, Optional, Dict, Any
+from typing import Optional, Dict, Any
 from dataclasses import asdict
 
 from .models import (
     ContentMappingPlan, ContentMapping, ParsedTemplate,
     PlaceholderType, Placeholder
 )
-from .markdown_parser import ContentBlock, DocumentStructure
+from .markdown_parser import DocumentStructure
 
 import sys
 sys.path.insert(0, str(__file__).rsplit('/src/', 1)[0])
@@ -176,13 +176,12 @@ class LLMContentMapper:
         warnings = []
 
         # 블록 인덱스 준비
-        blocks = content.raw_blocks
-        total_blocks = len(blocks)
+        total_blocks = len(content.raw_blocks)
 
         # 플레이스홀더별 매핑
         for placeholder in template.placeholders:
             mapping = self._auto_map_placeholder(
-                placeholder, blocks, used_indices
+                placeholder, content, used_indices
             )
             if mapping:
                 mappings.append(mapping)
@@ -211,67 +210,49 @@ class LLMContentMapper:
     def _auto_map_placeholder(
         self,
         placeholder: Placeholder,
-        blocks: List[ContentBlock],
+        content: DocumentStructure,
         used_indices: set,
     ) -> Optional[ContentMapping]:
-        """단일 플레이스홀더 자동 매핑"""
+        """단일 플레이스홀더 자동 매핑 (파싱 시 만든 블록 색인 조회)"""
         ptype = placeholder.placeholder_type
+        index = content.index
         indices = []
 
+        def first_unused(positions) -> Optional[int]:
+            return next((i for i in positions if i not in used_indices), None)
+
         if ptype == PlaceholderType.TITLE:
             # 첫 번째 H1 헤딩 찾기
-            for i, block in enumerate(blocks):
-                if i in used_indices:
-                    continue
-                if block.block_type == "heading" and block.level == 1:
-                    indices.append(i)
-                    break
+            title = first_unused(index.heading_positions(1))
+            if title is not None:
+                indices.append(title)
 
         elif ptype == PlaceholderType.SUBTITLE:
-            # 첫 번째 H2 또는 타이틀 다음 문단 찾기
-            for i, block in enumerate(blocks):
-                if i in used_indices:
-                    continue
-                if block.block_type == "heading" and block.level == 2:
-                    indices.append(i)
-                    break
-                # 첫 번째 일반 문단도 고려
-                if block.block_type == "paragraph" and not indices:
-                    indices.append(i)
-                    break
+            # 첫 번째 H2 또는 첫 번째 일반 문단 중 앞선 것
+            candidates = [
+                i for i in (
+                    first_unused(index.heading_positions(2)),
+                    first_unused(index.positions("paragraph")),
+                ) if i is not None
+            ]
+            if candidates:
+                indices.append(min(candidates))
 
         elif ptype == PlaceholderType.BODY:
-            # 타이틀/서브타이틀 이후 모든 콘텐츠
-            skip_first_heading = True
-            for i, block in enumerate(blocks):
-                if i in used_indices:
-                    continue
-                # 첫 H1, H2는 건너뛰기 (타이틀/서브타이틀용)
-                if skip_first_heading and block.block_type == "heading" and block.level <= 2:
-                    skip_first_heading = False
-                    continue
-                indices.append(i)
+            # 타이틀/서브타이틀 이후 모든 콘텐츠 (첫 H1/H2는 타이틀/서브타이틀용으로 건너뛰기)
+            skip = first_unused(index.section_starts)
+            indices = [
+                i for i in range(index.block_count)
+                if i not in used_indices and i != skip
+            ]
 
         elif ptype == PlaceholderType.SECTION:
-            # 특정 섹션 번호에 해당하는 콘텐츠
+            # 특정 섹션 번호에 해당하는 콘텐츠 (H2로 섹션 구분)
             section_num = placeholder.section_number or 1
-            current_section = 0
-
-            in_section = False
-            for i, block in enumerate(blocks):
-                if i in used_indices:
-                    continue
-
-                # H2로 섹션 구분
-                if block.block_type == "heading" and block.level == 2:
-                    current_section += 1
-                    in_section = (current_section == section_num)
-                    if in_section:
-                        indices.append(i)
-                    elif current_section > section_num:
-                        break
-                elif in_section:
-                    indices.append(i)
+            ranges = index.section_ranges(2, exclude=used_indices)
+            if 0 < section_num <= len(ranges):
+                start, end = ranges[section_num - 1]
+                indices = [i for i in range(start, end) if i not in used_indices]
 
         elif ptype == PlaceholderType.TOC:
             # 목차는 자동 생성으로 처리 (콘텐츠 매핑 없음)
@@ -5,477 +5,1186 @@
 - `- Page N -`, `- Slide N -` 패턴 무시 (DOCX는 동적 페이지)
 - 문서 구조 추출 (타이틀, 섹션, 본문)
 - 이미지 경로에서 타이틀 추출
+- 대용량 입력용 스트리밍 파싱 (iter_blocks: 안전한 블록 경계에서 나눠 순차 파싱)
+- 메모리 절약형 블록 (슬롯, 공유 빈 기본값, 인라인 서식은 array('I') 정수 3개 단위)
+- markdown-it 엔진과 전처리 정규식은 프로세스에서 한 번만 구성 (get_markdown_engine)
+- 토큰 유형별 처리 표 + 스택으로 토큰을 한 번만 순회 (중첩 리스트/인용문은 children으로 보존)
 """
 
 from markdown_it import MarkdownIt
+from markdown_it.rules_block.html_block import HTML_SEQUENCES
 from markdown_it.token import Token
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from enum import IntEnum
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, List, Optional, Dict, Any, Iterable, Iterator, Mapping, NamedTuple, Sequence, Tuple
 from pathlib import Path
 import re
-
-
-@dataclass
-class ContentBlock:
-    """콘텐츠 블록"""
-    block_type: str  # 'title', 'subtitle', 'heading', 'paragraph', 'list_item',
-                     # 'table', 'code', 'image', 'horizontal_rule', 'blockquote'
-    content: str = ''
-    level: int = 0  # heading level (1-6), list depth
-    list_type: str = ''  # 'bullet', 'ordered'
-    children: List['ContentBlock'] = field(default_factory=list)
-    attributes: Dict[str, Any] = field(default_factory=dict)
-
-    # 인라인 서식 정보
-    inline_formats: List[Dict] = field(default_factory=list)  # [{start, end, format}]
-
-
-@dataclass
-class DocumentStructure:
-    """파싱된 문서 구조"""
-    title: str = ''
-    subtitle: str = ''
-    first_image_path: str = ''  # 첫 번째 이미지 경로 (타이틀 추출용)
-    sections: List['Section'] = field(default_factory=list)
-    raw_blocks: List[ContentBlock] = field(default_factory=list)
-
-
-@dataclass
-class Section:
-    """문서 섹션"""
-    heading: str = ''
-    level: int = 1
-    blocks: List[ContentBlock] = field(default_factory=list)
-
-
-class MarkdownParser:
-    """마크다운을 구조화된 데이터로 파싱"""
-
-    # 무시할 패턴 (페이지 구분자)
-    IGNORE_PATTERNS = [
-        r'^-\s*Page\s*\d+\s*-$',
-        r'^-\s*Slide\s*\d+\s*-$',
-        r'^-\s*페이지\s*\d+\s*-$',
-    ]
+import threading
+
+
+# 파서 버전 (블록/색인 출력이 바뀌면 올려서 파싱 캐시 무효화)
+PARSER_VERSION = 2
+
+# 코드 펜스 시작 (``` 또는 ~~~, 들여쓰기 제거 후) - 백틱 펜스의 정보 문자열에는 백틱 불가
+_FENCE_RE = re.compile(r'(`{3,}|~{3,})(.*)')
+
+# 빈 줄 뒤에 와도 앞 블록에 이어질 수 있는 줄 (리스트/인용/표/들여쓰기)
+_CONTINUATION_RE = re.compile(r'^(?:\s|[-*+](?:\s|$)|\d{1,9}[.)](?:\s|$)|>|\|)')
+
+# 리스트 항목 표식 (들여쓰기 제거 후) - 내용 시작 열 계산용
+_LIST_MARKER_RE = re.compile(r'([-*+]|\d{1,9}[.)])(?= |$)( *)')
+
+# 문단을 끝내는 한 줄짜리 블록 (ATX 헤딩, 구분선, setext 밑줄)
+_HEADING_RE = re.compile(r'#{1,6}(?:[ \t]|$)')
+_THEMATIC_BREAK_RE = re.compile(r'([-*_])(?:[ \t]*\1){2,}[ \t]*$')
+_SETEXT_UNDERLINE_RE = re.compile(r'(?:=+|-+)[ \t]*$')
+
+# 전처리 이미지 링크 패턴: ![alt](path) - 한 줄 안에서만 매칭
+_IMAGE_LINK_PATTERN = r'!\[(?P<alt>[^\]\n]*)\]\((?P<path>[^)\n]+)\)'
+
+# 공백 (줄바꿈 제외) - 줄 단위 패턴을 버퍼 전체에 적용할 때 \s 대신 사용
+_INLINE_SPACE = r'[^\S\n]'
+
+
+def _buffer_line_pattern(line_pattern: str) -> str:
+    """'^...$' 줄 패턴 -> 버퍼 전체용 패턴 본문 (앵커 제거, \\s가 줄바꿈을 넘지 않게)"""
+    body = line_pattern
+    if body.startswith('^'):
+        body = body[1:]
+    if body.endswith('$'):
+        body = body[:-1]
+    return body.replace(r'\s', _INLINE_SPACE)
+
+
+# 공유 markdown-it 엔진 (규칙 체인 구성은 프로세스당 한 번)
+_engine: Optional[MarkdownIt] = None
+_engine_lock = threading.Lock()
+
+
+def get_markdown_engine() -> MarkdownIt:
+    """
+    공유 markdown-it 엔진 (commonmark + 줄바꿈 유지 + HTML + 표)
+
+    parse()는 호출마다 새 상태를 만들므로 여러 스레드에서 동시에 써도 안전함.
+    설정(enable/disable, 플러그인)을 바꾸면 모든 사용처에 영향을 주므로 바꾸지 말 것.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                engine = MarkdownIt('commonmark', {'breaks': True, 'html': True})
+                engine.enable('table')
+                _engine = engine
+    return _engine
+
+
+class _PreprocessPatterns(NamedTuple):
+    """IGNORE_PATTERNS로 만든 전처리 정규식 묶음"""
+    ignore_lines: Tuple[re.Pattern, ...]  # 줄 단위 원본 패턴
+    line: re.Pattern                      # 무시할 줄 하나 (fullmatch, 버퍼 패턴과 같은 판정)
+    buffer: re.Pattern                    # (앞 줄바꿈 + 무시할 줄) | 이미지 링크
+    head: re.Pattern                      # 문서 맨 앞의 무시할 줄
+    buffer_bytes: re.Pattern
+    head_bytes: re.Pattern
+
+
+@lru_cache(maxsize=None)
+def _compile_preprocess_patterns(ignore_patterns: Tuple[str, ...]) -> _PreprocessPatterns:
+    """무시 패턴 집합별로 한 번만 컴파일 (하위 클래스가 IGNORE_PATTERNS를 바꿔도 동작)"""
+    # 두 분기 모두 고정 문자('\n', '!')로 시작해야 정규식 엔진이 후보 위치로 바로 건너뜀
+    ignore_line = (
+        f"{_INLINE_SPACE}*(?i:{'|'.join(_buffer_line_pattern(p) for p in ignore_patterns)})"
+        f"{_INLINE_SPACE}*"
+    )
+    buffer_pattern = rf'\n{ignore_line}(?=\n|\Z)|{_IMAGE_LINK_PATTERN}'
+    head_pattern = rf'{ignore_line}(?:\n|\Z)'
+    return _PreprocessPatterns(
+        ignore_lines=tuple(re.compile(p, re.IGNORECASE) for p in ignore_patterns),
+        line=re.compile(ignore_line),
+        buffer=re.compile(buffer_pattern),
+        head=re.compile(head_pattern),
+        # 바이트 버전 (mmap/memoryview 입력용, 공백/숫자는 ASCII 기준)
+        buffer_bytes=re.compile(buffer_pattern.encode('utf-8')),
+        head_bytes=re.compile(head_pattern.encode('utf-8')),
+    )
+
+
+# 스트리밍 파싱 기본 세그먼트 크기 (문자 수, 이 크기를 넘은 뒤 첫 안전 경계에서 나눔)
+DEFAULT_SEGMENT_SIZE = 1 << 20
+
+
+def iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """임의 크기 텍스트 조각 -> 줄 ('\\n' 제외, content.split('\\n')과 같은 결과)"""
+    pending = ''
+    for chunk in chunks:
+        if not chunk:
+            continue
+        pending += chunk
+        if '\n' not in chunk:
+            continue
+        lines = pending.split('\n')
+        pending = lines.pop()
+        yield from lines
+    yield pending
+
+
+def _fence_marker(text: str) -> Optional[str]:
+    """펜스 시작 줄이면 표식 반환 (들여쓰기 제거된 줄)"""
+    match = _FENCE_RE.match(text)
+    if match is None or (match.group(1)[0] == '`' and '`' in match.group(2)):
+        return None
+    return match.group(1)
+
+
+def _quote_content(text: str) -> str:
+    """인용문 줄의 내용 ('>'와 뒤따르는 공백 한 칸 제거)"""
+    return text[2:] if text.startswith('> ') else text[1:]
+
+
+def _list_interrupts_paragraph(match: re.Match, text: str) -> bool:
+    """리스트 표식 줄이 문단을 끊는지 (내용이 있고, 순서 리스트는 1로 시작)"""
+    marker = match.group(1)
+    return bool(text[match.end():].strip(' \t\r')) and (not marker[0].isdigit() or int(marker[:-1]) == 1)
+
+
+class BlockBoundaryTracker:
+    """
+    줄 단위로 읽으며 "여기서 잘라 따로 파싱해도 결과가 같은" 위치를 판단
+
+    새 세그먼트를 시작할 수 있는 줄:
+    - 직전 줄이 빈 줄 (문단/표/헤딩/HTML 블록 유형 6·7은 빈 줄에서 끝남)
+    - 최상위 코드 펜스나 빈 줄을 넘는 HTML 블록(주석, <pre> 등) 내부가 아님
+    - 리스트/인용/표 표식이나 들여쓰기로 시작하지 않음 (앞 블록의 연속일 수 있음)
+
+    HTML 블록 시작/끝 조건은 markdown-it의 HTML_SEQUENCES를 그대로 사용.
+    리스트 항목/인용문 내용은 하위 추적기로 따로 읽음 (lazy 연속 줄 판단용).
+    참조 링크 정의([id]: url)는 세그먼트 경계를 넘어 해석되지 않음.
+    """
 
     def __init__(self):
-        self.md = MarkdownIt('commonmark', {'breaks': True, 'html': True})
-        self.md.enable('table')
-
-        self._ignore_regex = [re.compile(p, re.IGNORECASE) for p in self.IGNORE_PATTERNS]
-
-    def parse(self, md_content: str) -> DocumentStructure:
-        """마크다운 파싱"""
-        # 전처리: 무시할 패턴 제거
-        cleaned_content = self._preprocess(md_content)
+        self.fence: Optional[str] = None                # 열린 펜스 표식 (예: '```')
+        self.html_end: Optional[re.Pattern] = None      # 열린 HTML 블록의 끝 조건
+        self.paragraph = False                          # 직전 줄이 문단을 이어가는 중인지
+        self.prev_blank = True                          # 문서 시작은 빈 줄 뒤와 같음
+        self.container: Optional['BlockBoundaryTracker'] = None  # 열린 리스트 항목/인용문의 내용
+        self.list_indent = 0                            # 리스트 항목 내용 시작 열 (0이면 인용문)
+        self.list_item_empty = False                    # 리스트 항목이 빈 줄로 시작해 아직 내용이 없는지
+
+    def can_split_before(self, line: str) -> bool:
+        """이 줄 앞에서 세그먼트를 나눌 수 있는지"""
+        return (self.prev_blank and self.fence is None and self.html_end is None
+                and bool(line.strip()) and not _CONTINUATION_RE.match(line))
+
+    @property
+    def in_paragraph(self) -> bool:
+        """가장 안쪽 열린 블록이 문단인지 (lazy 연속 줄 허용)"""
+        return self.container.in_paragraph if self.container is not None else self.paragraph
+
+    def feed(self, line: str):
+        """줄 하나를 읽고 펜스/HTML 블록/문단 상태 갱신"""
+        expanded = line.expandtabs(4)
+        text = expanded.lstrip(' ')
+        indent = len(expanded) - len(text)
+        blank = not text.strip(' \t\r')
+        prev_blank, self.prev_blank = self.prev_blank, blank
+
+        if self.fence is not None:
+            # 들여쓰기 4칸 미만, 같은 문자로 같거나 긴 표식만 있는 줄이 펜스를 닫음
+            closing = text.rstrip(' \t\r')
+            if indent < 4 and closing.startswith(self.fence) and not closing.lstrip(self.fence[0]):
+                self.fence = None
+            return
+        if self.html_end is not None:
+            # 유형 6·7의 끝 조건('^$')은 빈 줄에서 만족
+            if self.html_end.search('' if blank else text):
+                self.html_end = None
+            return
+
+        if self.container is not None:
+            if blank:
+                # 인용문과 빈 항목은 빈 줄에서 끝남
+                if self.list_indent and not self.list_item_empty:
+                    self.container.feed('')
+                else:
+                    self.container = None
+                return
+            if self.list_indent and indent >= self.list_indent:
+                self.list_item_empty = False
+                self.container.feed(expanded[self.list_indent:])
+                return
+            if not self.list_indent and text.startswith('>'):
+                self.container.feed(_quote_content(text))
+                return
+            if not prev_blank and self._is_lazy_continuation(text, indent):
+                return
+            self.container = None
+
+        if blank:
+            self.paragraph = False
+        elif indent >= 4:
+            # 문단 이어짐 또는 들여쓴 코드 (펜스/HTML 블록이 아님)
+            pass
+        else:
+            self._feed_block_start(text, indent)
+
+    def _feed_block_start(self, text: str, indent: int):
+        """들여쓰기 3칸 이하 줄의 블록 시작 판단"""
+        paragraph = self.paragraph
+        self.paragraph = False
+
+        fence = _fence_marker(text)
+        if fence:
+            self.fence = fence
+            return
+        for start_re, end_re, can_interrupt in HTML_SEQUENCES:
+            if start_re.search(text):
+                # 유형 7은 문단을 끊지 못함 (문단의 연속 줄)
+                if not can_interrupt and paragraph:
+                    break
+                # 같은 줄에서 닫히면 블록이 열린 상태가 아님
+                if not end_re.search(text):
+                    self.html_end = end_re
+                return
+
+        if text.startswith('>'):
+            self._open_container(_quote_content(text), 0)
+            return
+        if _HEADING_RE.match(text) or _THEMATIC_BREAK_RE.match(text):
+            return
+        if paragraph and _SETEXT_UNDERLINE_RE.match(text):
+            return
+        match = _LIST_MARKER_RE.match(text)
+        if match and (not paragraph or _list_interrupts_paragraph(match, text)):
+            rest = text[match.end():].rstrip(' \t\r')
+            # 표식 뒤 공백이 5칸 이상이거나 내용이 없으면 내용은 표식 한 칸 뒤에서 시작
+            content_start = match.end() if rest and len(match.group(2)) <= 4 else match.end(1) + 1
+            self._open_container(text[content_start:], indent + content_start)
+            self.list_item_empty = not rest
+            return
+        self.paragraph = True
+
+    def _open_container(self, content: str, list_indent: int):
+        """리스트 항목(list_indent > 0) 또는 인용문을 열고 첫 줄 내용을 읽음"""
+        self.container = BlockBoundaryTracker()
+        self.list_indent = list_indent
+        self.container.feed(content)
+
+    def _is_lazy_continuation(self, text: str, indent: int) -> bool:
+        """컨테이너 밖의 줄이 컨테이너 안 문단에 이어지는지 (새 블록을 시작하지 않는 글)"""
+        if not self.in_paragraph:
+            return False
+        if indent >= 4:
+            return True
+        if text.startswith('>'):
+            return False
+        text = text.rstrip(' \t\r')
+        if _HEADING_RE.match(text) or _THEMATIC_BREAK_RE.match(text) or _fence_marker(text):
+            return False
+        if any(start_re.search(text) for start_re, _, can_interrupt in HTML_SEQUENCES if can_interrupt):
+            return False
+        # 리스트 표식은 빈 항목이어도 컨테이너를 끝냄 (setext 밑줄은 lazy 줄에서 글로 취급)
+        return not _LIST_MARKER_RE.match(text)
+
+
+def iter_segments(
+    chunks: Iterable[str], segment_size: int = DEFAULT_SEGMENT_SIZE,
+    skip_line: Optional[Callable[[str], Any]] = None,
+) -> Iterator[str]:
+    """
+    마크다운을 독립적으로 파싱해도 결과가 같은 세그먼트로 분할
+    (segment_size를 넘은 뒤 첫 안전 경계에서 나눔, BlockBoundaryTracker 참고)
+
+    skip_line이 참을 반환하는 줄(전처리에서 지울 줄)은 경계 판단 전에 버림.
+    """
+    tracker = BlockBoundaryTracker()
+    buffer: List[str] = []
+    size = 0
+
+    for line in iter_lines(chunks):
+        if skip_line is not None and skip_line(line):
+            continue
+        if size >= segment_size and tracker.can_split_before(line):
+            yield '\n'.join(buffer)
+            buffer = []
+            size = 0
+
+        buffer.append(line)
+        size += len(line) + 1
+        tracker.feed(line)
+
+    if buffer:
+        yield '\n'.join(buffer)
+
+
+class InlineFormat(IntEnum):
+    """인라인 서식 종류 (InlineFormats 배열에 정수로 저장)"""
+    BOLD = 1
+    ITALIC = 2
+    STRIKE = 3
+    CODE = 4
+
+    @property
+    def label(self) -> str:
+        """'bold', 'italic', 'strike', 'code'"""
+        return self.name.lower()
+
+
+# 배열 값 -> InlineFormat (Enum 생성자 호출 없이 조회)
+_FORMAT_BY_CODE = (None,) + tuple(InlineFormat)
+
+
+class FormatSpan(NamedTuple):
+    """인라인 서식 구간 [start, end)"""
+    start: int
+    end: int
+    format: InlineFormat
+
+
+class InlineFormats:
+    """
+    블록의 인라인 서식 목록 (읽기 전용)
+
+    (start, end, format) 정수 세 개씩 array('I') 하나에 이어서 저장.
+    순회하면 FormatSpan을 반환함.
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data: Optional[array] = None):
+        self._data = data if data is not None else array('I')
+
+    @classmethod
+    def from_spans(cls, spans: Iterable[Tuple[int, int, int]]) -> 'InlineFormats':
+        data = array('I')
+        for start, end, fmt in spans:
+            data.extend((start, end, fmt))
+        return cls(data) if data else NO_FORMATS
+
+    def __len__(self) -> int:
+        return len(self._data) // 3
 
-        # 토큰 파싱
-        tokens = self.md.parse(cleaned_content)
+    def __bool__(self) -> bool:
+        return bool(self._data)
 
-        # 구조화
-        doc = DocumentStructure()
-        doc.raw_blocks = self._tokens_to_blocks(tokens)
+    def __iter__(self) -> Iterator[FormatSpan]:
+        data = self._data
+        for i in range(0, len(data), 3):
+            yield FormatSpan(data[i], data[i + 1], _FORMAT_BY_CODE[data[i + 2]])
 
-        # 타이틀/서브타이틀 추출
-        self._extract_title_subtitle(doc)
+    def __getitem__(self, index: int) -> FormatSpan:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('InlineFormats index out of range')
+        i = index * 3
+        data = self._data
+        return FormatSpan(data[i], data[i + 1], _FORMAT_BY_CODE[data[i + 2]])
 
-        # 섹션 구조화
-        doc.sections = self._organize_sections(doc.raw_blocks)
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, InlineFormats):
+            return NotImplemented
+        return self._data == other._data
 
-        return doc
+    def __hash__(self) -> int:
+        return hash(self._data.tobytes())
 
-    def parse_file(self, file_path: str) -> DocumentStructure:
-        """파일에서 파싱"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return self.parse(content)
+    def __repr__(self) -> str:
+        return f'InlineFormats({list(self)!r})'
 
-    def _preprocess(self, content: str) -> str:
-        """전처리 - 무시할 패턴 제거 및 이미지 경로 공백 인코딩"""
-        lines = content.split('\n')
-        result_lines = []
+    @property
+    def raw(self) -> array:
+        """(start, end, format) 평탄 배열"""
+        return self._data
 
-        # 이미지 패턴: ![...](path)
-        image_pattern = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """[{'start', 'end', 'format': 'bold'}] 형식 (JSON 직렬화 등)"""
+        return [{'start': s.start, 'end': s.end, 'format': s.format.label} for s in self]
 
-        for line in lines:
-            stripped = line.strip()
 
-            # 빈 줄은 유지
-            if not stripped:
-                result_lines.append(line)
-                continue
+class _ReadOnlyDict(dict):
+    """수정할 수 없는 dict (블록 간 공유 기본값용)"""
 
-            # 무시 패턴 체크
-            should_ignore = any(regex.match(stripped) for regex in self._ignore_regex)
-            if should_ignore:
-                continue
+    __slots__ = ()
 
-            # 이미지 경로의 공백을 %20으로 인코딩 (markdown-it 파싱 호환성)
-            def encode_image_path(match):
-                alt = match.group(1)
-                path = match.group(2)
-                # 공백만 인코딩 (한글 등은 그대로)
-                encoded_path = path.replace(' ', '%20')
-                return f'![{alt}]({encoded_path})'
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('공유 기본값은 수정할 수 없습니다 (새 dict를 지정하세요)')
 
-            line = image_pattern.sub(encode_image_path, line)
-            result_lines.append(line)
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
 
-        return '\n'.join(result_lines)
+    def __hash__(self) -> int:
+        return hash(frozenset(self.items()))
 
-    def _tokens_to_blocks(self, tokens: List[Token]) -> List[ContentBlock]:
-        """토큰을 ContentBlock 리스트로 변환"""
-        blocks = []
-        i = 0
 
-        while i < len(tokens):
-            token = tokens[i]
-            block, consumed = self._process_token(tokens, i)
+# 블록 간 공유하는 빈 기본값 (블록마다 빈 list/dict를 만들지 않음)
+NO_FORMATS = InlineFormats()
+NO_CHILDREN: Tuple['ContentBlock', ...] = ()
+NO_ATTRIBUTES: Mapping[str, Any] = _ReadOnlyDict()
 
-            if block:
-                blocks.append(block)
 
-            i += consumed
+@dataclass(slots=True)
+class ContentBlock:
+    """콘텐츠 블록"""
+    block_type: str  # 'title', 'subtitle', 'heading', 'paragraph', 'list_item',
+                     # 'table', 'code', 'image', 'horizontal_rule', 'blockquote'
+    content: str = ''
+    level: int = 0  # heading level (1-6), list depth
+    list_type: str = ''  # 'bullet', 'ordered'
+    children: Sequence['ContentBlock'] = NO_CHILDREN
+    attributes: Mapping[str, Any] = NO_ATTRIBUTES
 
-        return blocks
+    # 인라인 서식 정보
+    inline_formats: InlineFormats = NO_FORMATS
+
+
+# 섹션 번호 문단 (1~2자리 숫자만, 예: '1', '01')
+SECTION_NUMBER_RE = re.compile(r'^0?\d$')
+
+
+def is_full_bold(block: ContentBlock) -> bool:
+    """첫 굵게 구간이 문단 전체를 덮는지 (굵은 글씨만 있는 문단)"""
+    for span in block.inline_formats:
+        if span.format == InlineFormat.BOLD:
+            return span.start == 0 and span.end == len(block.content)
+    return False
+
+
+@dataclass(slots=True)
+class DocumentIndex:
+    """
+    블록 위치 색인 (블록을 만드는 같은 패스에서 add()로 채움)
+
+    위치는 raw_blocks 인덱스이며 array('I')에 오름차순으로 저장.
+    """
+    block_count: int = 0
+    by_type: Dict[str, array] = field(default_factory=dict)       # 블록 유형 -> 위치
+    headings: Dict[int, array] = field(default_factory=dict)      # 헤딩 레벨 -> 위치
+    section_starts: array = field(default_factory=lambda: array('I'))   # H1/H2 위치 (섹션 경계)
+    bold_paragraphs: array = field(default_factory=lambda: array('I'))  # 굵은 글씨만 있는 문단
+    section_numbers: array = field(default_factory=lambda: array('I'))  # 숫자만 있는 문단
+
+    @classmethod
+    def build(cls, blocks: Iterable[ContentBlock]) -> 'DocumentIndex':
+        index = cls()
+        index.extend(blocks)
+        return index
+
+    def add(self, block: ContentBlock):
+        """다음 위치의 블록 등록"""
+        position = self.block_count
+        self.block_count += 1
+
+        block_type = block.block_type
+        positions = self.by_type.get(block_type)
+        if positions is None:
+            positions = self.by_type[block_type] = array('I')
+        positions.append(position)
+
+        if block_type == 'heading':
+            level_positions = self.headings.get(block.level)
+            if level_positions is None:
+                level_positions = self.headings[block.level] = array('I')
+            level_positions.append(position)
+            if block.level <= 2:
+                self.section_starts.append(position)
+
+        elif block_type == 'paragraph':
+            if block.inline_formats and is_full_bold(block):
+                self.bold_paragraphs.append(position)
+            if SECTION_NUMBER_RE.match(block.content.strip()):
+                self.section_numbers.append(position)
+
+    def extend(self, blocks: Iterable[ContentBlock]):
+        for block in blocks:
+            self.add(block)
 
-    def _process_token(self, tokens: List[Token], index: int) -> tuple:
-        """단일 토큰 처리, (ContentBlock, consumed_count) 반환"""
-        token = tokens[index]
+    def positions(self, block_type: str) -> array:
+        """해당 유형 블록 위치 (없으면 빈 배열)"""
+        return self.by_type.get(block_type) or array('I')
 
-        # 헤딩
-        if token.type == 'heading_open':
-            return self._process_heading(tokens, index)
+    def first(self, block_type: str) -> Optional[int]:
+        positions = self.by_type.get(block_type)
+        return positions[0] if positions else None
 
-        # 문단
-        elif token.type == 'paragraph_open':
-            return self._process_paragraph(tokens, index)
+    def first_heading(self, level: int) -> Optional[int]:
+        positions = self.headings.get(level)
+        return positions[0] if positions else None
 
-        # 불릿 리스트
-        elif token.type == 'bullet_list_open':
-            return self._process_list(tokens, index, 'bullet')
+    def heading_positions(self, level: int) -> array:
+        return self.headings.get(level) or array('I')
 
-        # 숫자 리스트
-        elif token.type == 'ordered_list_open':
-            return self._process_list(tokens, index, 'ordered')
+    @property
+    def first_image(self) -> Optional[int]:
+        return self.first('image')
 
-        # 인용문
-        elif token.type == 'blockquote_open':
-            return self._process_blockquote(tokens, index)
+    def section_ranges(self, level: int = 2, exclude: Optional[set] = None) -> List[Tuple[int, int]]:
+        """
+        해당 레벨 헤딩으로 나눈 구간 [(헤딩 위치, 다음 같은 레벨 헤딩 위치 또는 끝)]
 
-        # 코드 블록
-        elif token.type == 'fence' or token.type == 'code_block':
-            block = ContentBlock(
-                block_type='code',
-                content=token.content,
-                attributes={'language': token.info or ''}
-            )
-            return block, 1
+        Args:
+            exclude: 경계에서 제외할 블록 위치 (이미 다른 곳에 쓰인 헤딩 등)
+        """
+        starts = [p for p in self.heading_positions(level) if not exclude or p not in exclude]
+        ends = starts[1:] + [self.block_count]
+        return list(zip(starts, ends))
 
-        # 테이블
-        elif token.type == 'table_open':
-            return self._process_table(tokens, index)
 
-        # 수평선
-        elif token.type == 'hr':
-            return ContentBlock(block_type='horizontal_rule'), 1
+@dataclass
+class DocumentStructure:
+    """파싱된 문서 구조"""
+    title: str = ''
+    subtitle: str = ''
+    first_image_path: str = ''  # 첫 번째 이미지 경로 (타이틀 추출용)
+    sections: List['Section'] = field(default_factory=list)
+    raw_blocks: List[ContentBlock] = field(default_factory=list)
 
-        # 기타 (무시)
-        return None, 1
+    # 블록 위치 색인 (파서가 채움, 블록 수가 달라지면 다시 계산)
+    _index: Optional[DocumentIndex] = field(default=None, init=False, repr=False, compare=False)
 
-    def _process_heading(self, tokens: List[Token], start: int) -> tuple:
-        """헤딩 처리"""
-        open_token = tokens[start]
-        level = int(open_token.tag[1])  # h1 -> 1
+    @property
+    def index(self) -> DocumentIndex:
+        if self._index is None or self._index.block_count != len(self.raw_blocks):
+            self._index = DocumentIndex.build(self.raw_blocks)
+        return self._index
 
-        inline_token = tokens[start + 1] if start + 1 < len(tokens) else None
-        text, formats = self._extract_inline_content(inline_token)
 
-        block = ContentBlock(
+class Section:
+    """
+    문서 섹션 - raw_blocks의 [start, end) 구간 뷰 (헤딩 블록 자체는 제외)
+
+    블록 목록을 복사하지 않으므로 섹션 수에 비례하는 메모리만 사용.
+    순회는 지연 방식이며, blocks는 필요할 때 구간을 잘라 리스트로 반환.
+    """
+
+    __slots__ = ('heading', 'level', 'start', 'end', '_source')
+
+    def __init__(self, heading: str = '', level: int = 1, start: int = 0, end: int = 0,
+                 source: Sequence[ContentBlock] = NO_CHILDREN):
+        self.heading = heading
+        self.level = level
+        self.start = start
+        self.end = end
+        self._source = source
+
+    @property
+    def block_range(self) -> range:
+        """raw_blocks 인덱스 범위"""
+        return range(self.start, self.end)
+
+    @property
+    def blocks(self) -> List[ContentBlock]:
+        return list(self._source[self.start:self.end])
+
+    def __iter__(self) -> Iterator[ContentBlock]:
+        source = self._source
+        for i in range(self.start, self.end):
+            yield source[i]
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Section):
+            return NotImplemented
+        return (self.heading, self.level, self.start, self.end) == \
+            (other.heading, other.level, other.start, other.end)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f'Section(heading={self.heading!r}, level={self.level}, '
+                f'start={self.start}, end={self.end})')
+
+
+class _Container:
+    """토큰 처리 중 열린 컨테이너 (리스트/리스트 항목/인용문/표)"""
+
+    __slots__ = ('kind', 'level', 'list_type', 'parts', 'children', 'row', 'is_header')
+
+    def __init__(self, kind: str, level: int = 0, list_type: str = ''):
+        self.kind = kind
+        self.level = level            # 리스트/인용문 중첩 깊이 (최상위 0)
+        self.list_type = list_type
+        self.parts: List[Tuple[str, InlineFormats]] = []   # 항목/인용문: 문단 (텍스트, 서식)
+        self.children: List[Any] = []                      # 리스트: 항목, 항목/인용문: 중첩 블록, 표: 행
+        self.row: Optional[List[str]] = None               # 표: 현재 행 셀
+        self.is_header = False
+
+
+def _join_paragraphs(parts: List[Tuple[str, InlineFormats]]) -> Tuple[str, InlineFormats]:
+    """항목 안의 여러 문단을 줄바꿈으로 이어 붙임 (서식 위치도 이동)"""
+    if not parts:
+        return '', NO_FORMATS
+
+    data = array('I')
+    offset = 0
+    for text, formats in parts:
+        raw = formats.raw
+        for i in range(0, len(raw), 3):
+            data.extend((raw[i] + offset, raw[i + 1] + offset, raw[i + 2]))
+        offset += len(text) + 1
+    return '\n'.join(text for text, _ in parts), (InlineFormats(data) if data else NO_FORMATS)
+
+
+def _list_item_texts(block: ContentBlock) -> Iterator[str]:
+    """리스트 항목 텍스트 (중첩 리스트 포함, 문서 순서)"""
+    for item in block.children:
+        if item.content:
+            yield item.content
+        for child in item.children:
+            if child.block_type == 'list':
+                yield from _list_item_texts(child)
+
+
+class _BlockBuilder:
+    """
+    토큰 -> ContentBlock 변환 (토큰 목록을 한 번만 순회)
+
+    토큰 유형별 처리 함수는 HANDLERS 표에서 찾고, 열린 리스트/항목/인용문/표는 스택으로 추적.
+    - 중첩 리스트는 리스트 항목의 children, 중첩 인용문은 인용문의 children
+    - 인용문 안의 리스트 항목은 인용문 본문으로 이어 붙임
+    - 컨테이너 안의 헤딩/코드/표/수평선은 버림
+    """
+
+    __slots__ = ('extract', 'index', 'blocks', 'stack', 'leaf', 'leaf_level', 'inline',
+                 'list_depth', 'quote_depth')
+
+    def __init__(self, extract, index: Optional[DocumentIndex] = None):
+        self.extract = extract            # 인라인 토큰 -> (텍스트, 서식)
+        self.index = index
+        self.blocks: List[ContentBlock] = []
+        self.stack: List[_Container] = []
+        self.leaf: Optional[str] = None   # 열린 헤딩/문단
+        self.leaf_level = 0
+        self.inline: Optional[Token] = None
+        self.list_depth = 0
+        self.quote_depth = 0
+
+    def run(self, tokens: Iterable[Token]) -> List[ContentBlock]:
+        handlers = self.HANDLERS
+        for token in tokens:
+            handler = handlers.get(token.type)
+            if handler is not None:
+                handler(self, token)
+        return self.blocks
+
+    def _emit(self, block: ContentBlock):
+        self.blocks.append(block)
+        if self.index is not None:
+            self.index.add(block)
+
+    def _attach(self, block: ContentBlock):
+        """닫힌 리스트/인용문을 바깥 컨테이너에 연결 (최상위면 출력)"""
+        if not self.stack:
+            self._emit(block)
+            return
+        parent = self.stack[-1]
+        if parent.kind == 'quote' and block.block_type == 'list':
+            parent.parts.extend((text, NO_FORMATS) for text in _list_item_texts(block))
+        else:
+            parent.children.append(block)
+
+    # --- 헤딩/문단 ---
+
+    def _heading_open(self, token: Token):
+        self.leaf = 'heading'
+        self.leaf_level = int(token.tag[1])  # h1 -> 1
+        self.inline = None
+
+    def _heading_close(self, token: Token):
+        self.leaf = None
+        if self.stack:
+            return
+        text, formats = self.extract(self.inline)
+        self._emit(ContentBlock(
             block_type='heading',
             content=text,
-            level=level,
-            inline_formats=formats
-        )
+            level=self.leaf_level,
+            inline_formats=formats,
+        ))
 
-        return block, 3  # open, inline, close
+    def _paragraph_open(self, token: Token):
+        self.leaf = 'paragraph'
+        self.inline = None
 
-    def _process_paragraph(self, tokens: List[Token], start: int) -> tuple:
-        """문단 처리"""
-        inline_token = tokens[start + 1] if start + 1 < len(tokens) else None
+    def _paragraph_close(self, token: Token):
+        self.leaf = None
+        inline_token = self.inline
 
-        if inline_token and inline_token.type != 'inline':
-            return None, 1
+        if self.stack:
+            parent = self.stack[-1]
+            if parent.kind in ('item', 'quote'):
+                parent.parts.append(self.extract(inline_token))
+            return
 
         # 이미지 체크
-        if inline_token and inline_token.children:
-            images = [c for c in inline_token.children if c.type == 'image']
-            if images:
-                img = images[0]
-                block = ContentBlock(
-                    block_type='image',
-                    content=img.attrGet('alt') or '',
-                    attributes={
-                        'src': img.attrGet('src') or '',
-                        'title': img.attrGet('title') or '',
-                    }
-                )
-                return block, 3
-
-        text, formats = self._extract_inline_content(inline_token)
+        if inline_token is not None and inline_token.children:
+            for child in inline_token.children:
+                if child.type == 'image':
+                    self._emit(ContentBlock(
+                        block_type='image',
+                        content=child.attrGet('alt') or '',
+                        attributes={
+                            'src': child.attrGet('src') or '',
+                            'title': child.attrGet('title') or '',
+                        }
+                    ))
+                    return
+
+        text, formats = self.extract(inline_token)
 
         # 빈 문단은 건너뛰기
         if not text.strip():
-            return None, 3
+            return
 
-        block = ContentBlock(
+        self._emit(ContentBlock(
             block_type='paragraph',
             content=text,
-            inline_formats=formats
-        )
-
-        return block, 3
+            inline_formats=formats,
+        ))
+
+    def _inline(self, token: Token):
+        if self.leaf is not None:
+            self.inline = token
+        elif self.stack and self.stack[-1].kind == 'table':
+            self.stack[-1].row.append(self.extract(token)[0])
+
+    # --- 리스트 ---
+
+    def _list_open(self, token: Token):
+        list_type = 'bullet' if token.type == 'bullet_list_open' else 'ordered'
+        self.stack.append(_Container('list', self.list_depth, list_type))
+        self.list_depth += 1
+
+    def _list_close(self, token: Token):
+        container = self.stack.pop()
+        self.list_depth -= 1
+        self._attach(ContentBlock(
+            block_type='list',
+            level=container.level,
+            list_type=container.list_type,
+            children=tuple(container.children),
+        ))
+
+    def _item_open(self, token: Token):
+        parent = self.stack[-1]
+        self.stack.append(_Container('item', parent.level, parent.list_type))
+
+    def _item_close(self, token: Token):
+        item = self.stack.pop()
+        parts = item.parts
+        if len(parts) == 1:
+            text, formats = parts[0]
+        elif parts or item.children:
+            text, formats = _join_paragraphs(parts)
+        else:
+            return  # 빈 항목
+        self.stack[-1].children.append(ContentBlock(
+            block_type='list_item',
+            content=text,
+            level=item.level,
+            list_type=item.list_type,
+            children=tuple(item.children) if item.children else NO_CHILDREN,
+            inline_formats=formats,
+        ))
+
+    # --- 인용문 ---
+
+    def _blockquote_open(self, token: Token):
+        self.stack.append(_Container('quote', self.quote_depth))
+        self.quote_depth += 1
+
+    def _blockquote_close(self, token: Token):
+        container = self.stack.pop()
+        self.quote_depth -= 1
+        self._attach(ContentBlock(
+            block_type='blockquote',
+            content='\n'.join(text for text, _ in container.parts),
+            level=container.level,
+            children=tuple(container.children) if container.children else NO_CHILDREN,
+        ))
 
-    def _process_list(self, tokens: List[Token], start: int, list_type: str) -> tuple:
-        """리스트 처리"""
-        close_tag = f'{list_type}_list_close'
-        items = []
-        depth = 1
-        i = start + 1
+    # --- 코드/수평선 ---
 
-        while i < len(tokens):
-            token = tokens[i]
+    def _code(self, token: Token):
+        if not self.stack:
+            self._emit(ContentBlock(
+                block_type='code',
+                content=token.content,
+                attributes={'language': token.info or ''}
+            ))
+
+    def _hr(self, token: Token):
+        if not self.stack:
+            self._emit(ContentBlock(block_type='horizontal_rule'))
+
+    # --- 테이블 ---
+
+    def _table_open(self, token: Token):
+        self.stack.append(_Container('table'))
+
+    def _table_close(self, token: Token):
+        container = self.stack.pop()
+        if not self.stack:
+            self._emit(ContentBlock(
+                block_type='table',
+                attributes={'rows': container.children}
+            ))
+
+    def _thead_open(self, token: Token):
+        self.stack[-1].is_header = True
+
+    def _thead_close(self, token: Token):
+        self.stack[-1].is_header = False
+
+    def _tr_open(self, token: Token):
+        self.stack[-1].row = []
+
+    def _tr_close(self, token: Token):
+        table = self.stack[-1]
+        table.children.append({'cells': table.row, 'is_header': table.is_header})
+
+    # 토큰 유형 -> 처리 함수 (표에 없는 유형은 무시)
+    HANDLERS = {
+        'heading_open': _heading_open,
+        'heading_close': _heading_close,
+        'paragraph_open': _paragraph_open,
+        'paragraph_close': _paragraph_close,
+        'inline': _inline,
+        'bullet_list_open': _list_open,
+        'ordered_list_open': _list_open,
+        'bullet_list_close': _list_close,
+        'ordered_list_close': _list_close,
+        'list_item_open': _item_open,
+        'list_item_close': _item_close,
+        'blockquote_open': _blockquote_open,
+        'blockquote_close': _blockquote_close,
+        'fence': _code,
+        'code_block': _code,
+        'hr': _hr,
+        'table_open': _table_open,
+        'table_close': _table_close,
+        'thead_open': _thead_open,
+        'thead_close': _thead_close,
+        'tr_open': _tr_open,
+        'tr_close': _tr_close,
+    }
 
-            if token.type == f'{list_type}_list_close':
-                depth -= 1
-                if depth == 0:
-                    break
 
-            elif token.type == f'{list_type}_list_open':
-                depth += 1
-
-            elif token.type == 'paragraph_open':
-                if i + 1 < len(tokens) and tokens[i + 1].type == 'inline':
-                    inline_token = tokens[i + 1]
-                    text, formats = self._extract_inline_content(inline_token)
-                    items.append(ContentBlock(
-                        block_type='list_item',
-                        content=text,
-                        list_type=list_type,
-                        inline_formats=formats
-                    ))
-                    i += 2
-                    continue
+class MarkdownParser:
+    """마크다운을 구조화된 데이터로 파싱"""
 
-            i += 1
+    # 무시할 패턴 (페이지 구분자)
+    IGNORE_PATTERNS = [
+        r'^-\s*Page\s*\d+\s*-$',
+        r'^-\s*Slide\s*\d+\s*-$',
+        r'^-\s*페이지\s*\d+\s*-$',
+    ]
 
-        # 리스트 컨테이너 블록 생성
-        block = ContentBlock(
-            block_type='list',
-            list_type=list_type,
-            children=items
-        )
+    def __init__(self):
+        # 엔진/정규식은 공유 객체 (인스턴스 생성 비용 없음)
+        self.md = get_markdown_engine()
 
-        return block, i - start + 1
+        patterns = _compile_preprocess_patterns(tuple(self.IGNORE_PATTERNS))
+        self._ignore_regex = patterns.ignore_lines
+        self._ignore_line_re = patterns.line
 
-    def _process_blockquote(self, tokens: List[Token], start: int) -> tuple:
-        """인용문 처리"""
-        depth = 1
-        content_parts = []
-        i = start + 1
+        # 전처리용 결합 정규식: (앞 줄바꿈 + 무시할 줄) | 이미지 링크 - 버퍼 전체를 한 번에 처리
+        self._preprocess_re = patterns.buffer
+        self._ignore_head_re = patterns.head
+        self._preprocess_bytes_re = patterns.buffer_bytes
+        self._ignore_head_bytes_re = patterns.head_bytes
 
-        while i < len(tokens):
-            token = tokens[i]
+    def parse(self, md_content: str) -> DocumentStructure:
+        """마크다운 파싱"""
+        # 전처리: 무시할 패턴 제거
+        return self._parse_cleaned(self._preprocess(md_content))
 
-            if token.type == 'blockquote_close':
-                depth -= 1
-                if depth == 0:
-                    break
+    def _parse_cleaned(self, cleaned_content: str) -> DocumentStructure:
+        """전처리된 마크다운 파싱"""
+        # 토큰 파싱
+        tokens = self.md.parse(cleaned_content)
 
-            elif token.type == 'blockquote_open':
-                depth += 1
+        # 구조화 (블록 색인도 같은 패스에서 구성)
+        doc = DocumentStructure()
+        doc._index = DocumentIndex()
+        doc.raw_blocks = self._tokens_to_blocks(tokens, doc._index)
 
-            elif token.type == 'paragraph_open':
-                if i + 1 < len(tokens) and tokens[i + 1].type == 'inline':
-                    text, _ = self._extract_inline_content(tokens[i + 1])
-                    content_parts.append(text)
-                    i += 2
-                    continue
+        # 타이틀/서브타이틀 추출
+        self._extract_title_subtitle(doc)
 
-            i += 1
+        # 섹션 구조화
+        doc.sections = self._organize_sections(doc.raw_blocks, doc.index)
 
-        block = ContentBlock(
-            block_type='blockquote',
-            content='\n'.join(content_parts)
-        )
+        return doc
 
-        return block, i - start + 1
+    def parse_file(self, file_path: str) -> DocumentStructure:
+        """파일에서 파싱 (같은 내용은 디스크 파싱 캐시에서 로드, 캐시가 꺼져 있으면 매번 파싱)"""
+        from .parse_cache import get_parse_cache
 
-    def _process_table(self, tokens: List[Token], start: int) -> tuple:
-        """테이블 처리"""
-        rows = []
-        current_row = []
-        is_header = False
-        i = start + 1
+        cache = get_parse_cache()
+        if cache is not None:
+            return cache.parse_file(self, file_path)
 
-        while i < len(tokens):
-            token = tokens[i]
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        return self.parse(content)
 
-            if token.type == 'table_close':
+    def iter_blocks(
+        self, chunks: Iterable[str], segment_size: int = DEFAULT_SEGMENT_SIZE
+    ) -> Iterator[ContentBlock]:
+        """
+        ContentBlock 스트리밍 파싱 (전체 텍스트/토큰 목록을 한 번에 만들지 않음)
+
+        Args:
+            chunks: 텍스트 조각 이터러블 (열린 파일 객체, 문자열 리스트 등)
+            segment_size: 한 번에 파싱할 대략적인 문자 수
+        """
+        # 무시할 줄(페이지 표식)은 경계 판단 전에 버림 - parse()가 보는 텍스트와 같은 줄로 분할
+        for segment in iter_segments(chunks, segment_size, self._ignore_line_re.fullmatch):
+            tokens = self.md.parse(self._preprocess(segment))
+            yield from self._tokens_to_blocks(tokens)
+
+    def iter_file_blocks(
+        self, file_path: str, segment_size: int = DEFAULT_SEGMENT_SIZE
+    ) -> Iterator[ContentBlock]:
+        """파일에서 ContentBlock 스트리밍 파싱"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            yield from self.iter_blocks(f, segment_size)
+
+    def stream(
+        self, chunks: Iterable[str], lookahead: int = 64, segment_size: int = DEFAULT_SEGMENT_SIZE
+    ) -> Tuple[DocumentStructure, Iterator[ContentBlock]]:
+        """
+        스트리밍 파싱 + 앞부분 블록으로 타이틀/서브타이틀 추출
+
+        Returns:
+            (문서 정보, 전체 블록 이터레이터)
+            문서 정보의 raw_blocks에는 앞보기 구간(최대 lookahead개)만 들어 있음.
+            타이틀/서브타이틀/첫 이미지는 이 구간 안에서만 찾음. sections는 비어 있음.
+        """
+        blocks = self.iter_blocks(chunks, segment_size)
+
+        window = []
+        for block in blocks:
+            window.append(block)
+            if len(window) >= lookahead:
                 break
 
-            elif token.type == 'thead_open':
-                is_header = True
-
-            elif token.type == 'thead_close':
-                is_header = False
-
-            elif token.type == 'tr_open':
-                current_row = []
-
-            elif token.type == 'tr_close':
-                rows.append({'cells': current_row, 'is_header': is_header})
-
-            elif token.type == 'inline':
-                text, _ = self._extract_inline_content(token)
-                current_row.append(text)
+        doc = DocumentStructure(raw_blocks=window)
+        self._extract_title_subtitle(doc)
+        return doc, chain(window, blocks)
 
-            i += 1
+    def stream_file(
+        self, file_path: str, lookahead: int = 64, segment_size: int = DEFAULT_SEGMENT_SIZE
+    ) -> Tuple[DocumentStructure, Iterator[ContentBlock]]:
+        """파일 스트리밍 파싱 (stream() 참고, 이터레이터를 끝까지 소비하면 파일이 닫힘)"""
+        def chunks():
+            with open(file_path, 'r', encoding='utf-8') as f:
+                yield from f
 
-        block = ContentBlock(
-            block_type='table',
-            attributes={'rows': rows}
-        )
+        return self.stream(chunks(), lookahead, segment_size)
 
-        return block, i - start + 1
+    def parse_buffer(self, buffer) -> DocumentStructure:
+        """UTF-8 바이트 버퍼(bytes, memoryview, mmap 등)에서 파싱"""
+        return self._parse_cleaned(self.preprocess_buffer(buffer))
 
-    def _extract_inline_content(self, inline_token: Optional[Token]) -> tuple:
+    def _preprocess(self, content: str) -> str:
+        """전처리 - 무시할 패턴 제거 및 이미지 경로 공백 인코딩 (결합 정규식 한 번 통과)"""
+        start = self._skip_ignored_head(self._ignore_head_re, content)
+        if start:
+            content = content[start:]
+        return self._preprocess_re.sub(self._preprocess_match, content)
+
+    def preprocess_buffer(self, buffer) -> str:
+        """
+        바이트 버퍼 전처리 (bytes, bytearray, memoryview, mmap - UTF-8)
+
+        입력 전체를 먼저 디코딩하지 않고 바이트 위에서 바로 정규식을 적용한 뒤,
+        결과만 한 번 디코딩함.
+        """
+        with memoryview(buffer) as view:
+            start = self._skip_ignored_head(self._ignore_head_bytes_re, view)
+            cleaned = self._preprocess_bytes_re.sub(self._preprocess_bytes_match, view[start:])
+        return cleaned.decode('utf-8')
+
+    @staticmethod
+    def _skip_ignored_head(head_re: re.Pattern, content) -> int:
+        """
+        문서 맨 앞의 무시할 줄들을 건너뛴 위치
+
+        결합 정규식은 무시할 줄을 앞 줄바꿈과 함께 지우므로, 앞에 줄바꿈이 없는
+        첫 줄(들)만 따로 처리함.
+        """
+        pos = 0
+        while pos < len(content):
+            match = head_re.match(content, pos)
+            if not match:
+                break
+            pos = match.end()
+        return pos
+
+    @staticmethod
+    def _preprocess_match(match: re.Match) -> str:
+        # 무시할 줄은 줄바꿈까지 제거
+        path = match.group('path')
+        if path is None:
+            return ''
+        # 이미지 경로의 공백만 %20으로 인코딩 (markdown-it 파싱 호환성, 한글 등은 그대로)
+        if ' ' not in path:
+            return match.group(0)
+        return f"![{match.group('alt')}]({path.replace(' ', '%20')})"
+
+    @staticmethod
+    def _preprocess_bytes_match(match: re.Match) -> bytes:
+        path = match.group('path')
+        if path is None:
+            return b''
+        if b' ' not in path:
+            return match.group(0)
+        return b'![' + match.group('alt') + b'](' + path.replace(b' ', b'%20') + b')'
+
+    def _tokens_to_blocks(
+        self, tokens: List[Token], index: Optional[DocumentIndex] = None
+    ) -> List[ContentBlock]:
+        """토큰을 ContentBlock 리스트로 변환 (index가 주어지면 만든 블록을 바로 등록)"""
+        return _BlockBuilder(self._extract_inline_content, index).run(tokens)
+
+    # 여는/닫는 토큰 -> 인라인 서식
+    _INLINE_OPEN = {
+        'strong_open': InlineFormat.BOLD,
+        'em_open': InlineFormat.ITALIC,
+        's_open': InlineFormat.STRIKE,
+    }
+    _INLINE_CLOSE = {
+        'strong_close': InlineFormat.BOLD,
+        'em_close': InlineFormat.ITALIC,
+        's_close': InlineFormat.STRIKE,
+    }
+
+    def _extract_inline_content(self, inline_token: Optional[Token]) -> Tuple[str, InlineFormats]:
         """인라인 토큰에서 텍스트와 서식 정보 추출"""
         if not inline_token:
-            return '', []
+            return '', NO_FORMATS
 
-        if not inline_token.children:
-            return inline_token.content or '', []
+        children = inline_token.children
+        if not children:
+            return inline_token.content or '', NO_FORMATS
+
+        # 서식 없는 단순 텍스트 (표 셀 등 대부분의 경우)
+        if len(children) == 1 and children[0].type == 'text':
+            return children[0].content, NO_FORMATS
 
         text_parts = []
-        formats = []
+        formats = array('I')
         current_pos = 0
         format_stack = []
 
-        for child in inline_token.children:
-            if child.type == 'text':
+        for child in children:
+            child_type = child.type
+
+            if child_type == 'text':
                 text_parts.append(child.content)
                 current_pos += len(child.content)
 
-            elif child.type == 'code_inline':
+            elif child_type == 'code_inline':
                 start = current_pos
                 text_parts.append(child.content)
                 current_pos += len(child.content)
-                formats.append({'start': start, 'end': current_pos, 'format': 'code'})
+                formats.extend((start, current_pos, InlineFormat.CODE))
 
-            elif child.type == 'softbreak':
+            elif child_type == 'softbreak':
                 text_parts.append(' ')
                 current_pos += 1
 
-            elif child.type == 'hardbreak':
+            elif child_type == 'hardbreak':
                 text_parts.append('\n')
                 current_pos += 1
 
-            elif child.type == 'strong_open':
-                format_stack.append(('bold', current_pos))
-
-            elif child.type == 'strong_close':
-                if format_stack:
-                    fmt, start = format_stack.pop()
-                    if fmt == 'bold':
-                        formats.append({'start': start, 'end': current_pos, 'format': 'bold'})
-
-            elif child.type == 'em_open':
-                format_stack.append(('italic', current_pos))
+            elif child_type in self._INLINE_OPEN:
+                format_stack.append((self._INLINE_OPEN[child_type], current_pos))
 
-            elif child.type == 'em_close':
+            elif child_type in self._INLINE_CLOSE:
                 if format_stack:
                     fmt, start = format_stack.pop()
-                    if fmt == 'italic':
-                        formats.append({'start': start, 'end': current_pos, 'format': 'italic'})
-
-            elif child.type == 's_open':
-                format_stack.append(('strike', current_pos))
+                    if fmt == self._INLINE_CLOSE[child_type]:
+                        formats.extend((start, current_pos, fmt))
 
-            elif child.type == 's_close':
-                if format_stack:
-                    fmt, start = format_stack.pop()
-                    if fmt == 'strike':
-                        formats.append({'start': start, 'end': current_pos, 'format': 'strike'})
-
-        return ''.join(text_parts), formats
+        return ''.join(text_parts), (InlineFormats(formats) if formats else NO_FORMATS)
 
     def _extract_title_subtitle(self, doc: DocumentStructure):
-        """타이틀/서브타이틀 추출"""
+        """타이틀/서브타이틀 추출 (블록 색인 조회)"""
         from urllib.parse import unquote
 
-        # 1. 첫 번째 이미지 경로에서 파일명 추출 (타이틀 후보)
-        for block in doc.raw_blocks:
-            if block.block_type == 'image':
-                src = block.attributes.get('src', '')
-                # URL 디코딩 (%20 -> 공백 등)
-                doc.first_image_path = unquote(src)
-                # 이미지 경로에서 폴더명 추출 (예: sample/page_0001/... -> sample)
-                if doc.first_image_path:
-                    parts = doc.first_image_path.split('/')
-                    if len(parts) > 1:
-                        # 첫 번째 의미있는 폴더명을 타이틀 후보로
-                        doc.title = parts[0]
-                break
+        blocks = doc.raw_blocks
+        index = doc.index
 
-        # 2. 첫 번째 heading level 1을 타이틀로
-        for block in doc.raw_blocks:
-            if block.block_type == 'heading':
-                if block.level == 1 and not doc.title:
-                    doc.title = block.content
-                elif block.level == 2 and not doc.subtitle:
-                    doc.subtitle = block.content
+        # 1. 첫 번째 이미지 경로에서 파일명 추출 (타이틀 후보)
+        image = index.first_image
+        if image is not None:
+            src = blocks[image].attributes.get('src', '')
+            # URL 디코딩 (%20 -> 공백 등)
+            doc.first_image_path = unquote(src)
+            # 이미지 경로에서 폴더명 추출 (예: sample/page_0001/... -> sample)
+            if doc.first_image_path:
+                parts = doc.first_image_path.split('/')
+                if len(parts) > 1:
+                    # 첫 번째 의미있는 폴더명을 타이틀 후보로
+                    doc.title = parts[0]
+
+        # 2. 첫 번째 heading level 2 이전의 heading level 1을 타이틀로, 첫 heading level 2를 서브타이틀로
+        first_h2 = index.first_heading(2)
+        if not doc.title:
+            for position in index.heading_positions(1):
+                if first_h2 is not None and position > first_h2:
+                    break
+                doc.title = blocks[position].content
+                if doc.title:
                     break
+        if first_h2 is not None:
+            doc.subtitle = blocks[first_h2].content
 
         # 3. heading이 없으면 첫 번째 굵은 텍스트(**...**)를 타이틀로
-        if not doc.title:
-            for block in doc.raw_blocks:
-                if block.block_type == 'paragraph':
-                    # 볼드 서식이 전체인 경우
-                    bold_formats = [f for f in block.inline_formats if f['format'] == 'bold']
-                    if bold_formats:
-                        first_bold = bold_formats[0]
-                        if first_bold['start'] == 0 and first_bold['end'] == len(block.content):
-                            doc.title = block.content
-                            break
-
-    def _organize_sections(self, blocks: List[ContentBlock]) -> List[Section]:
-        """블록들을 섹션으로 구조화"""
-        sections = []
-        current_section = None
+        if not doc.title and index.bold_paragraphs:
+            doc.title = blocks[index.bold_paragraphs[0]].content
 
-        for block in blocks:
-            if block.block_type == 'heading' and block.level <= 2:
-                # 새 섹션 시작
-                if current_section:
-                    sections.append(current_section)
-                current_section = Section(
-                    heading=block.content,
-                    level=block.level,
-                    blocks=[]
-                )
-            else:
-                if current_section is None:
-                    current_section = Section(heading='', level=0, blocks=[])
-                current_section.blocks.append(block)
-
-        if current_section:
-            sections.append(current_section)
+    def _organize_sections(
+        self, blocks: List[ContentBlock], index: Optional[DocumentIndex] = None
+    ) -> List[Section]:
+        """블록들을 섹션으로 구조화 (H1/H2 위치로 구간만 계산, 블록은 복사하지 않음)"""
+        if index is None:
+            index = DocumentIndex.build(blocks)
+
+        sections = []
+        starts = index.section_starts
+        block_count = len(blocks)
+
+        # 첫 H1/H2 이전 블록은 제목 없는 섹션으로
+        first_start = starts[0] if starts else block_count
+        if first_start > 0:
+            sections.append(Section(heading='', level=0, start=0, end=first_start, source=blocks))
+
+        for k, position in enumerate(starts):
+            end = starts[k + 1] if k + 1 < len(starts) else block_count
+            heading = blocks[position]
+            sections.append(Section(
+                heading=heading.content,
+                level=heading.level,
+                start=position + 1,
+                end=end,
+                source=blocks,
+            ))
 
         return sections
 
 
+# 기본 무시 패턴은 임포트 시점에 컴파일
+_compile_preprocess_patterns(tuple(MarkdownParser.IGNORE_PATTERNS))
+
+
 if __name__ == '__main__':
     import sys
     import json
@@ -494,7 +1203,7 @@ if __name__ == '__main__':
 
     for i, section in enumerate(doc.sections[:5]):
         print(f"\n  Section {i+1}: {section.heading or '(no heading)'}")
-        print(f"    Blocks: {len(section.blocks)}")
+        print(f"    Blocks: {len(section)}")
         for block in section.blocks[:3]:
             preview = block.content[:50] + '...' if len(block.content) > 50 else block.content
             print(f"      - [{block.block_type}] {preview}")
@@ -0,0 +1,441 @@
+"""
+본문 OOXML 직접 기록기 (DocxGenerator 빠른 경로)
+
+- python-docx 프록시(add_paragraph/add_run/run.font.*) 없이 w:p/w:r/w:rPr 요소를 본문에 바로 추가
+- 문단 스타일은 문서별 해결 표(StyleTable)에서 스타일별 한 번만 해결해 w:pStyle로 설정
+- run 서식은 (스타일 서식 값, 인라인 서식)별로 미리 만든 w:rPr 템플릿을 복제해 붙임 (RunPropertiesCache)
+- 길이/크기 변환도 python-docx 단순 타입 변환기를 그대로 사용 -> 기존 경로와 같은 XML 바이트
+- 지원: 헤딩/문단/리스트 항목/인용문/코드/수평선 문단, 표 (이미지는 기존 python-docx 경로)
+- 삽입 위치: 기본은 본문 끝, insert_before(anchor) 안에서는 기준 요소(섹션 브레이크 문단 등) 바로 앞
+- 표는 행 데이터에서 w:tbl 전체를 한 번에 구성 (build_table, 행/셀 프록시 목록 재구성 없음)
+
+사용 예:
+    writer = OoxmlBodyWriter(doc)
+    writer.add_paragraph('본문', mapped_style, inline_formats)
+    add_table(doc, [(['이름', '값'], True), (['a', '1'], False)])
+"""
+
+from contextlib import contextmanager
+from copy import deepcopy
+from typing import Dict, Optional, Sequence, Tuple
+
+from lxml import etree
+
+from docx.oxml.ns import qn
+from docx.oxml.parser import OxmlElement
+from docx.oxml.simpletypes import ST_HpsMeasure, ST_SignedTwipsMeasure
+from docx.shared import Emu, Inches, Length, Pt, RGBColor
+
+from .inline_renderer import CODE_FONT_NAME, CODE_FONT_SIZE_PT, runs_from_spans
+from .markdown_parser import InlineFormats
+from .style_mapper import MappedStyle
+from .style_table import StyleTable
+
+_P = qn('w:p')
+_PPR = qn('w:pPr')
+_PSTYLE = qn('w:pStyle')
+_IND = qn('w:ind')
+_JC = qn('w:jc')
+_R = qn('w:r')
+_RPR = qn('w:rPr')
+_RFONTS = qn('w:rFonts')
+_B = qn('w:b')
+_I = qn('w:i')
+_STRIKE = qn('w:strike')
+_COLOR = qn('w:color')
+_SZ = qn('w:sz')
+_T = qn('w:t')
+_TAB = qn('w:tab')
+_BR = qn('w:br')
+_VAL = qn('w:val')
+_LEFT = qn('w:left')
+_ASCII = qn('w:ascii')
+_HANSI = qn('w:hAnsi')
+_EAST_ASIA = qn('w:eastAsia')
+_XML_SPACE = qn('xml:space')
+_SECT_PR = qn('w:sectPr')
+_TBL_PR = qn('w:tblPr')
+_TBL_STYLE = qn('w:tblStyle')
+_TBL_W = qn('w:tblW')
+_TBL_LOOK = qn('w:tblLook')
+_TBL_GRID = qn('w:tblGrid')
+_GRID_COL = qn('w:gridCol')
+_TR = qn('w:tr')
+_TR_PR = qn('w:trPr')
+_TBL_HEADER = qn('w:tblHeader')
+_TC = qn('w:tc')
+_TC_PR = qn('w:tcPr')
+_TC_W = qn('w:tcW')
+_W = qn('w:w')
+_TYPE = qn('w:type')
+
+# MappedStyle.alignment -> w:jc 값 (DocxGenerator와 같은 매핑)
+_JC_VALUES = {'left': 'left', 'center': 'center', 'right': 'right', 'both': 'both'}
+
+# 코드 블록/수평선 (DocxGenerator._add_code_block/_add_horizontal_rule과 같은 값)
+CODE_BLOCK_FONT_SIZE_PT = 9
+CODE_BLOCK_INDENT = Inches(0.3)
+HORIZONTAL_RULE_TEXT = '─' * 50
+
+# 표 스타일 (템플릿에 없으면 스타일 없이 추가)
+TABLE_STYLE_NAME = 'Table Grid'
+
+# python-docx CT_Tbl.new_tbl과 같은 표 속성
+_TBL_LOOK_ATTRS = {
+    qn('w:firstColumn'): '1', qn('w:firstRow'): '1', qn('w:lastColumn'): '0',
+    qn('w:lastRow'): '0', qn('w:noHBand'): '0', qn('w:noVBand'): '1', _VAL: '04A0',
+}
+
+_CODE_SIZE = ST_HpsMeasure.convert_to_xml(Pt(CODE_FONT_SIZE_PT))
+_CODE_BLOCK_SIZE = ST_HpsMeasure.convert_to_xml(Pt(CODE_BLOCK_FONT_SIZE_PT))
+
+
+def append_to_body(body, element):
+    """본문 끝(본문 sectPr 앞)에 요소 추가 (python-docx CT_Body._insert_p/_insert_tbl과 같은 위치)"""
+    # 본문 sectPr은 보통 마지막 자식 - 앞에서부터 찾지 않음
+    sect_pr = body[-1] if len(body) else None
+    if sect_pr is None or sect_pr.tag != _SECT_PR:
+        sect_pr = body.find(_SECT_PR)
+    if sect_pr is not None:
+        sect_pr.addprevious(element)
+    else:
+        body.append(element)
+    return element
+
+
+def insert_block(body, element, anchor=None):
+    """anchor 바로 앞에 요소 추가 (anchor가 없거나 본문의 직접 자식이 아니면 본문 끝)"""
+    if anchor is not None and anchor.getparent() is body:
+        anchor.addprevious(element)
+        return element
+    return append_to_body(body, element)
+
+
+def _add_text(r, text: str):
+    """run.text 설정과 같은 변환 (탭 -> w:tab, 줄바꿈 -> w:br, 앞뒤 공백은 xml:space)"""
+    start = 0
+    for i, char in enumerate(text):
+        if char == '\t' or char == '\n' or char == '\r':
+            if i > start:
+                _add_t(r, text[start:i])
+            r.append(r.makeelement(_TAB if char == '\t' else _BR, {}))
+            start = i + 1
+    if start < len(text):
+        _add_t(r, text[start:] if start else text)
+
+
+def _add_t(r, text: str):
+    t = r.makeelement(_T, {})
+    t.text = text
+    if len(text.strip()) < len(text):
+        t.set(_XML_SPACE, 'preserve')
+    r.append(t)
+
+
+class _RunProps:
+    """run 하나의 직접 서식 (python-docx에서 설정하는 순서대로 누적)"""
+
+    __slots__ = ('font', 'east_asia', 'bold', 'italic', 'strike', 'color', 'size')
+
+    def __init__(self):
+        self.font: Optional[str] = None       # rFonts ascii/hAnsi
+        self.east_asia: Optional[str] = None
+        self.bold = False
+        self.italic = False
+        self.strike = False
+        self.color: Optional[str] = None
+        self.size: Optional[str] = None       # 반 포인트 문자열
+
+
+def _color_value(color_rgb: Optional[str]) -> Optional[str]:
+    """MappedStyle.color_rgb -> w:color 값 (auto/잘못된 값은 None)"""
+    if not color_rgb or color_rgb == 'auto':
+        return None
+    try:
+        color_rgb = color_rgb.lstrip('#')
+        if len(color_rgb) == 6:
+            return str(RGBColor(int(color_rgb[:2], 16), int(color_rgb[2:4], 16), int(color_rgb[4:], 16)))
+    except Exception:
+        pass
+    return None
+
+
+def _build_rpr(props: _RunProps):
+    """_RunProps -> w:rPr 요소 (설정된 서식이 없으면 None)
+
+    자식은 스키마 순서 (python-docx가 만드는 순서와 같음).
+    """
+    children = []
+    if props.font is not None or props.east_asia is not None:
+        attrs = {}
+        if props.font is not None:
+            attrs[_ASCII] = props.font
+            attrs[_HANSI] = props.font
+        if props.east_asia is not None:
+            attrs[_EAST_ASIA] = props.east_asia
+        children.append((_RFONTS, attrs))
+    if props.bold:
+        children.append((_B, {}))
+    if props.italic:
+        children.append((_I, {}))
+    if props.strike:
+        children.append((_STRIKE, {}))
+    if props.color is not None:
+        children.append((_COLOR, {_VAL: props.color}))
+    if props.size is not None:
+        children.append((_SZ, {_VAL: props.size}))
+    if not children:
+        return None
+    rpr = OxmlElement('w:rPr')
+    for tag, attrs in children:
+        rpr.append(rpr.makeelement(tag, attrs))
+    return rpr
+
+
+def _code_block_rpr():
+    props = _RunProps()
+    props.font = CODE_FONT_NAME
+    props.size = _CODE_BLOCK_SIZE
+    return _build_rpr(props)
+
+
+_CODE_BLOCK_RPR = _code_block_rpr()
+
+
+class RunPropertiesCache:
+    """
+    (MappedStyle 서식 값, 인라인 서식) -> 미리 만든 w:rPr 템플릿
+
+    run마다 글꼴/크기/굵게/색상을 하나씩 설정하는 대신 템플릿 복제 한 번으로 서식 적용.
+    색상 hex 해석과 크기 변환도 템플릿을 만들 때 한 번만 함.
+    결과는 DocxGenerator가 python-docx로 기본 서식 -> 인라인 서식 순서로 설정한 rPr와 같음.
+
+    사용 예:
+        cache = RunPropertiesCache()
+        key = cache.style_key(mapped_style)          # 문단마다 한 번
+        cache.apply(run._r, key, bold=True)          # run마다 복제 한 번
+    """
+
+    def __init__(self):
+        self._templates: Dict[Tuple, object] = {}
+
+    @staticmethod
+    def style_key(style: MappedStyle) -> Tuple:
+        """run 서식에 영향을 주는 스타일 값 (값이 같으면 다른 MappedStyle 객체도 템플릿 공유)"""
+        if not style.apply_direct:
+            return (False, None, None, None, None, style.color_rgb)
+        return (True, style.font_name, style.font_size_pt, style.bold, style.italic, style.color_rgb)
+
+    def template(self, style_key: Tuple, bold: bool = False, italic: bool = False,
+                 strike: bool = False, code: bool = False):
+        """w:rPr 템플릿 (서식이 없으면 None) - 복제해서 사용"""
+        key = (style_key, bold, italic, strike, code)
+        try:
+            return self._templates[key]
+        except KeyError:
+            pass
+
+        apply_direct, font_name, font_size_pt, style_bold, style_italic, color_rgb = style_key
+        props = _RunProps()
+        if apply_direct:
+            if font_name:
+                props.font = font_name
+                props.east_asia = font_name
+            if font_size_pt:
+                props.size = ST_HpsMeasure.convert_to_xml(Pt(font_size_pt))
+            props.bold = bool(style_bold)
+            props.italic = bool(style_italic)
+        props.color = _color_value(color_rgb)
+        props.bold = props.bold or bold
+        props.italic = props.italic or italic
+        props.strike = strike
+        if code:
+            props.font = CODE_FONT_NAME
+            props.size = _CODE_SIZE
+
+        rpr = self._templates[key] = _build_rpr(props)
+        return rpr
+
+    def apply(self, r, style_key: Tuple, bold: bool = False, italic: bool = False,
+              strike: bool = False, code: bool = False):
+        """run 요소 r의 맨 앞에 w:rPr 복제본 삽입 (r에는 아직 rPr가 없어야 함)"""
+        rpr = self.template(style_key, bold, italic, strike, code)
+        if rpr is not None:
+            r.insert(0, deepcopy(rpr))
+
+
+class OoxmlBodyWriter:
+    """
+    문서 본문 끝(마지막 sectPr 앞)에 문단 요소를 직접 추가
+
+    결과 XML은 DocxGenerator의 python-docx 경로와 같음.
+    """
+
+    def __init__(self, doc, styles: Optional[StyleTable] = None,
+                 run_props: Optional[RunPropertiesCache] = None):
+        """
+        Args:
+            styles: 문서의 스타일 해결 표 (없으면 새로 만듦)
+            run_props: w:rPr 템플릿 캐시 (문서 사이에 공유 가능, 없으면 새로 만듦)
+        """
+        self.doc = doc
+        self.styles = styles if styles is not None else StyleTable.from_document(doc)
+        self.run_props = run_props if run_props is not None else RunPropertiesCache()
+        self._body = doc.element.body
+        # 새 블록을 이 요소 앞에 삽입 (None이면 본문 끝)
+        self.anchor = None
+
+    # --- 요소 생성 ---
+
+    @contextmanager
+    def insert_before(self, anchor):
+        """
+        with 블록 안에서 추가하는 문단/표는 anchor 앞에 순서대로 삽입
+
+        표지(첫 섹션 브레이크 앞)처럼 본문 중간 위치에 쓸 때 사용. anchor가 None이면 본문 끝.
+        """
+        previous, self.anchor = self.anchor, anchor
+        try:
+            yield self
+        finally:
+            self.anchor = previous
+
+    def _new_paragraph(self):
+        """현재 삽입 위치에 빈 w:p 추가"""
+        body = self._body
+        return insert_block(body, body.makeelement(_P, {}), self.anchor)
+
+    @staticmethod
+    def _ppr(p):
+        ppr = p.find(_PPR)
+        if ppr is None:
+            ppr = p.makeelement(_PPR, {})
+            p.insert(0, ppr)
+        return ppr
+
+    def _add_run(self, p, text: str, rpr):
+        """rpr: 복제해 붙일 w:rPr 템플릿 (None이면 서식 없음)"""
+        r = p.makeelement(_R, {})
+        p.append(r)
+        if rpr is not None:
+            r.append(deepcopy(rpr))
+        if text:
+            _add_text(r, text)
+        return r
+
+    # --- 블록 ---
+
+    def add_paragraph(self, text: str, style: MappedStyle,
+                      inline_formats: Optional[InlineFormats] = None):
+        """DocxGenerator._add_paragraph_with_style(target_para 없음)와 같은 문단 추가, w:p 반환"""
+        style_id = self.styles.resolve(style)
+        p = self._new_paragraph()
+        templates = self.run_props
+        key = templates.style_key(style)
+
+        if inline_formats:
+            for item in runs_from_spans(text, inline_formats):
+                rpr = templates.template(key, item.bold, item.italic, item.strike, item.code)
+                self._add_run(p, item.text, rpr)
+        else:
+            self._add_run(p, text, templates.template(key))
+
+        jc = _JC_VALUES.get(style.alignment) if style.alignment else None
+        if style_id is not None or jc:
+            ppr = self._ppr(p)
+            if style_id is not None:
+                ppr.append(ppr.makeelement(_PSTYLE, {_VAL: style_id}))
+            if jc:
+                ppr.append(ppr.makeelement(_JC, {_VAL: jc}))
+        return p
+
+    def set_left_indent(self, p, length):
+        """paragraph_format.left_indent 설정 (w:ind는 pStyle 뒤, jc 앞)"""
+        ppr = self._ppr(p)
+        ind = ppr.makeelement(_IND, {_LEFT: ST_SignedTwipsMeasure.convert_to_xml(length)})
+        jc = ppr.find(_JC)
+        if jc is not None:
+            jc.addprevious(ind)
+        else:
+            ppr.append(ind)
+
+    def add_code_block(self, text: str):
+        """DocxGenerator._add_code_block과 같은 문단"""
+        p = self._new_paragraph()
+        self._add_run(p, text, _CODE_BLOCK_RPR)
+        self.set_left_indent(p, CODE_BLOCK_INDENT)
+        return p
+
+    def add_horizontal_rule(self):
+        """DocxGenerator._add_horizontal_rule과 같은 문단"""
+        p = self._new_paragraph()
+        self._add_run(p, HORIZONTAL_RULE_TEXT, None)
+        self._ppr(p).append(p.makeelement(_JC, {_VAL: 'center'}))
+        return p
+
+    def add_table(self, rows: Sequence[Tuple[Sequence[str], bool]]):
+        """표 추가 (스타일은 TABLE_STYLE_NAME을 문서 해결 표에서 찾음), w:tbl 반환"""
+        return add_table(self.doc, rows, self.styles, anchor=self.anchor)
+
+
+def build_table(rows: Sequence[Tuple[Sequence[str], bool]], width: Length,
+                style_id: Optional[str] = None):
+    """
+    (셀 텍스트 목록, 헤더 행 여부) 목록 -> w:tbl 요소 (행/셀을 한 번씩만 방문)
+
+    python-docx의 doc.add_table() + cell.text 설정과 같은 구조:
+    열 수는 가장 긴 행 기준, 폭은 열마다 균등 분배, 짧은 행의 나머지 셀은 빈 문단.
+    헤더 행은 run 굵게 + w:tblHeader (여러 페이지에 걸친 표에서 머리글 행 반복).
+    """
+    num_cols = max((len(cells) for cells, _ in rows), default=0)
+    col_width = str(Emu(width // num_cols).twips if num_cols else 0)
+
+    tbl = OxmlElement('w:tbl')
+    sub = etree.SubElement
+    tbl_pr = sub(tbl, _TBL_PR)
+    if style_id is not None:
+        sub(tbl_pr, _TBL_STYLE, {_VAL: style_id})
+    sub(tbl_pr, _TBL_W, {_TYPE: 'auto', _W: '0'})
+    sub(tbl_pr, _TBL_LOOK, _TBL_LOOK_ATTRS)
+    grid = sub(tbl, _TBL_GRID)
+    for _ in range(num_cols):
+        sub(grid, _GRID_COL, {_W: col_width})
+
+    # 빈 셀 (tcPr/tcW + 빈 문단) - 셀마다 복제
+    empty_cell = tbl.makeelement(_TC, {})
+    sub(sub(empty_cell, _TC_PR), _TC_W, {_TYPE: 'dxa', _W: col_width})
+    sub(empty_cell, _P)
+    bold = tbl.makeelement(_RPR, {})
+    sub(bold, _B)
+
+    for cells, is_header in rows:
+        tr = sub(tbl, _TR)
+        if is_header:
+            sub(sub(tr, _TR_PR), _TBL_HEADER)
+        for text in cells[:num_cols]:
+            tc = deepcopy(empty_cell)
+            tr.append(tc)
+            r = sub(tc[-1], _R)
+            if is_header:
+                r.append(deepcopy(bold))
+            if text:
+                _add_text(r, text)
+        for _ in range(num_cols - len(cells)):
+            tr.append(deepcopy(empty_cell))
+    return tbl
+
+
+def add_table(doc, rows: Sequence[Tuple[Sequence[str], bool]],
+              styles: Optional[StyleTable] = None, style_name: str = TABLE_STYLE_NAME,
+              anchor=None):
+    """
+    본문 끝(또는 anchor 앞)에 표 추가 (폭은 마지막 구역의 여백 사이, doc.add_table()과 같음), w:tbl 반환
+
+    Args:
+        rows: (셀 텍스트 목록, 헤더 행 여부) 목록
+        styles: 문서의 스타일 해결 표 (없으면 새로 만듦)
+    """
+    if styles is None:
+        styles = StyleTable.from_document(doc)
+    tbl = build_table(rows, doc._block_width, styles.resolve_table(style_name))
+    return insert_block(doc.element.body, tbl, anchor)
@@ -0,0 +1,173 @@
+"""
+페이지 분할 엔진
+
+- document.xml 본문(w:body)의 lxml 요소를 직접 순회 (XML 문자열 직렬화 없음)
+- 미리 컴파일한 XPath로 페이지 나눔 요소 판별
+- 블록 단위(문단/표/콘텐츠 컨트롤) 인덱스 범위로 페이지 구간 생성
+- 요소를 하나씩 넣는 방식(feed)이라 스트리밍 파서에서도 그대로 사용 가능
+
+페이지 나눔 종류:
+- <w:br w:type="page"/>            : 해당 블록 다음에서 나눔
+- <w:sectPr> (문단 속성 내 구역 나눔) : 해당 블록 다음에서 나눔 (continuous 제외)
+- <w:pageBreakBefore/>             : 해당 문단 앞에서 나눔
+- <w:lastRenderedPageBreak/>       : 해당 문단 앞에서 나눔 (Word가 마지막으로 렌더링한 위치)
+앞에서 나누는 경우는 현재 페이지가 비어 있지 않을 때만 적용 (빈 페이지 중복 방지)
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Set
+
+from lxml import etree
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+NS = {'w': W_NS}
+
+_P = f'{{{W_NS}}}p'
+_TBL = f'{{{W_NS}}}tbl'
+_SDT = f'{{{W_NS}}}sdt'
+BLOCK_TAGS = (_P, _TBL, _SDT)
+
+# 런 자식 요소 -> 텍스트 (python-docx Paragraph.text와 같은 규칙)
+_T = f'{{{W_NS}}}t'
+_RUN_CHAR_TEXT = {
+    f'{{{W_NS}}}tab': '\t',
+    f'{{{W_NS}}}ptab': '\t',
+    f'{{{W_NS}}}cr': '\n',
+    f'{{{W_NS}}}noBreakHyphen': '-',
+}
+_BR = f'{{{W_NS}}}br'
+_TYPE = f'{{{W_NS}}}type'
+
+_xp_hard_break = etree.XPath('boolean(.//w:br[@w:type="page"])', namespaces=NS)
+_xp_section_type = etree.XPath('./w:pPr/w:sectPr/w:type/@w:val', namespaces=NS)
+_xp_has_section = etree.XPath('boolean(./w:pPr/w:sectPr)', namespaces=NS)
+_xp_break_before = etree.XPath(
+    'boolean(./w:pPr/w:pageBreakBefore[not(@w:val="0" or @w:val="false" or @w:val="off")]'
+    ' or ./w:r/w:lastRenderedPageBreak or ./w:hyperlink/w:r/w:lastRenderedPageBreak)',
+    namespaces=NS,
+)
+_xp_style_id = etree.XPath('string(./w:pPr/w:pStyle/@w:val)', namespaces=NS)
+_xp_run_content = etree.XPath('./w:r/* | ./w:hyperlink/w:r/*', namespaces=NS)
+
+
+@dataclass
+class PageSpan:
+    """페이지 구간 (블록 인덱스 [start, end))"""
+    start: int
+    end: int
+    styles: List[str] = field(default_factory=list)  # 문단별 스타일 ID (문단 순서)
+    texts: List[str] = field(default_factory=list)   # 비어 있지 않은 문단 텍스트 (앞 30자)
+    paragraph_count: int = 0
+    table_count: int = 0
+
+    @property
+    def block_count(self) -> int:
+        return self.end - self.start
+
+
+def paragraph_text(p: etree._Element) -> str:
+    """문단 텍스트 (런 + 하이퍼링크 내부 런)"""
+    parts = []
+    for child in _xp_run_content(p):
+        tag = child.tag
+        if tag == _T:
+            parts.append(child.text or '')
+        elif tag == _BR:
+            # 페이지/단 나눔은 텍스트 없음, 줄 바꿈만 '\n'
+            if child.get(_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        else:
+            parts.append(_RUN_CHAR_TEXT.get(tag, ''))
+    return ''.join(parts)
+
+
+class PageSegmenter:
+    """
+    본문 블록을 페이지 구간으로 분할
+
+    사용 예:
+        spans = PageSegmenter(default_style_id='a').segment(body)
+
+        # 스트리밍
+        segmenter = PageSegmenter(default_style_id='a')
+        for element in blocks:
+            segmenter.feed(element)
+        spans = segmenter.close()
+    """
+
+    def __init__(self, default_style_id: Optional[str] = None,
+                 paragraph_style_ids: Optional[Set[str]] = None):
+        """
+        Args:
+            default_style_id: pStyle이 없는 문단에 적용되는 기본 문단 스타일 ID
+            paragraph_style_ids: 유효한 문단 스타일 ID (주어지면 없는 ID는 기본 스타일로 간주)
+        """
+        self.default_style_id = default_style_id
+        self.paragraph_style_ids = paragraph_style_ids
+        self.spans: List[PageSpan] = []
+        self._index = 0
+        self._current = PageSpan(0, 0)
+
+    def segment(self, body: etree._Element) -> List[PageSpan]:
+        """w:body 요소 전체 분할"""
+        return self.feed_all(body).close()
+
+    def feed_all(self, elements: Iterable[etree._Element]) -> 'PageSegmenter':
+        for element in elements:
+            self.feed(element)
+        return self
+
+    def feed(self, element: etree._Element):
+        """본문 자식 요소 하나 처리 (문단/표/콘텐츠 컨트롤 외에는 무시)"""
+        tag = element.tag
+        if tag not in BLOCK_TAGS:
+            return
+
+        if tag == _P:
+            if self._current.block_count and _xp_break_before(element):
+                self._break()
+            self._add_paragraph(element)
+        elif tag == _TBL:
+            # 표 내부의 렌더링 위치는 표 단위로 나눌 수 없으므로 무시하고,
+            # 강제 페이지 나눔만 표 다음에서 적용
+            self._current.table_count += 1
+
+        self._index += 1
+        self._current.end = self._index
+
+        if _xp_hard_break(element) or self._ends_section(element):
+            self._break()
+
+    def close(self) -> List[PageSpan]:
+        """남은 블록을 마지막 페이지로 확정하고 전체 구간 반환"""
+        if self._current.block_count:
+            self.spans.append(self._current)
+            self._current = PageSpan(self._index, self._index)
+        return self.spans
+
+    def _break(self):
+        self.spans.append(self._current)
+        self._current = PageSpan(self._index, self._index)
+
+    def _add_paragraph(self, p: etree._Element):
+        span = self._current
+        span.paragraph_count += 1
+
+        style_id = _xp_style_id(p)
+        if not style_id or (self.paragraph_style_ids is not None
+                            and style_id not in self.paragraph_style_ids):
+            style_id = self.default_style_id
+        if style_id:
+            span.styles.append(style_id)
+
+        text = paragraph_text(p).strip()
+        if text:
+            span.texts.append(text[:30])
+
+    @staticmethod
+    def _ends_section(element: etree._Element) -> bool:
+        """문단 속성의 구역 나눔 (continuous가 아니면 다음 페이지에서 시작)"""
+        if element.tag != _P or not _xp_has_section(element):
+            return False
+        section_type = _xp_section_type(element)
+        return not section_type or section_type[0] != 'continuous'
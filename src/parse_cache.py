@@ -0,0 +1,244 @@
+"""
+마크다운 파싱 결과 캐시
+
+- 마크다운 파일 바이트의 SHA-256 + 파서 버전(+ 파서 클래스/무시 패턴)을 키로 사용
+- DocumentStructure(블록, 인라인 서식, 색인, 섹션 경계)를 튜플/바이트로 풀어 압축 인코딩
+- 프로세스 내 LRU(인코딩된 바이트) + 디스크 캐시(개수/전체 크기 상한, LRU 제거) 2단계 구성
+- 적중 시에도 매번 새 객체로 복원하므로 반환된 문서를 수정해도 캐시에 영향 없음
+- 같은 마크다운을 여러 템플릿으로 변환하거나 템플릿만 고쳐 다시 실행할 때 파싱 생략
+
+사용 예:
+    doc = MarkdownParser().parse_file('report.md')   # 기본 캐시 사용
+    set_parse_cache_enabled(False)                   # --no-cache
+"""
+
+import hashlib
+import pickle
+import sys
+from array import array
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .cache import DEFAULT_CACHE_DIR, CacheStats, DiskCache, LRUCache
+from .markdown_parser import (
+    NO_ATTRIBUTES,
+    NO_CHILDREN,
+    NO_FORMATS,
+    PARSER_VERSION,
+    ContentBlock,
+    DocumentIndex,
+    DocumentStructure,
+    InlineFormats,
+    MarkdownParser,
+    Section,
+)
+
+# 인코딩 형식 버전 (튜플 구성이 바뀌면 올림)
+ENCODING_VERSION = 1
+
+# 배열 바이트는 그대로 저장하므로 바이트 순서/항목 크기가 같은 환경에서만 복원
+_ARRAY_LAYOUT = (sys.byteorder, array('I').itemsize)
+
+
+def _encode_block(block: ContentBlock) -> Tuple:
+    """블록 -> (유형, 본문, 레벨, 목록 유형, 자식, 속성, 서식 바이트) - 빈 값은 None"""
+    return (
+        block.block_type,
+        block.content,
+        block.level,
+        block.list_type,
+        tuple(_encode_block(child) for child in block.children) if block.children else None,
+        dict(block.attributes) if block.attributes else None,
+        block.inline_formats.raw.tobytes() if block.inline_formats else None,
+    )
+
+
+def _decode_block(row: Tuple) -> ContentBlock:
+    block_type, content, level, list_type, children, attributes, formats = row
+    return ContentBlock(
+        block_type=block_type,
+        content=content,
+        level=level,
+        list_type=list_type,
+        children=tuple(_decode_block(child) for child in children) if children else NO_CHILDREN,
+        attributes=attributes if attributes else NO_ATTRIBUTES,
+        inline_formats=InlineFormats(_array(formats)) if formats else NO_FORMATS,
+    )
+
+
+def _array(data: bytes) -> array:
+    positions = array('I')
+    positions.frombytes(data)
+    return positions
+
+
+def _encode_index(index: DocumentIndex) -> Tuple:
+    return (
+        index.block_count,
+        {name: positions.tobytes() for name, positions in index.by_type.items()},
+        {level: positions.tobytes() for level, positions in index.headings.items()},
+        index.section_starts.tobytes(),
+        index.bold_paragraphs.tobytes(),
+        index.section_numbers.tobytes(),
+    )
+
+
+def _decode_index(row: Tuple) -> DocumentIndex:
+    block_count, by_type, headings, section_starts, bold_paragraphs, section_numbers = row
+    return DocumentIndex(
+        block_count=block_count,
+        by_type={name: _array(data) for name, data in by_type.items()},
+        headings={level: _array(data) for level, data in headings.items()},
+        section_starts=_array(section_starts),
+        bold_paragraphs=_array(bold_paragraphs),
+        section_numbers=_array(section_numbers),
+    )
+
+
+def encode_document(doc: DocumentStructure) -> bytes:
+    """DocumentStructure -> 캐시용 바이트"""
+    payload = (
+        ENCODING_VERSION,
+        _ARRAY_LAYOUT,
+        (doc.title, doc.subtitle, doc.first_image_path),
+        [_encode_block(block) for block in doc.raw_blocks],
+        _encode_index(doc.index),
+        [(s.heading, s.level, s.start, s.end) for s in doc.sections],
+    )
+    return pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def decode_document(data: bytes) -> DocumentStructure:
+    """캐시용 바이트 -> DocumentStructure (형식이 맞지 않으면 ValueError)"""
+    payload = pickle.loads(data)
+    if not isinstance(payload, tuple) or payload[:2] != (ENCODING_VERSION, _ARRAY_LAYOUT):
+        raise ValueError('지원하지 않는 파싱 캐시 형식입니다')
+    _, _, (title, subtitle, first_image_path), rows, index, sections = payload
+
+    blocks = [_decode_block(row) for row in rows]
+    doc = DocumentStructure(
+        title=title,
+        subtitle=subtitle,
+        first_image_path=first_image_path,
+        raw_blocks=blocks,
+    )
+    doc._index = _decode_index(index)
+    doc.sections = [
+        Section(heading=heading, level=level, start=start, end=end, source=blocks)
+        for heading, level, start, end in sections
+    ]
+    return doc
+
+
+def _read_text(data: bytes) -> str:
+    """open(..., 'r', encoding='utf-8')와 같은 결과 (줄바꿈 통일 포함)"""
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+class ParseCache:
+    """
+    마크다운 파싱 결과 캐시
+
+    파서 클래스와 IGNORE_PATTERNS도 키에 포함하므로 하위 클래스 결과와 섞이지 않음.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_memory_entries: int = 8,
+        max_disk_entries: int = 256,
+        max_disk_bytes: Optional[int] = 256 * 1024 * 1024,
+        use_disk: bool = True,
+    ):
+        """
+        Args:
+            cache_dir: 디스크 캐시 디렉토리 (기본: ~/.cache/md-to-docx/markdown)
+            max_memory_entries: 메모리 캐시 최대 항목 수
+            max_disk_entries: 디스크 캐시 최대 항목 수
+            max_disk_bytes: 디스크 캐시 전체 크기 상한 (None이면 개수만 제한)
+            use_disk: False면 메모리 캐시만 사용
+        """
+        directory = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR / 'markdown'
+        self.memory = LRUCache(max_memory_entries)
+        self.disk = DiskCache(directory, max_disk_entries, max_disk_bytes) if use_disk else None
+        self.stats = CacheStats()
+
+    @staticmethod
+    def key(parser: MarkdownParser, digest: str) -> str:
+        """캐시 키 (파서 버전/클래스/무시 패턴 + 마크다운 해시)"""
+        parser_type = type(parser)
+        ident = (
+            PARSER_VERSION,
+            f'{parser_type.__module__}.{parser_type.__qualname__}',
+            tuple(parser.IGNORE_PATTERNS),
+            digest,
+        )
+        return hashlib.sha256(repr(ident).encode('utf-8')).hexdigest()
+
+    def parse_file(self, parser: MarkdownParser, file_path: str) -> DocumentStructure:
+        """파일을 한 번 읽어 해시 조회, 없으면 parser.parse() 후 저장"""
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        key = self.key(parser, hashlib.sha256(data).hexdigest())
+
+        doc = self._load(key)
+        if doc is not None:
+            return doc
+
+        self.stats.misses += 1
+        doc = parser.parse(_read_text(data))
+        encoded = encode_document(doc)
+        self._remember(key, encoded)
+        if self.disk is not None:
+            self.disk.put(key, encoded)
+        return doc
+
+    def _load(self, key: str) -> Optional[DocumentStructure]:
+        encoded = self.memory.get(key)
+        if encoded is not None:
+            self.stats.hits += 1
+            return decode_document(encoded)
+
+        if self.disk is None:
+            return None
+        encoded = self.disk.get(key)
+        if not isinstance(encoded, bytes):
+            return None
+        try:
+            doc = decode_document(encoded)
+        except Exception:
+            # 다른 형식/손상된 항목은 미스로 처리 (다음 저장 시 덮어씀)
+            return None
+        self.stats.disk_hits += 1
+        self._remember(key, encoded)
+        return doc
+
+    def _remember(self, key: str, encoded: bytes):
+        self.memory.put(key, encoded)
+        self.stats.evictions = self.memory.evictions + (self.disk.evictions if self.disk else 0)
+
+    def clear(self):
+        """메모리/디스크 캐시 모두 비우기"""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+_default_cache: Optional[ParseCache] = None
+_enabled = True
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """프로세스 공용 파싱 캐시 (꺼져 있으면 None)"""
+    global _default_cache
+    if not _enabled:
+        return None
+    if _default_cache is None:
+        _default_cache = ParseCache()
+    return _default_cache
+
+
+def set_parse_cache_enabled(enabled: bool):
+    """파싱 캐시 사용 여부 (False면 MarkdownParser.parse_file이 매번 파싱)"""
+    global _enabled
+    _enabled = enabled
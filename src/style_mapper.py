@@ -4,12 +4,14 @@
 - 마크다운 문법 → DOCX 스타일 매핑
 - 템플릿의 스타일 정보를 기반으로 동적 매핑
 - 마크다운 특수문자만을 지표로 사용 (하드코딩 텍스트 없음)
+- 블록 이터레이터 순차 매핑 지원 (iter_pages: 앞보기 3블록만 보관)
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
 from .template_analyzer import TemplateStructure, StyleInfo
-from .markdown_parser import ContentBlock, DocumentStructure, Section
+from .markdown_parser import SECTION_NUMBER_RE, ContentBlock, DocumentStructure, Section
 
 
 @dataclass
@@ -43,6 +45,31 @@ class MappedBlock:
     page_type: str = 'body'  # 이 블록이 속할 페이지 유형
 
 
+# 섹션 번호 다음에서 섹션 제목을 찾는 앞보기 블록 수
+SECTION_TITLE_LOOKAHEAD = 3
+
+
+def with_lookahead(
+    blocks: Iterable[ContentBlock], size: int
+) -> Iterator[Tuple[int, ContentBlock, List[ContentBlock]]]:
+    """(인덱스, 블록, 다음 최대 size개 블록) 순차 생성 - 이터레이터에서 size개만 미리 읽음"""
+    it = iter(blocks)
+    upcoming = deque()
+    for block in it:
+        upcoming.append(block)
+        if len(upcoming) > size:
+            break
+
+    index = 0
+    while upcoming:
+        block = upcoming.popleft()
+        for next_block in it:
+            upcoming.append(next_block)
+            break
+        yield index, block, list(upcoming)
+        index += 1
+
+
 class StyleMapper:
     """마크다운 → DOCX 스타일 매핑
 
@@ -83,7 +110,25 @@ class StyleMapper:
 
     def map_document(self, doc: DocumentStructure) -> List[PageContent]:
         """전체 문서 매핑 - 페이지 유형별 콘텐츠 분리"""
-        pages = []
+        return list(self.iter_pages(doc))
+
+    def iter_pages(
+        self,
+        doc: DocumentStructure,
+        blocks: Optional[Iterable[ContentBlock]] = None,
+        max_body_blocks: Optional[int] = None,
+    ) -> Iterator[PageContent]:
+        """
+        페이지 순차 매핑
+
+        Args:
+            doc: 문서 정보 (타이틀/서브타이틀/표지 판단에 사용)
+            blocks: 매핑할 블록 (없으면 doc.raw_blocks, 이터레이터 가능)
+            max_body_blocks: body 페이지를 이 블록 수마다 끊어서 내보냄
+                (연속된 body 페이지는 이어서 렌더링되므로 결과 문서는 같음)
+        """
+        if blocks is None:
+            blocks = doc.raw_blocks
 
         # 템플릿에 Cover 스타일(Title, Subtitle)이 있는지 확인
         has_cover_styles = self._has_cover_styles()
@@ -95,7 +140,7 @@ class StyleMapper:
         # 1. Cover 페이지 (템플릿에 Cover 스타일이 있을 때만 생성)
         if has_cover_styles:
             title_text = self._extract_title(doc)
-            subtitle_text = self._extract_subtitle(doc)
+            subtitle_text = self._extract_subtitle(doc, title_text)
 
             cover = PageContent(page_type='cover', blocks=[])
 
@@ -116,13 +161,16 @@ class StyleMapper:
                 ))
 
             if cover.blocks:
-                pages.append(cover)
+                yield cover
 
         # 2. 본문 페이지들 - 엄격한 필터링
+        # 문서 자체 블록을 매핑할 때는 파싱 시 만든 색인으로 섹션 번호 판단
+        section_positions = set(doc.index.section_numbers) if blocks is doc.raw_blocks else None
+
         current_body = PageContent(page_type='body', blocks=[])
         skip_next_heading = False  # 섹션 번호 다음 제목 스킵용
 
-        for i, block in enumerate(doc.raw_blocks):
+        for i, block, upcoming in with_lookahead(blocks, SECTION_TITLE_LOOKAHEAD):
             # Cover에서 이미 사용된 콘텐츠 스킵 (Cover가 있을 때만)
             if has_cover_styles and self._is_title_block(block, title_text, subtitle_text):
                 continue
@@ -132,11 +180,14 @@ class StyleMapper:
                 continue
 
             # 섹션 헤드라인 감지 (숫자만 있는 문단)
-            section_number = self._extract_section_number(block)
+            if section_positions is not None:
+                section_number = i in section_positions
+            else:
+                section_number = self._extract_section_number(block)
             if section_number:
                 # 현재 body 저장
                 if current_body.blocks:
-                    pages.append(current_body)
+                    yield current_body
                     current_body = PageContent(page_type='body', blocks=[])
 
                 # 섹션 페이지 생성
@@ -150,7 +201,7 @@ class StyleMapper:
                 ))
 
                 # 다음 블록이 섹션 제목인지 확인
-                next_title = self._get_section_title(doc.raw_blocks, i)
+                next_title = self._get_section_title(upcoming)
                 if next_title:
                     title_block = ContentBlock(
                         block_type='heading',
@@ -164,7 +215,7 @@ class StyleMapper:
                     ))
                     skip_next_heading = True
 
-                pages.append(section_page)
+                yield section_page
                 continue
 
             # 섹션 제목으로 이미 처리된 경우 스킵
@@ -177,12 +228,13 @@ class StyleMapper:
             mapped = self._map_block(block)
             if mapped:
                 current_body.blocks.append(mapped)
+                if max_body_blocks and len(current_body.blocks) >= max_body_blocks:
+                    yield current_body
+                    current_body = PageContent(page_type='body', blocks=[])
 
         # 마지막 body 페이지 추가
         if current_body.blocks:
-            pages.append(current_body)
-
-        return pages
+            yield current_body
 
     def _extract_title(self, doc: DocumentStructure) -> str:
         """타이틀 추출 - 이미지 경로에서 폴더명 우선, 없으면 첫 heading"""
@@ -196,23 +248,24 @@ class StyleMapper:
                         return part
 
         # 2. 첫 heading 1
-        for block in doc.raw_blocks:
-            if block.block_type == 'heading' and block.level == 1:
-                return block.content
+        first_h1 = doc.index.first_heading(1)
+        if first_h1 is not None:
+            return doc.raw_blocks[first_h1].content
 
         # 3. doc.title 사용
         return doc.title or ''
 
-    def _extract_subtitle(self, doc: DocumentStructure) -> str:
+    def _extract_subtitle(self, doc: DocumentStructure, title: Optional[str] = None) -> str:
         """서브타이틀 추출 - 첫 heading (타이틀이 이미지 경로인 경우)"""
-        title = self._extract_title(doc)
+        if title is None:
+            title = self._extract_title(doc)
 
         # 이미지 경로에서 타이틀을 추출한 경우, 첫 heading을 subtitle로 사용
         if doc.first_image_path and title:
             # 첫 heading 2를 subtitle로
-            for block in doc.raw_blocks:
-                if block.block_type == 'heading' and block.level == 2:
-                    return block.content
+            first_h2 = doc.index.first_heading(2)
+            if first_h2 is not None:
+                return doc.raw_blocks[first_h2].content
 
         return doc.subtitle or ''
 
@@ -227,23 +280,21 @@ class StyleMapper:
 
     def _extract_section_number(self, block: ContentBlock) -> Optional[str]:
         """섹션 번호 추출 (숫자만 있는 문단)"""
-        import re
         if block.block_type != 'paragraph':
             return None
 
         text = block.content.strip()
 
         # 1자리 또는 2자리 숫자만
-        if re.match(r'^0?\d$', text):
+        if SECTION_NUMBER_RE.match(text):
             return text
 
         return None
 
-    def _get_section_title(self, blocks: List[ContentBlock], current_idx: int) -> Optional[str]:
-        """섹션 번호 다음의 섹션 제목 추출"""
+    def _get_section_title(self, upcoming: List[ContentBlock]) -> Optional[str]:
+        """섹션 번호 다음의 섹션 제목 추출 (upcoming: 섹션 번호 다음 블록들)"""
         # 다음 몇 개 블록에서 제목 찾기
-        for j in range(current_idx + 1, min(current_idx + 4, len(blocks))):
-            next_block = blocks[j]
+        for next_block in upcoming[:SECTION_TITLE_LOOKAHEAD]:
             if next_block.block_type == 'image':
                 continue
             if next_block.block_type in ('heading', 'paragraph'):
@@ -259,11 +310,8 @@ class StyleMapper:
         if not self.available_styles:
             return False
 
-        cover_style_names = {'Title', 'Subtitle', 'af0', 'ae'}
-        for style_name in self.available_styles:
-            if style_name in cover_style_names:
-                return True
-        return False
+        cover_style_ids = ('Title', 'Subtitle', 'af0', 'ae')
+        return any(style_id in self.available_styles for style_id in cover_style_ids)
 
     def _is_section_title_candidate(self, block: ContentBlock) -> bool:
         """섹션 제목 후보인지 확인"""
@@ -394,16 +442,11 @@ class StyleMapper:
         return style
 
     def _find_best_style(self, candidates: List[str]) -> Optional[MappedStyle]:
-        """후보 중에서 템플릿에 있는 스타일 찾기"""
-        for candidate in candidates:
-            # style_id로 먼저 찾기
-            if candidate in self.available_styles:
-                style_info = self.available_styles[candidate]
-                return self._style_info_to_mapped(style_info)
-
-            # name으로 찾기
-            for style_id, style_info in self.available_styles.items():
-                if style_info.name.lower() == candidate.lower():
+        """후보 중에서 템플릿에 있는 스타일 찾기 (style_id -> 이름 -> 현지화 별칭)"""
+        if self.template:
+            for candidate in candidates:
+                style_info = self.template.find_style(candidate)
+                if style_info:
                     return self._style_info_to_mapped(style_info)
 
         # 템플릿에 없으면 기본 스타일 반환
@@ -0,0 +1,128 @@
+"""
+스타일 상속 해결기
+
+- basedOn 그래프를 위상 정렬하여 부모부터 한 번씩만 해결 (해결된 부모를 그대로 재사용)
+- 순환 참조는 명시적으로 검출하여 순환을 만드는 연결만 끊고 기록
+- 연결된 문자 스타일(w:link)은 짝 문단 스타일의 런 속성을 상속
+- docDefaults(rPrDefault/pPrDefault)는 모든 체인의 마지막 기본값으로 적용
+"""
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .template_analyzer import StyleInfo
+
+# 런 속성 (rPr)
+RUN_ATTRS = ('font_name', 'font_size_pt', 'bold', 'italic', 'color_rgb')
+
+# 문단 속성 (pPr)
+PARAGRAPH_ATTRS = (
+    'alignment', 'space_before_pt', 'space_after_pt', 'line_spacing',
+    'left_indent_pt', 'outline_level',
+)
+
+INHERITED_ATTRS = RUN_ATTRS + PARAGRAPH_ATTRS
+
+# 스타일 유형별 docDefaults 적용 범위
+DEFAULT_ATTRS_BY_TYPE = {
+    'paragraph': INHERITED_ATTRS,
+    'table': INHERITED_ATTRS,
+    'character': RUN_ATTRS,
+}
+
+_VISITING, _DONE = 1, 2
+
+
+class StyleResolver:
+    """
+    스타일 유효 속성 계산
+
+    사용 예:
+        resolver = StyleResolver(structure.styles, doc_defaults)
+        resolver.resolve()      # styles의 StyleInfo를 제자리에서 채움
+        resolver.cycles         # [['A', 'B', 'A'], ...]
+    """
+
+    def __init__(self, styles: Dict[str, 'StyleInfo'], doc_defaults: Optional['StyleInfo'] = None):
+        """
+        Args:
+            styles: style_id -> StyleInfo (직접 지정된 값만 채워진 상태)
+            doc_defaults: docDefaults에서 읽은 기본 속성
+        """
+        self.styles = styles
+        self.doc_defaults = doc_defaults
+        self.cycles: List[List[str]] = []
+        self._broken: Set[Tuple[str, str]] = set()
+
+    def _parents(self, style: 'StyleInfo') -> List[str]:
+        """먼저 해결되어야 하는 스타일 (basedOn, 문자 스타일의 link)"""
+        parents = []
+        if style.base_style in self.styles:
+            parents.append(style.base_style)
+        if style.style_type == 'character' and style.linked_style in self.styles:
+            parents.append(style.linked_style)
+        return parents
+
+    def order(self) -> List[str]:
+        """부모가 자식보다 먼저 오는 style_id 순서 (순환 연결은 끊고 기록)"""
+        order: List[str] = []
+        state: Dict[str, int] = {}
+
+        for root in self.styles:
+            if root in state:
+                continue
+
+            state[root] = _VISITING
+            path = [root]
+            stack = [iter(self._parents(self.styles[root]))]
+
+            while stack:
+                node = path[-1]
+                parent = next(stack[-1], None)
+                if parent is None:
+                    stack.pop()
+                    path.pop()
+                    state[node] = _DONE
+                    order.append(node)
+                elif parent not in state:
+                    state[parent] = _VISITING
+                    path.append(parent)
+                    stack.append(iter(self._parents(self.styles[parent])))
+                elif state[parent] == _VISITING:
+                    self.cycles.append(path[path.index(parent):] + [parent])
+                    self._broken.add((node, parent))
+
+        return order
+
+    def resolve(self) -> Dict[str, 'StyleInfo']:
+        """모든 스타일의 상속 속성을 한 번에 채움"""
+        order = self.order()
+
+        for style_id in order:
+            style = self.styles[style_id]
+
+            base = style.base_style
+            if base in self.styles and (style_id, base) not in self._broken:
+                self._fill(style, self.styles[base], INHERITED_ATTRS)
+
+            link = style.linked_style
+            if (style.style_type == 'character' and link in self.styles
+                    and (style_id, link) not in self._broken):
+                self._fill(style, self.styles[link], RUN_ATTRS)
+
+        # docDefaults는 체인 전체보다 우선순위가 낮으므로 마지막에 적용
+        if self.doc_defaults is not None:
+            for style_id in order:
+                style = self.styles[style_id]
+                attrs = DEFAULT_ATTRS_BY_TYPE.get(style.style_type, ())
+                self._fill(style, self.doc_defaults, attrs)
+
+        return self.styles
+
+    @staticmethod
+    def _fill(style: 'StyleInfo', source: 'StyleInfo', attrs: Tuple[str, ...]):
+        for attr in attrs:
+            if getattr(style, attr) is None:
+                value = getattr(source, attr)
+                if value is not None:
+                    setattr(style, attr, value)
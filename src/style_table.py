@@ -0,0 +1,108 @@
+"""
+문서별 스타일 해결 표
+
+- 문서 styles 파트를 한 번 훑어 이름/ID -> 스타일 표를 만들고 스타일마다 한 번만 해결
+- 조회 규칙은 python-docx get_style_id와 같음 (UI 이름 변환, 이름 -> ID 순서, 유형 확인, 기본 스타일은 생략)
+- 해결된 스타일 ID는 호출 측에서 w:pStyle/w:tblStyle로 바로 설정 (문단/표마다 스타일 파트 조회/예외 재시도 없음)
+- 찾지 못한 스타일은 문서당 한 번만 경고하고 unresolved에 기록
+
+사용 예:
+    styles = StyleTable.from_document(doc)
+    style_id = styles.resolve(mapped_style)          # 문단 스타일, None이면 pStyle 없음
+    table_style_id = styles.resolve_table('Table Grid')
+"""
+
+import warnings
+from typing import Dict, List, Optional, Tuple
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+from docx.styles import BabelFish
+
+from .style_mapper import MappedStyle
+
+_STYLE = qn('w:style')
+
+# 해결 결과가 아직 없음을 나타내는 표시 (None은 '스타일 없음'으로 해결된 상태)
+_MISSING = object()
+
+
+class StyleTable:
+    """
+    문서 하나의 스타일 해결 표
+
+    결과를 (스타일 유형, 이름, ID)마다 기억하므로 문단/표 수와 무관하게 스타일 수만큼만 조회.
+    """
+
+    def __init__(self, styles_element):
+        """
+        Args:
+            styles_element: 문서 styles 파트의 w:styles 요소 (doc.styles.element)
+        """
+        self._by_name: Dict[str, object] = {}
+        self._by_id: Dict[str, object] = {}
+        self._defaults: Dict[WD_STYLE_TYPE, object] = {}
+        for style in styles_element.iterchildren(_STYLE):
+            name = style.name_val
+            if name is not None:
+                self._by_name.setdefault(name, style)
+            if style.styleId is not None:
+                self._by_id.setdefault(style.styleId, style)
+            if style.default:
+                self._defaults[style.type] = style  # 스펙상 유형별 마지막 기본 스타일
+
+        self._resolved: Dict[Tuple, Optional[str]] = {}
+        self.unresolved: List[Tuple[Optional[str], ...]] = []
+
+    @classmethod
+    def from_document(cls, doc) -> 'StyleTable':
+        return cls(doc.styles.element)
+
+    def _lookup(self, key: str, style_type: WD_STYLE_TYPE):
+        """이름(UI 이름 변환 포함) -> ID 순서로 스타일 요소 조회, 없거나 유형이 다르면 None"""
+        style = self._by_name.get(BabelFish.ui2internal(key))
+        if style is None:
+            style = self._by_id.get(key)
+        if style is None or style.type != style_type:
+            return None
+        return style
+
+    def _resolve(self, style_type: WD_STYLE_TYPE, candidates: Tuple[Optional[str], ...]) -> Optional[str]:
+        """candidates를 순서대로 시도, 기본 스타일이거나 모두 실패하면 None (실패는 한 번만 경고)"""
+        key = (style_type,) + candidates
+        style_id = self._resolved.get(key, _MISSING)
+        if style_id is not _MISSING:
+            return style_id
+
+        found = None
+        for candidate in candidates:
+            if candidate:
+                found = self._lookup(candidate, style_type)
+                if found is not None:
+                    break
+
+        if found is None:
+            style_id = None
+            if any(candidates):
+                self.unresolved.append(candidates)
+                kind = '문단' if style_type == WD_STYLE_TYPE.PARAGRAPH else '표'
+                warnings.warn(
+                    f"{kind} 스타일을 찾을 수 없어 스타일 없이 추가합니다: "
+                    + ', '.join(repr(c) for c in candidates),
+                    stacklevel=3,
+                )
+        elif found is self._defaults.get(style_type):
+            style_id = None
+        else:
+            style_id = found.styleId
+
+        self._resolved[key] = style_id
+        return style_id
+
+    def resolve(self, style: MappedStyle) -> Optional[str]:
+        """w:pStyle에 넣을 문단 스타일 ID (style_name, style_id 순서로 시도)"""
+        return self._resolve(WD_STYLE_TYPE.PARAGRAPH, (style.style_name, style.style_id))
+
+    def resolve_table(self, name: str) -> Optional[str]:
+        """w:tblStyle에 넣을 표 스타일 ID"""
+        return self._resolve(WD_STYLE_TYPE.TABLE, (name,))
@@ -5,21 +5,57 @@ DOCX 템플릿 분석기
 - 스타일 정보 추출 (폰트, 크기, 색상, 상속 관계)
 - 배경 이미지 추출 및 분류
 - 헤더/푸터 구조 분석
+- 스트리밍 모드: iterparse로 styles.xml/document.xml을 한 번 훑으며 요소를 즉시 해제
+  (본문이 아주 큰 템플릿에서도 메모리 사용량이 본문 크기와 무관)
 """
 
-from docx import Document
 from docx.shared import Pt, Inches, Emu, Twips
 from docx.oxml.ns import qn
 from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.simpletypes import ST_SignedTwipsMeasure, ST_TwipsMeasure
 from lxml import etree
-import zipfile
 import os
 import json
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Union
 import re
-from .template_page_analyzer import TemplatePageAnalyzer
+import warnings
+from .template_page_analyzer import TemplatePageAnalyzer, TemplatePageStructure
+from .page_segmenter import PageSegmenter
+from .template_package import TemplatePackage
+from .asset_store import AssetStore, get_asset_store
+from .style_resolver import StyleResolver
+from .cache import file_sha256
+
+# 분석기 버전 (분석 결과 형식이 바뀌면 올려서 캐시 무효화)
+ANALYZER_VERSION = 6
+
+# template_structure.json 형식 버전 (필드 구성이 바뀌면 올림)
+STRUCTURE_SCHEMA_VERSION = 1
+
+# 현지화된 스타일 이름 -> 표준 이름 (소문자, 한글 Word 기준)
+STYLE_NAME_ALIASES = {
+    '제목': 'title',
+    '부제': 'subtitle',
+    '부제목': 'subtitle',
+    '표준': 'normal',
+    '바탕글': 'normal',
+    '본문': 'body text',
+    '인용': 'quote',
+    '강한 인용': 'intense quote',
+    '목록 글머리 기호': 'list bullet',
+    '목록 번호': 'list number',
+    '표 눈금': 'table grid',
+    **{f'제목 {n}': f'heading {n}' for n in range(1, 10)},
+}
+
+
+def canonical_style_name(name: str) -> str:
+    """스타일 이름을 비교용 표준 이름으로 변환 ('제목 1' -> 'heading 1')"""
+    key = name.casefold()
+    return STYLE_NAME_ALIASES.get(key, key)
+
 
 # XML namespaces
 NS = {
@@ -32,6 +68,15 @@ NS = {
 }
 
 
+def _release(elem: etree._Element):
+    """iterparse로 처리한 요소와 앞선 형제 요소 해제 (메모리 유지)"""
+    elem.clear()
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
 @dataclass
 class StyleInfo:
     """스타일 정보"""
@@ -39,6 +84,7 @@ class StyleInfo:
     name: str
     style_type: str  # paragraph, character, table
     base_style: Optional[str] = None
+    linked_style: Optional[str] = None  # 연결 스타일 (w:link, 문단 <-> 문자)
     font_name: Optional[str] = None
     font_size_pt: Optional[float] = None
     bold: Optional[bool] = None
@@ -54,13 +100,19 @@ class StyleInfo:
     def to_dict(self) -> dict:
         return {k: v for k, v in asdict(self).items() if v is not None}
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'StyleInfo':
+        return cls(**data)
+
 
 @dataclass
 class ImageInfo:
     """이미지 정보"""
     name: str
     original_path: str
+    # 에셋 저장소 내 경로 (파일은 TemplateStructure.image_path()를 거쳐야 기록됨)
     extracted_path: str = ''
+    content_hash: str = ''  # 이미지 바이트의 SHA-256
     width_emu: int = 0
     height_emu: int = 0
     position: str = ''  # 'header', 'footer', 'body'
@@ -76,22 +128,38 @@ class ImageInfo:
     def height_inches(self) -> float:
         return self.height_emu / 914400 if self.height_emu else 0
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ImageInfo':
+        return cls(**data)
+
 
 @dataclass
 class PageTemplate:
     """페이지 템플릿 유형"""
     page_type: str  # 'cover', 'section', 'body', 'toc'
+    # 이미지 필드는 ImageInfo.extracted_path 값 (실제 파일은 TemplateStructure.image_path()로 요청)
     background_image: Optional[str] = None
     header_image: Optional[str] = None
     footer_image: Optional[str] = None
     styles_used: List[str] = field(default_factory=list)
     description: str = ''
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PageTemplate':
+        return cls(**data)
+
+
+def default_structure_path(docx_path: str) -> Path:
+    """템플릿 옆 구조 파일 기본 위치 (<이름>_assets/template_structure.json)"""
+    docx_path = Path(docx_path)
+    return docx_path.parent / f"{docx_path.stem}_assets" / 'template_structure.json'
+
 
 @dataclass
 class TemplateStructure:
     """템플릿 전체 구조"""
     file_path: str
+    source_sha256: str = ''  # 분석한 템플릿 바이트의 SHA-256
     page_width_inches: float = 8.27
     page_height_inches: float = 11.69
     margins: Dict[str, float] = field(default_factory=dict)
@@ -108,34 +176,261 @@ class TemplateStructure:
     # 기본 폰트 정보
     default_font: Optional[str] = None
     default_font_size_pt: Optional[float] = None
+    default_paragraph_style: Optional[str] = None  # w:default="1" 문단 스타일 ID
 
     # 테마 색상
     theme_colors: Dict[str, str] = field(default_factory=dict)
 
+    # 스타일 조회 인덱스 (build_style_index()에서 구성)
+    _style_index: Optional[Dict[str, Dict]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # 이미지 경로 기준 에셋 저장소 (None이면 공용 저장소)
+    _asset_store: Optional[AssetStore] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # 이미지 바이트를 읽을 템플릿 패키지 (None이면 image_path()에서 file_path로 열기)
+    _package: Optional[TemplatePackage] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def build_style_index(self):
+        """
+        스타일 조회 인덱스 구성
+
+        - name: 이름(casefold) -> 스타일
+        - alias: 표준 이름('heading 1') -> 현지화 이름 스타일('제목 1')
+        - outline: 개요 수준 -> 스타일
+        같은 키가 여러 번 나오면 styles 순서상 첫 스타일을 사용 (기존 선형 탐색과 동일)
+        """
+        by_name: Dict[str, StyleInfo] = {}
+        by_alias: Dict[str, StyleInfo] = {}
+        by_outline: Dict[int, StyleInfo] = {}
+
+        for style in self.styles.values():
+            by_name.setdefault(style.name.casefold(), style)
+            by_alias.setdefault(canonical_style_name(style.name), style)
+            if style.outline_level is not None:
+                by_outline.setdefault(style.outline_level, style)
+
+        self._style_index = {'name': by_name, 'alias': by_alias, 'outline': by_outline}
+
+    @property
+    def style_index(self) -> Dict[str, Dict]:
+        if self._style_index is None:
+            self.build_style_index()
+        return self._style_index
+
+    def find_style(self, key: str) -> Optional[StyleInfo]:
+        """style_id, 이름, 현지화 별칭 순서로 스타일 찾기"""
+        style = self.styles.get(key)
+        if style is not None:
+            return style
+
+        index = self.style_index
+        style = index['name'].get(key.casefold())
+        if style is not None:
+            return style
+
+        canonical = canonical_style_name(key)
+        return index['name'].get(canonical) or index['alias'].get(canonical)
+
+    def get_style_by_name(self, name: str) -> Optional[StyleInfo]:
+        """이름으로 스타일 찾기 (대소문자 무시)"""
+        return self.style_index['name'].get(name.casefold())
+
     def get_style_by_outline_level(self, level: int) -> Optional[StyleInfo]:
         """개요 수준(outlineLvl)으로 스타일 찾기 - 가장 확실한 방법"""
-        for style in self.styles.values():
-            if style.outline_level == level:
-                return style
-        return None
+        return self.style_index['outline'].get(level)
+
+    @property
+    def asset_store(self) -> AssetStore:
+        return self._asset_store or get_asset_store()
+
+    def __getstate__(self):
+        # 디스크 캐시(pickle)에는 패키지를 넣지 않음 (필요하면 file_path로 다시 열기)
+        state = self.__dict__.copy()
+        state['_package'] = None
+        return state
+
+    def to_dict(self) -> dict:
+        """JSON 저장용 dict (schema_version, source_sha256 포함)"""
+        return {
+            'schema_version': STRUCTURE_SCHEMA_VERSION,
+            'analyzer_version': ANALYZER_VERSION,
+            'source_sha256': self.source_sha256,
+            'file_path': self.file_path,
+            'page_width_inches': self.page_width_inches,
+            'page_height_inches': self.page_height_inches,
+            'margins': self.margins,
+            'default_font': self.default_font,
+            'default_font_size_pt': self.default_font_size_pt,
+            'default_paragraph_style': self.default_paragraph_style,
+            'theme_colors': self.theme_colors,
+            'styles': {k: v.to_dict() for k, v in self.styles.items()},
+            'images': [asdict(img) for img in self.images],
+            'page_templates': {k: asdict(v) for k, v in self.page_templates.items()},
+            'page_structure': asdict(self.page_structure) if self.page_structure else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TemplateStructure':
+        """to_dict() 결과에서 복원 (스키마 버전이 다르면 ValueError)"""
+        version = data.get('schema_version')
+        if version != STRUCTURE_SCHEMA_VERSION:
+            raise ValueError(
+                f"지원하지 않는 구조 파일 스키마 버전: {version} (필요: {STRUCTURE_SCHEMA_VERSION})"
+            )
+
+        page_structure = data.get('page_structure')
+        return cls(
+            file_path=data['file_path'],
+            source_sha256=data.get('source_sha256', ''),
+            page_width_inches=data['page_width_inches'],
+            page_height_inches=data['page_height_inches'],
+            margins=dict(data.get('margins', {})),
+            styles={k: StyleInfo.from_dict(v) for k, v in data.get('styles', {}).items()},
+            images=[ImageInfo.from_dict(img) for img in data.get('images', [])],
+            page_templates={
+                k: PageTemplate.from_dict(v) for k, v in data.get('page_templates', {}).items()
+            },
+            page_structure=TemplatePageStructure.from_dict(page_structure) if page_structure else None,
+            default_font=data.get('default_font'),
+            default_font_size_pt=data.get('default_font_size_pt'),
+            default_paragraph_style=data.get('default_paragraph_style'),
+            theme_colors=dict(data.get('theme_colors', {})),
+        )
+
+    def save(self, output_path: str) -> str:
+        """JSON 파일로 저장"""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return str(output_path)
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        template_path: Optional[str] = None,
+        expected_sha256: Optional[str] = None,
+        asset_store: Optional[AssetStore] = None,
+    ) -> 'TemplateStructure':
+        """
+        JSON 파일에서 로드 (docx 재분석 없음)
+
+        Args:
+            path: template_structure.json 경로
+            template_path: 대상 템플릿 (주어지면 해시를 확인하고 file_path로 사용)
+            expected_sha256: 템플릿 해시를 이미 알고 있으면 전달 (파일 재해시 생략)
+            asset_store: 이미지 경로를 다시 계산할 저장소 (기본: 공용 저장소)
+
+        Raises:
+            ValueError: 스키마 버전이 다르거나 템플릿 해시가 일치하지 않을 때
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            structure = cls.from_dict(json.load(f))
+
+        if expected_sha256 is None and template_path is not None:
+            expected_sha256 = file_sha256(template_path)
+        if expected_sha256 is not None and structure.source_sha256 != expected_sha256:
+            raise ValueError(f"구조 파일이 템플릿 내용과 일치하지 않음: {path}")
+
+        if template_path is not None:
+            structure.file_path = str(template_path)
+
+        # 저장한 환경의 에셋 경로 대신 현재 저장소 기준 경로 사용
+        structure._asset_store = asset_store
+        store = structure.asset_store
+        moved: Dict[str, str] = {}
+        for image in structure.images:
+            if image.content_hash:
+                ext = os.path.splitext(image.original_path)[1]
+                path = str(store.path_for(image.content_hash, ext))
+                moved[image.extracted_path] = path
+                image.extracted_path = path
+
+        # 페이지 템플릿 이미지도 같은 이미지의 새 경로로 교체
+        for template in structure.page_templates.values():
+            for attr in ('background_image', 'header_image', 'footer_image'):
+                path = getattr(template, attr)
+                if path in moved:
+                    setattr(template, attr, moved[path])
+
+        return structure
+
+    def image_path(self, image: Union[ImageInfo, str]) -> str:
+        """
+        이미지 파일 경로 반환 (저장소에 없으면 이때 템플릿에서 추출)
+
+        Args:
+            image: ImageInfo 또는 extracted_path 값 (PageTemplate 이미지 필드)
+        """
+        if isinstance(image, str):
+            image = next((img for img in self.images if img.extracted_path == image), None)
+        if image is None or not image.extracted_path:
+            return ''
+
+        def load() -> bytes:
+            if self._package is None:
+                self._package = TemplatePackage(self.file_path)
+            with self._package.open_part(image.original_path) as f:
+                data = f.read()
+            if image.content_hash and AssetStore.digest(data) != image.content_hash:
+                raise ValueError(f"템플릿 이미지가 분석 이후 변경됨: {image.original_path}")
+            return data
+
+        return self.asset_store.ensure(image.extracted_path, load)
 
 
 class DocxTemplateAnalyzer:
     """DOCX 템플릿을 분석하여 구조 정보 추출"""
 
-    def __init__(self, docx_path: str):
+    def __init__(
+        self,
+        docx_path: str,
+        package: Optional[TemplatePackage] = None,
+        asset_store: Optional[AssetStore] = None,
+        streaming: bool = False,
+    ):
+        """
+        Args:
+            docx_path: DOCX 템플릿 파일 경로
+            package: 공유 템플릿 패키지 (없으면 새로 열기)
+            asset_store: 이미지 저장소 (기본: 공용 캐시 디렉토리)
+            streaming: True면 python-docx 문서를 만들지 않고 iterparse로 분석
+        """
         self.docx_path = Path(docx_path)
-        self.output_dir = self.docx_path.parent / f"{self.docx_path.stem}_assets"
-        self.doc = Document(docx_path)
-        self.structure = TemplateStructure(file_path=str(docx_path))
+        self.output_dir = default_structure_path(docx_path).parent
+        self.package = package or TemplatePackage(docx_path)
+        self.asset_store = asset_store or get_asset_store()
+        self.streaming = streaming
+        self.structure = TemplateStructure(
+            file_path=str(docx_path), source_sha256=self.package.sha256
+        )
+        self.structure._asset_store = self.asset_store
+        self.structure._package = self.package
 
-        # XML 트리 캐시
+        # XML 루트 요소 (패키지에서 공유)
         self._styles_xml = None
         self._document_xml = None
         self._theme_xml = None
 
+        # docDefaults (상속 해결 시 최하위 기본값)
+        self._doc_defaults: Optional[StyleInfo] = None
+
+    @property
+    def doc(self):
+        """공유 python-docx 문서 (스트리밍 모드에서는 사용하지 않음)"""
+        return self.package.document
+
     def analyze(self) -> TemplateStructure:
         """전체 분석 실행"""
+        if self.streaming:
+            return self._analyze_streaming()
+
         self._load_xml_trees()
         self._analyze_page_setup()
         self._analyze_default_fonts()
@@ -147,14 +442,106 @@ class DocxTemplateAnalyzer:
         
         return self.structure
 
+    def _analyze_streaming(self) -> TemplateStructure:
+        """스트리밍 분석 (styles.xml -> document.xml 순서로 한 번씩만 훑음)"""
+        styles_path = self._find_styles_part()
+        if styles_path:
+            self._stream_styles(styles_path)
+        self._finish_styles()
+
+        if self.package.has_part('word/theme/theme1.xml'):
+            self._theme_xml = self.package.xml('word/theme/theme1.xml', load_document=False)
+        self._analyze_theme_colors()
+        self._extract_images()
+
+        # 본문은 요소 단위로 페이지 분할기에 넣고 바로 해제
+        page_analyzer = self._create_page_analyzer()
+        segmenter = page_analyzer.create_segmenter()
+        self._stream_document(segmenter)
+        self._merge_page_result(page_analyzer.analyze(segmenter.close()))
+
+        return self.structure
+
+    def _stream_styles(self, styles_path: str):
+        """styles.xml 스트리밍 파싱 (w:style, w:docDefaults 단위)"""
+        tags = (qn('w:style'), qn('w:docDefaults'))
+        with self.package.open_part(styles_path) as f:
+            for _, elem in etree.iterparse(f, events=('end',), tag=tags, huge_tree=True):
+                if elem.tag == tags[0]:
+                    self._add_style(elem)
+                else:
+                    self._apply_doc_defaults(elem)
+                _release(elem)
+
+    def _stream_document(self, segmenter: PageSegmenter):
+        """document.xml 스트리밍 파싱 (첫 구역 속성 + 본문 블록 페이지 분할)"""
+        section_found = False
+        body_tag = qn('w:body')
+        sect_pr_tag = qn('w:sectPr')
+        tags = (qn('w:p'), qn('w:tbl'), qn('w:sdt'), sect_pr_tag)
+        with self.package.open_part('word/document.xml') as f:
+            for _, elem in etree.iterparse(f, events=('end',), tag=tags, huge_tree=True):
+                parent = elem.getparent()
+                if parent is None or parent.tag != body_tag:
+                    continue
+
+                # w:document > w:body > (본문 블록)
+                if not section_found:
+                    if elem.tag == sect_pr_tag:
+                        sect_pr = elem
+                    else:
+                        sect_pr = elem.find('w:pPr/w:sectPr', NS)
+                    if sect_pr is not None:
+                        self._apply_section_properties(sect_pr)
+                        section_found = True
+
+                segmenter.feed(elem)
+                _release(elem)
+
+    def _apply_section_properties(self, sect_pr: etree._Element):
+        """w:sectPr의 페이지 크기/여백 반영 (python-docx Section과 같은 변환)"""
+        def inches(elem, attr, simple_type):
+            if elem is None:
+                return None
+            val = elem.get(qn(attr))
+            return simple_type.convert_from_xml(val).inches if val is not None else None
+
+        pg_sz = sect_pr.find('w:pgSz', NS)
+        width = inches(pg_sz, 'w:w', ST_TwipsMeasure)
+        height = inches(pg_sz, 'w:h', ST_TwipsMeasure)
+        if width is not None:
+            self.structure.page_width_inches = width
+        if height is not None:
+            self.structure.page_height_inches = height
+
+        pg_mar = sect_pr.find('w:pgMar', NS)
+        margins = {
+            side: inches(pg_mar, f'w:{side}', ST_SignedTwipsMeasure)
+            for side in ('left', 'right', 'top', 'bottom')
+        }
+        self.structure.margins = {k: v for k, v in margins.items() if v is not None}
+
+    def _create_page_analyzer(self) -> TemplatePageAnalyzer:
+        """페이지 분석기 생성 (스트리밍 모드에서는 분석한 스타일 정보를 사용)"""
+        if self.streaming:
+            return TemplatePageAnalyzer(
+                str(self.docx_path),
+                package=self.package,
+                styles=self.structure.styles,
+                default_style_id=self.structure.default_paragraph_style,
+            )
+        return TemplatePageAnalyzer(str(self.docx_path), package=self.package)
+
     def _run_page_analysis(self):
         """페이지 구조 분석기 실행 및 결과 통합"""
         # 1. 페이지 분석기 인스턴스 생성 (범용 버전 사용)
-        page_analyzer = TemplatePageAnalyzer(str(self.docx_path))
+        page_analyzer = self._create_page_analyzer()
         
         # 2. 분석 실행 (동적 스타일 감지 포함)
-        page_result = page_analyzer.analyze()
-        
+        self._merge_page_result(page_analyzer.analyze())
+
+    def _merge_page_result(self, page_result: TemplatePageStructure):
+        """페이지 분석 결과를 메인 구조체에 통합"""
         # 3. 결과를 메인 구조체에 저장
         self.structure.page_structure = page_result
         
@@ -190,63 +577,56 @@ class DocxTemplateAnalyzer:
             )
              
     def _load_xml_trees(self):
-        """XML 파일들을 메모리에 로드 (OPC 관계 추적 방식)"""
-        with zipfile.ZipFile(self.docx_path, 'r') as zf:
-            # styles.xml: .rels 파일을 통해 경로 추적
-            styles_path = self._find_styles_xml_via_rels(zf)
-            if styles_path:
-                with zf.open(styles_path) as f:
-                    self._styles_xml = etree.parse(f)
-            else:
-                # 폴백: 표준 경로 시도
-                for fallback in ['word/styles.xml', 'word/styles2.xml']:
-                    if fallback in zf.namelist():
-                        with zf.open(fallback) as f:
-                            self._styles_xml = etree.parse(f)
-                        break
-
-            # document.xml
-            if 'word/document.xml' in zf.namelist():
-                with zf.open('word/document.xml') as f:
-                    self._document_xml = etree.parse(f)
-
-            # theme1.xml
-            if 'word/theme/theme1.xml' in zf.namelist():
-                with zf.open('word/theme/theme1.xml') as f:
-                    self._theme_xml = etree.parse(f)
-
-    def _find_styles_xml_via_rels(self, zf: zipfile.ZipFile) -> Optional[str]:
-        """OPC 관계 파일을 통해 styles.xml 경로 추적"""
-        try:
-            # word/document.xml의 관계 파일 확인
-            rels_path = 'word/_rels/document.xml.rels'
-            if rels_path not in zf.namelist():
-                return None
-
-            with zf.open(rels_path) as f:
-                rels_tree = etree.parse(f)
-                rels_ns = {'rel': 'http://schemas.openxmlformats.org/package/2006/relationships'}
+        """XML 파트 로드 (OPC 관계 추적 방식, 패키지에서 한 번만 파싱)"""
+        # styles.xml
+        styles_path = self._find_styles_part()
+        if styles_path:
+            self._styles_xml = self.package.xml(styles_path)
+
+        # document.xml
+        if self.package.has_part('word/document.xml'):
+            self._document_xml = self.package.xml('word/document.xml')
+
+        # theme1.xml
+        if self.package.has_part('word/theme/theme1.xml'):
+            self._theme_xml = self.package.xml('word/theme/theme1.xml')
+
+    def _find_styles_part(self) -> Optional[str]:
+        """styles.xml 파트 이름 (.rels 관계 추적, 없으면 표준 경로)"""
+        styles_path = self._find_styles_xml_via_rels()
+        if styles_path:
+            return styles_path
+
+        # 폴백: 표준 경로 시도
+        for fallback in ['word/styles.xml', 'word/styles2.xml']:
+            if self.package.has_part(fallback):
+                return fallback
+        return None
 
+    def _find_styles_xml_via_rels(self) -> Optional[str]:
+        """OPC 관계를 통해 styles.xml 경로 추적"""
+        try:
+            # word/document.xml의 관계 확인
+            rels = self.package.rels('word/document.xml', load_document=not self.streaming)
+            for _, rel_type, target, is_external in rels:
                 # Type이 styles인 Relationship 찾기
-                for rel in rels_tree.findall('.//rel:Relationship', rels_ns):
-                    rel_type = rel.get('Type', '')
-                    if 'styles' in rel_type.lower():
-                        target = rel.get('Target', '')
-                        if target:
-                            # Target 경로 정규화:
-                            # "/word/styles2.xml" -> "word/styles2.xml"
-                            # "styles.xml" -> "word/styles.xml"
-                            # "../styles.xml" -> "word/styles.xml"
-                            target = target.lstrip('/')  # 절대 경로 표시 제거
-                            if not target.startswith('word/'):
-                                # 상대 경로인 경우 word/ 기준으로 해석
-                                target = target.lstrip('../')
-                                styles_path = f"word/{target}"
-                            else:
-                                styles_path = target
-
-                            if styles_path in zf.namelist():
-                                return styles_path
+                if is_external or 'styles' not in rel_type.lower() or not target:
+                    continue
+
+                # Target 경로 정규화:
+                # "/word/styles2.xml" -> "word/styles2.xml"
+                # "styles.xml" -> "word/styles.xml"
+                # "../styles.xml" -> "word/styles.xml"
+                target = target.lstrip('/')  # 절대 경로 표시 제거
+                if not target.startswith('word/'):
+                    # 상대 경로인 경우 word/ 기준으로 해석
+                    target = target.lstrip('../')
+                    styles_path = f"word/{target}"
+                else:
+                    styles_path = target
+
+                if self.package.has_part(styles_path):
+                    return styles_path
         except Exception:
             pass
 
@@ -269,73 +649,81 @@ class DocxTemplateAnalyzer:
         if self._styles_xml is None:
             return
 
-        root = self._styles_xml.getroot()
-
         # docDefaults에서 기본 폰트 추출
-        doc_defaults = root.find('.//w:docDefaults', NS)
-        if doc_defaults is not None:
-            rpr_default = doc_defaults.find('.//w:rPrDefault/w:rPr', NS)
-            if rpr_default is not None:
-                # 폰트
-                fonts = rpr_default.find('w:rFonts', NS)
-                if fonts is not None:
-                    self.structure.default_font = (
-                        fonts.get(f'{{{NS["w"]}}}ascii') or
-                        fonts.get(f'{{{NS["w"]}}}hAnsi') or
-                        fonts.get(f'{{{NS["w"]}}}eastAsia')
-                    )
-
-                # 크기
-                sz = rpr_default.find('w:sz', NS)
-                if sz is not None:
-                    val = sz.get(f'{{{NS["w"]}}}val')
-                    if val:
-                        self.structure.default_font_size_pt = int(val) / 2
+        self._apply_doc_defaults(self._styles_xml.find('.//w:docDefaults', NS))
+
+    def _apply_doc_defaults(self, doc_defaults: Optional[etree._Element]):
+        """docDefaults를 기본 폰트 정보와 상속 기본값으로 반영"""
+        if doc_defaults is None:
+            return
+
+        self._doc_defaults = self._parse_doc_defaults(doc_defaults)
+        self.structure.default_font = self._doc_defaults.font_name
+        self.structure.default_font_size_pt = self._doc_defaults.font_size_pt
 
     def _analyze_styles_from_xml(self):
         """XML에서 스타일 정보 추출 (상속 관계 포함)"""
         if self._styles_xml is None:
             return
 
-        root = self._styles_xml.getroot()
+        for style_elem in self._styles_xml.findall('.//w:style', NS):
+            self._add_style(style_elem)
 
-        for style_elem in root.findall('.//w:style', NS):
-            style_id = style_elem.get(f'{{{NS["w"]}}}styleId')
-            style_type = style_elem.get(f'{{{NS["w"]}}}type')
+        self._finish_styles()
 
-            if not style_id:
-                continue
+    def _add_style(self, style_elem: etree._Element):
+        """w:style 요소 하나를 StyleInfo로 등록 (상속 해결 전 값)"""
+        style_id = style_elem.get(f'{{{NS["w"]}}}styleId')
+        style_type = style_elem.get(f'{{{NS["w"]}}}type')
 
-            # 이름
-            name_elem = style_elem.find('w:name', NS)
-            name = name_elem.get(f'{{{NS["w"]}}}val') if name_elem is not None else style_id
+        if not style_id:
+            return
 
-            # 기본 스타일
-            based_on = style_elem.find('w:basedOn', NS)
-            base_style = based_on.get(f'{{{NS["w"]}}}val') if based_on is not None else None
+        # 이름
+        name_elem = style_elem.find('w:name', NS)
+        name = name_elem.get(f'{{{NS["w"]}}}val') if name_elem is not None else style_id
 
-            style_info = StyleInfo(
-                style_id=style_id,
-                name=name,
-                style_type=style_type or 'paragraph',
-                base_style=base_style,
-            )
+        # 기본 스타일
+        based_on = style_elem.find('w:basedOn', NS)
+        base_style = based_on.get(f'{{{NS["w"]}}}val') if based_on is not None else None
+
+        # 연결 스타일
+        link = style_elem.find('w:link', NS)
+        linked_style = link.get(f'{{{NS["w"]}}}val') if link is not None else None
+
+        style_info = StyleInfo(
+            style_id=style_id,
+            name=name,
+            style_type=style_type or 'paragraph',
+            base_style=base_style,
+            linked_style=linked_style,
+        )
+
+        # 런 속성 (rPr) - 폰트, 크기, 색상 등
+        rpr = style_elem.find('.//w:rPr', NS)
+        if rpr is not None:
+            self._parse_run_properties(rpr, style_info)
 
-            # 런 속성 (rPr) - 폰트, 크기, 색상 등
-            rpr = style_elem.find('.//w:rPr', NS)
-            if rpr is not None:
-                self._parse_run_properties(rpr, style_info)
+        # 문단 속성 (pPr) - 정렬, 간격 등
+        ppr = style_elem.find('.//w:pPr', NS)
+        if ppr is not None:
+            self._parse_paragraph_properties(ppr, style_info)
 
-            # 문단 속성 (pPr) - 정렬, 간격 등
-            ppr = style_elem.find('.//w:pPr', NS)
-            if ppr is not None:
-                self._parse_paragraph_properties(ppr, style_info)
+        self.structure.styles[style_id] = style_info
 
-            self.structure.styles[style_id] = style_info
+        # 기본 문단 스타일 (여러 개면 마지막 것 - python-docx와 동일)
+        is_default = style_elem.get(f'{{{NS["w"]}}}default') in ('1', 'true', 'on')
+        if is_default and style_info.style_type == 'paragraph':
+            self.structure.default_paragraph_style = style_id
 
+    def _finish_styles(self):
+        """스타일 수집 후 처리 (상속 해결 + 조회 인덱스)"""
         # 스타일 상속 해결 (부모 스타일에서 값 상속)
         self._resolve_style_inheritance()
 
+        # 조회 인덱스 구성
+        self.structure.build_style_index()
+
     def _parse_run_properties(self, rpr: etree._Element, style_info: StyleInfo):
         """런 속성 파싱"""
         # 폰트
@@ -408,47 +796,33 @@ class DocxTemplateAnalyzer:
                 style_info.outline_level = int(val)
 
     def _resolve_style_inheritance(self):
-        """스타일 상속 해결"""
-        def get_inherited_value(style_id: str, attr: str, visited: set = None):
-            if visited is None:
-                visited = set()
-
-            if style_id in visited:
-                return None
-            visited.add(style_id)
-
-            style = self.structure.styles.get(style_id)
-            if not style:
-                return None
+        """스타일 상속 해결 (basedOn, 연결 스타일, docDefaults)"""
+        resolver = StyleResolver(self.structure.styles, self._doc_defaults)
+        resolver.resolve()
 
-            value = getattr(style, attr, None)
-            if value is not None:
-                return value
+        for cycle in resolver.cycles:
+            warnings.warn(f"스타일 상속 순환 무시: {' -> '.join(cycle)}", stacklevel=2)
 
-            if style.base_style:
-                return get_inherited_value(style.base_style, attr, visited)
+    def _parse_doc_defaults(self, doc_defaults: etree._Element) -> StyleInfo:
+        """docDefaults(rPrDefault/pPrDefault)를 StyleInfo로 읽기"""
+        defaults = StyleInfo(style_id='', name='docDefaults', style_type='paragraph')
 
-            return None
+        rpr = doc_defaults.find('w:rPrDefault/w:rPr', NS)
+        if rpr is not None:
+            self._parse_run_properties(rpr, defaults)
 
-        # 각 스타일에 대해 상속값 적용
-        attrs_to_inherit = [
-            'font_name', 'font_size_pt', 'bold', 'italic', 'color_rgb',
-            'alignment', 'space_before_pt', 'space_after_pt', 'line_spacing'
-        ]
+        ppr = doc_defaults.find('w:pPrDefault/w:pPr', NS)
+        if ppr is not None:
+            self._parse_paragraph_properties(ppr, defaults)
 
-        for style_id, style in self.structure.styles.items():
-            for attr in attrs_to_inherit:
-                if getattr(style, attr) is None and style.base_style:
-                    inherited = get_inherited_value(style.base_style, attr)
-                    if inherited is not None:
-                        setattr(style, attr, inherited)
+        return defaults
 
     def _analyze_theme_colors(self):
         """테마 색상 분석"""
         if self._theme_xml is None:
             return
 
-        root = self._theme_xml.getroot()
+        root = self._theme_xml
         theme_ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
 
         # 주요 색상 추출
@@ -467,53 +841,36 @@ class DocxTemplateAnalyzer:
                     self.structure.theme_colors[color_name] = sys_clr.get('lastClr', '')
 
     def _extract_images(self):
-        """이미지 추출"""
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-        with zipfile.ZipFile(self.docx_path, 'r') as zf:
-            # 이미지 파일 추출
-            image_paths = {}
-            for name in zf.namelist():
-                if name.startswith('word/media/'):
-                    image_name = os.path.basename(name)
-                    output_path = self.output_dir / image_name
-                    with zf.open(name) as src:
-                        with open(output_path, 'wb') as dst:
-                            dst.write(src.read())
-                    image_paths[name] = str(output_path)
-
-            # 헤더에서 이미지 정보 추출
-            self._parse_header_footer_images(zf, 'header', image_paths)
-
-            # 푸터에서 이미지 정보 추출
-            self._parse_header_footer_images(zf, 'footer', image_paths)
-
-    def _parse_header_footer_images(self, zf: zipfile.ZipFile, part_type: str, image_paths: dict):
+        """이미지 정보 수집 (파일 기록은 TemplateStructure.image_path() 요청 시로 지연)"""
+        # 미디어 파트 -> 내용 해시
+        image_paths = {}
+        for name in self.package.namelist():
+            if name.startswith('word/media/'):
+                with self.package.open_part(name) as f:
+                    image_paths[name] = self.asset_store.digest_stream(f)
+
+        # 헤더에서 이미지 정보 추출
+        self._parse_header_footer_images('header', image_paths)
+
+        # 푸터에서 이미지 정보 추출
+        self._parse_header_footer_images('footer', image_paths)
+
+    def _parse_header_footer_images(self, part_type: str, image_paths: dict):
         """헤더/푸터에서 이미지 정보 추출"""
-        # 관련 파일 찾기
-        for name in zf.namelist():
+        # 관련 파트 찾기
+        for name in self.package.namelist():
             if name.startswith(f'word/{part_type}') and name.endswith('.xml'):
-                rels_path = name.replace('.xml', '.xml.rels').replace('word/', 'word/_rels/')
-
-                # 관계 파일에서 이미지 매핑
+                # 관계에서 이미지 매핑
                 rels_map = {}
-                if rels_path in zf.namelist():
-                    with zf.open(rels_path) as f:
-                        rels_tree = etree.parse(f)
-                        for rel in rels_tree.getroot():
-                            rel_id = rel.get('Id')
-                            target = rel.get('Target')
-                            if target and 'image' in target.lower():
-                                full_path = f"word/{target.lstrip('../')}"
-                                rels_map[rel_id] = full_path
-
-                # XML 파싱하여 이미지 정보 추출
-                with zf.open(name) as f:
-                    tree = etree.parse(f)
-                    root = tree.getroot()
-
-                    for drawing in root.iter(f'{{{NS["w"]}}}drawing'):
-                        self._parse_drawing(drawing, part_type, rels_map, image_paths)
+                for rel_id, _, target, _ in self.package.rels(name, load_document=not self.streaming):
+                    if target and 'image' in target.lower():
+                        full_path = f"word/{target.lstrip('../')}"
+                        rels_map[rel_id] = full_path
+
+                # XML에서 이미지 정보 추출
+                root = self.package.xml(name, load_document=not self.streaming)
+                for drawing in root.iter(f'{{{NS["w"]}}}drawing'):
+                    self._parse_drawing(drawing, part_type, rels_map, image_paths)
 
     def _parse_drawing(self, drawing: etree._Element, position: str,
                        rels_map: dict, image_paths: dict):
@@ -540,7 +897,11 @@ class DocxTemplateAnalyzer:
             embed_id = blip.get(f'{{{NS["r"]}}}embed')
             if embed_id and embed_id in rels_map:
                 original_path = rels_map[embed_id]
-                extracted_path = image_paths.get(original_path, '')
+                content_hash = image_paths.get(original_path, '')
+                extracted_path = ''
+                if content_hash:
+                    ext = os.path.splitext(original_path)[1]
+                    extracted_path = str(self.asset_store.path_for(content_hash, ext))
 
                 # 페이지 유형 추정
                 is_full_page = width_emu > 7000000 and height_emu > 10000000
@@ -555,6 +916,7 @@ class DocxTemplateAnalyzer:
                     name=os.path.basename(original_path),
                     original_path=original_path,
                     extracted_path=extracted_path,
+                    content_hash=content_hash,
                     width_emu=width_emu,
                     height_emu=height_emu,
                     position=position,
@@ -610,33 +972,13 @@ class DocxTemplateAnalyzer:
 
     def get_style_by_name(self, name: str) -> Optional[StyleInfo]:
         """이름으로 스타일 찾기"""
-        for style in self.structure.styles.values():
-            if style.name.lower() == name.lower():
-                return style
-        return None
+        return self.structure.get_style_by_name(name)
 
     def save_structure(self, output_path: Optional[str] = None) -> str:
-        """구조 정보를 JSON으로 저장"""
+        """구조 정보를 JSON으로 저장 (TemplateStructure.load()로 다시 읽을 수 있음)"""
         if output_path is None:
-            output_path = self.output_dir / 'template_structure.json'
-
-        data = {
-            'file_path': self.structure.file_path,
-            'page_width_inches': self.structure.page_width_inches,
-            'page_height_inches': self.structure.page_height_inches,
-            'margins': self.structure.margins,
-            'default_font': self.structure.default_font,
-            'default_font_size_pt': self.structure.default_font_size_pt,
-            'theme_colors': self.structure.theme_colors,
-            'styles': {k: v.to_dict() for k, v in self.structure.styles.items()},
-            'images': [asdict(img) for img in self.structure.images],
-            'page_templates': {k: asdict(v) for k, v in self.structure.page_templates.items()},
-        }
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-        return str(output_path)
+            output_path = default_structure_path(self.docx_path)
+        return self.structure.save(output_path)
 
     def print_summary(self):
         """분석 결과 요약 출력"""
@@ -689,4 +1031,4 @@ if __name__ == '__main__':
     analyzer.analyze()
     analyzer.print_summary()
     output = analyzer.save_structure()
-    print(f"\n✅ 저장: {output}")
\ No newline at end of file
+    print(f"\n✅ 저장: {output}")
@@ -0,0 +1,243 @@
+"""
+템플릿 OPC 패키지 (공유용)
+
+- 템플릿 zip 파일은 한 번만 읽어서 멤버 바이트를 메모리에 보관
+- python-docx 패키지도 같은 바이트에서 구성 (zip 재오픈 없음)
+- 각 XML 파트는 처음 접근할 때 한 번만 파싱 (python-docx가 로드한 파트는 그대로 재사용)
+- 분석기/파서/조립기가 같은 인스턴스를 공유하도록 설계
+- 대용량 파트는 open_part()로 zip에서 직접 스트리밍 (멤버 전체를 메모리에 올리지 않음)
+"""
+
+import hashlib
+import io
+import zipfile
+from copy import deepcopy
+from pathlib import Path
+from typing import IO, Dict, List, Optional, Tuple
+
+from docx.document import Document as DocumentObject
+from docx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from docx.opc.oxml import parse_xml
+from docx.opc.package import Unmarshaller
+from docx.opc.packuri import PACKAGE_URI, CONTENT_TYPES_URI, PackURI
+from docx.opc.part import PartFactory, XmlPart
+from docx.opc.pkgreader import PackageReader, _ContentTypeMap
+from docx.package import Package
+from lxml import etree
+
+RELS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+
+def clone_document(document: DocumentObject) -> DocumentObject:
+    """
+    문서 사본 (XML 파트는 트리 복사, 바이너리 파트는 공유)
+
+    이미지/폰트 등 XmlPart가 아닌 파트는 저장 시 blob만 읽히므로
+    deepcopy memo에 미리 넣어 원본 객체를 그대로 재사용
+    """
+    memo = {
+        id(part): part
+        for part in document.part.package.iter_parts()
+        if not isinstance(part, XmlPart)
+    }
+    return deepcopy(document, memo)
+
+
+class _MemoryPkgReader:
+    """python-docx PhysPkgReader 인터페이스를 메모리의 멤버 바이트로 구현"""
+
+    def __init__(self, blobs: Dict[str, bytes]):
+        self._blobs = blobs
+
+    def blob_for(self, pack_uri: PackURI) -> bytes:
+        return self._blobs[pack_uri.membername]
+
+    @property
+    def content_types_xml(self) -> bytes:
+        return self.blob_for(CONTENT_TYPES_URI)
+
+    def rels_xml_for(self, source_uri: PackURI) -> Optional[bytes]:
+        return self._blobs.get(source_uri.rels_uri.membername)
+
+    def close(self):
+        pass
+
+
+class TemplatePackage:
+    """
+    템플릿 DOCX 패키지
+
+    사용 예:
+        package = TemplatePackage('template.docx')
+        analyzer = DocxTemplateAnalyzer('template.docx', package=package)
+        parser = TemplateParser('template.docx', package=package)
+
+    document는 여러 소비자가 공유하므로 읽기 전용으로 사용해야 하며,
+    수정이 필요하면 clone_document()로 사본을 받아서 사용.
+    """
+
+    def __init__(self, docx_path: str):
+        self.path = Path(docx_path)
+        self.blob = self.path.read_bytes()
+        self.sha256 = hashlib.sha256(self.blob).hexdigest()
+
+        # zip 멤버 (처음 접근할 때 한 번만 읽음)
+        self._members: Optional[Dict[str, bytes]] = None
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._document: Optional[DocumentObject] = None
+        self._pristine: Optional[DocumentObject] = None
+        self._parts: Dict[str, object] = {}
+        self._xml: Dict[str, etree._Element] = {}
+
+        # 계측용 카운터
+        self.zip_reads = 0
+        self.parse_counts: Dict[str, int] = {}
+
+    @property
+    def parse_count(self) -> int:
+        """전체 파트 파싱 횟수"""
+        return sum(self.parse_counts.values())
+
+    # --- zip 멤버 ---
+
+    @property
+    def zip(self) -> zipfile.ZipFile:
+        """템플릿 바이트 위의 zip (목록 조회/스트리밍용, 멤버는 읽지 않음)"""
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(io.BytesIO(self.blob), 'r')
+        return self._zip
+
+    @property
+    def members(self) -> Dict[str, bytes]:
+        """zip 멤버 이름 -> 바이트 (zip 순서 유지)"""
+        if self._members is None:
+            zf = self.zip
+            self._members = {name: zf.read(name) for name in zf.namelist()}
+            self.zip_reads += 1
+        return self._members
+
+    def namelist(self) -> List[str]:
+        return self.zip.namelist()
+
+    def has_part(self, name: str) -> bool:
+        try:
+            self.zip.getinfo(self._member_name(name))
+        except KeyError:
+            return False
+        return True
+
+    def open_part(self, name: str) -> IO[bytes]:
+        """파트 바이트 스트림 (멤버를 이미 읽었으면 메모리에서, 아니면 zip에서 직접)"""
+        name = self._member_name(name)
+        if self._members is not None:
+            return io.BytesIO(self._members[name])
+        return self.zip.open(name)
+
+    def part_blob(self, name: str) -> Optional[bytes]:
+        """파트 원본 바이트 (없으면 None)"""
+        return self.members.get(self._member_name(name))
+
+    # --- python-docx 문서 ---
+
+    @property
+    def document(self) -> DocumentObject:
+        """공유 python-docx 문서 (읽기 전용으로 사용)"""
+        if self._document is None:
+            self._document = self._load_document()
+        return self._document
+
+    def _load_document(self) -> DocumentObject:
+        """
+        메모리의 멤버 바이트로 python-docx 패키지 구성
+
+        PackageReader._srels_for / _load_serialized_parts, _ContentTypeMap은 python-docx 내부 API이므로
+        pyproject에서 python-docx를 검증한 범위(>=1.2.0,<1.3)로 고정. 올릴 때는 tests/를 다시 확인할 것.
+        """
+        phys_reader = _MemoryPkgReader(self.members)
+        content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
+        pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+        sparts = PackageReader._load_serialized_parts(phys_reader, pkg_srels, content_types)
+        pkg_reader = PackageReader(content_types, pkg_srels, sparts)
+
+        package = Package()
+        Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+
+        # python-docx가 로드 시점에 파싱한 XML 파트 기록
+        for part in package.iter_parts():
+            name = part.partname.membername
+            self._parts[name] = part
+            if isinstance(part, XmlPart):
+                self._xml[name] = part.element
+                self.parse_counts[name] = self.parse_counts.get(name, 0) + 1
+
+        document = package.main_document_part.document
+
+        # python-docx는 읽기 접근에도 요소를 추가하는 경우가 있으므로
+        # (예: section.header.paragraphs) 소비자에게 넘기기 전 원본을 보관
+        self._pristine = deepcopy(document)
+        return document
+
+    def clone_document(self) -> DocumentObject:
+        """수정 가능한 문서 사본 (zip 재오픈/재파싱 없이 원본 트리 복사)"""
+        self.document
+        return clone_document(self._pristine)
+
+    # --- 파트 접근 ---
+
+    def part(self, name: str, load_document: bool = True):
+        """
+        python-docx Part 객체 (관계 그래프에 없는 파트면 None)
+
+        load_document=False면 문서를 새로 로드하지 않음 (로드 전이면 None)
+        """
+        if load_document:
+            self.document
+        return self._parts.get(self._member_name(name))
+
+    def xml(self, name: str, load_document: bool = True) -> Optional[etree._Element]:
+        """
+        파트의 XML 루트 요소 (처음 접근할 때 한 번만 파싱)
+
+        load_document=False면 python-docx 문서를 로드하지 않고 해당 파트만 파싱
+        (스트리밍 분석용, 문서가 이미 로드되어 있으면 그 요소를 그대로 사용)
+        """
+        name = self._member_name(name)
+        if load_document:
+            self.document
+        if name not in self._xml:
+            if not self.has_part(name):
+                return None
+            with self.open_part(name) as f:
+                self._xml[name] = parse_xml(f.read())
+            self.parse_counts[name] = self.parse_counts.get(name, 0) + 1
+        return self._xml[name]
+
+    def rels(self, name: str, load_document: bool = True) -> List[Tuple[str, str, str, bool]]:
+        """
+        파트의 관계 목록 (rId, reltype, target, is_external)
+
+        python-docx가 로드한 파트는 이미 해석된 관계를 사용하고,
+        그 외 파트는 .rels XML을 파싱하여 반환
+        """
+        name = self._member_name(name)
+        part = self.part(name, load_document)
+        if part is not None:
+            return [
+                (rel.rId, rel.reltype, rel.target_ref, rel.is_external)
+                for rel in part.rels.values()
+            ]
+
+        rels_name = PackURI('/' + name).rels_uri.membername
+        root = self.xml(rels_name, load_document)
+        if root is None:
+            return []
+        return [
+            (rel.get('Id'), rel.get('Type', ''), rel.get('Target', ''),
+             rel.get('TargetMode') == RTM.EXTERNAL)
+            for rel in root.findall(f'{{{RELS_NS}}}Relationship')
+        ]
+
+    @staticmethod
+    def _member_name(name: str) -> str:
+        """'/word/styles.xml' -> 'word/styles.xml'"""
+        return name.lstrip('/')
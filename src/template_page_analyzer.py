@@ -7,10 +7,14 @@
 - 스타일 이름이 달라도 텍스트 분량 등으로 표지를 추측하는 휴리스틱 추가
 """
 
-from docx import Document
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set
+from typing import Any, List, Dict, Optional, Set
+
+from docx.enum.style import WD_STYLE_TYPE
+
+from .template_package import TemplatePackage
+from .page_segmenter import PageSegmenter, PageSpan
 
 @dataclass
 class PageInfo:
@@ -30,13 +34,45 @@ class TemplatePageStructure:
     section_pages: List[int] = field(default_factory=list)
     body_start_page: Optional[int] = None
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TemplatePageStructure':
+        """asdict() 결과에서 복원"""
+        return cls(
+            pages=[PageInfo(**page) for page in data.get('pages', [])],
+            cover_page=data.get('cover_page'),
+            toc_page=data.get('toc_page'),
+            section_pages=list(data.get('section_pages', [])),
+            body_start_page=data.get('body_start_page'),
+        )
+
 
 class TemplatePageAnalyzer:
     """템플릿 페이지 구조 분석 (동적 매핑 적용)"""
 
-    def __init__(self, docx_path: str):
+    # 찾고자 하는 표준 이름 패턴 (소문자 기준)
+    TARGET_PATTERNS = {
+        'cover': ['title', 'subtitle', 'cover title', '제목', '부제목'],
+        'toc': ['toc', 'table of contents', '목차', '차례'],
+        'section': ['heading 1', '제목 1', 'part title', 'section'],
+        'body': ['normal', 'body text', '본문', '바탕글', 'list paragraph']
+    }
+
+    def __init__(
+        self,
+        docx_path: str,
+        package: Optional[TemplatePackage] = None,
+        styles: Optional[Dict[str, Any]] = None,
+        default_style_id: Optional[str] = None,
+    ):
+        """
+        Args:
+            docx_path: DOCX 템플릿 파일 경로
+            package: 공유 템플릿 패키지 (없으면 새로 열기)
+            styles: 이미 분석한 스타일 (style_id -> StyleInfo, 주어지면 python-docx 문서 미사용)
+            default_style_id: styles와 함께 쓰는 기본 문단 스타일 ID
+        """
         self.docx_path = Path(docx_path)
-        self.doc = Document(docx_path)
+        self.package = package or TemplatePackage(docx_path)
         self.structure = TemplatePageStructure()
 
         # 동적으로 채워질 스타일 ID 집합 (초기엔 비어있음)
@@ -45,57 +81,90 @@ class TemplatePageAnalyzer:
         self.section_styles: Set[str] = set()
         self.body_styles: Set[str] = set()
 
+        # 문단 스타일 ID 목록과 기본 문단 스타일 (pStyle 없는 문단용)
+        self.paragraph_style_ids: Set[str] = set()
+        self.default_style_id: Optional[str] = None
+
         # 1. 문서를 스캔하여 스타일 ID들을 동적으로 등록
-        self._discover_style_ids()
+        if styles is not None:
+            self._discover_style_ids_from(styles, default_style_id)
+        else:
+            self._discover_style_ids()
+
+    @property
+    def doc(self):
+        """공유 python-docx 문서"""
+        return self.package.document
 
     def _discover_style_ids(self):
         """
         문서 내의 모든 스타일을 검사하여, 이름(Name)을 기반으로 ID를 분류합니다.
         어떤 템플릿이 들어와도 이름이 표준(Title, 제목 등)을 따른다면 작동합니다.
         """
-        # 찾고자 하는 표준 이름 패턴 (소문자 기준)
-        target_patterns = {
-            'cover': ['title', 'subtitle', 'cover title', '제목', '부제목'],
-            'toc': ['toc', 'table of contents', '목차', '차례'],
-            'section': ['heading 1', '제목 1', 'part title', 'section'],
-            'body': ['normal', 'body text', '본문', '바탕글', 'list paragraph']
-        }
-
         # docx의 styles 속성을 순회
         for style in self.doc.styles:
+            # 문단 스타일 ID 등록 (기본 스타일이 여럿이면 마지막 것 사용 - python-docx와 동일)
+            if style.style_id and style.type == WD_STYLE_TYPE.PARAGRAPH:
+                self.paragraph_style_ids.add(style.style_id)
+                if style.element.default:
+                    self.default_style_id = style.style_id
+
             # 스타일 이름과 ID 확보
             if not style.name or not style.style_id:
                 continue
-            
-            name_lower = style.name.lower()
-            style_id = style.style_id
-
-            # 1. Cover 스타일 감지
-            if any(p == name_lower for p in target_patterns['cover']):
-                self.cover_styles.add(style_id)
-
-            # 2. TOC 스타일 감지 (이름에 포함되어 있으면 인정)
-            if any(p in name_lower for p in target_patterns['toc']):
-                self.toc_styles.add(style_id)
-
-            # 3. Section 스타일 감지
-            if any(p == name_lower for p in target_patterns['section']):
-                self.section_styles.add(style_id)
 
-            # 4. Body 스타일 감지
-            if any(p == name_lower for p in target_patterns['body']):
-                self.body_styles.add(style_id)
+            self._classify_style(style.style_id, style.name)
         
         # 디버깅: 감지된 스타일 출력
         # print(f"[DEBUG] 감지된 Cover Styles: {self.cover_styles}")
         # print(f"[DEBUG] 감지된 Section Styles: {self.section_styles}")
 
-    def analyze(self) -> TemplatePageStructure:
-        """페이지 구조 분석 실행"""
-        paragraphs_by_page = self._split_by_page_breaks()
+    def _discover_style_ids_from(self, styles: Dict[str, Any], default_style_id: Optional[str]):
+        """분석기가 이미 읽은 StyleInfo로 스타일 ID 분류 (스트리밍 분석용)"""
+        self.default_style_id = default_style_id
+        for style_id, style in styles.items():
+            if style.style_type == 'paragraph':
+                self.paragraph_style_ids.add(style_id)
+            if style.name:
+                self._classify_style(style_id, style.name)
 
-        for page_num, paragraphs in enumerate(paragraphs_by_page):
-            page_info = self._analyze_page(page_num, paragraphs)
+    def _classify_style(self, style_id: str, name: str):
+        """스타일 이름으로 페이지 유형별 스타일 ID 집합에 등록"""
+        target_patterns = self.TARGET_PATTERNS
+        name_lower = name.lower()
+
+        # 1. Cover 스타일 감지
+        if any(p == name_lower for p in target_patterns['cover']):
+            self.cover_styles.add(style_id)
+
+        # 2. TOC 스타일 감지 (이름에 포함되어 있으면 인정)
+        if any(p in name_lower for p in target_patterns['toc']):
+            self.toc_styles.add(style_id)
+
+        # 3. Section 스타일 감지
+        if any(p == name_lower for p in target_patterns['section']):
+            self.section_styles.add(style_id)
+
+        # 4. Body 스타일 감지
+        if any(p == name_lower for p in target_patterns['body']):
+            self.body_styles.add(style_id)
+
+    def create_segmenter(self) -> PageSegmenter:
+        """이 템플릿의 스타일 정보로 설정한 페이지 분할기"""
+        return PageSegmenter(self.default_style_id, self.paragraph_style_ids)
+
+    def analyze(self, spans: Optional[List[PageSpan]] = None) -> TemplatePageStructure:
+        """
+        페이지 구조 분석 실행
+
+        Args:
+            spans: 이미 분할된 페이지 구간 (스트리밍 분석용, 없으면 본문을 직접 분할)
+        """
+        if spans is None:
+            spans = self._split_by_page_breaks()
+
+        for page_num, span in enumerate(spans):
+            page_info = self._analyze_page(page_num, span)
             self.structure.pages.append(page_info)
 
             # 인덱싱 (가장 먼저 발견된 페이지를 해당 유형의 대표로 설정)
@@ -110,36 +179,15 @@ class TemplatePageAnalyzer:
 
         return self.structure
 
-    def _split_by_page_breaks(self) -> List[List]:
-        """페이지(Hard Break) 기준으로 문단 분리"""
-        pages = []
-        current_page = []
-
-        for para in self.doc.paragraphs:
-            current_page.append(para)
-            if self._has_page_break(para):
-                pages.append(current_page)
-                current_page = []
-        
-        if current_page:
-            pages.append(current_page)
-        return pages
-
-    def _has_page_break(self, para) -> bool:
-        """<w:br type="page"> 태그 확인"""
-        if para._element is None: return False
-        xml = para._element.xml
-        return 'w:br' in xml and 'type="page"' in xml
+    def _split_by_page_breaks(self) -> List[PageSpan]:
+        """페이지 나눔(강제/렌더링/구역) 기준으로 본문 블록 분할"""
+        return self.create_segmenter().segment(self.doc.element.body)
 
-    def _analyze_page(self, page_num: int, paragraphs: List) -> PageInfo:
+    def _analyze_page(self, page_num: int, span: PageSpan) -> PageInfo:
         """페이지 유형 판단 (스타일 기반 + 휴리스틱)"""
-        styles = []
-        texts = []
-        for p in paragraphs:
-            if p.style and p.style.style_id:
-                styles.append(p.style.style_id)
-            if p.text.strip():
-                texts.append(p.text.strip()[:30])
+        styles = span.styles
+        texts = span.texts
+        paragraph_count = span.paragraph_count
 
         style_set = set(styles)
 
@@ -149,15 +197,15 @@ class TemplatePageAnalyzer:
             if style_set & self.cover_styles:
                 is_cover = True
             # 스타일을 못 찾았더라도, 텍스트가 매우 적고(5줄 이하) 첫 페이지면 표지로 간주 (휴리스틱)
-            elif len(paragraphs) <= 5 and len(texts) > 0:
+            elif paragraph_count <= 5 and len(texts) > 0:
                 is_cover = True
         
         if is_cover:
-            return PageInfo(page_num, 'cover', list(style_set), len(paragraphs), str(texts))
+            return PageInfo(page_num, 'cover', list(style_set), paragraph_count, str(texts))
 
         # 2. TOC 판단
         if style_set & self.toc_styles:
-            return PageInfo(page_num, 'toc', list(style_set), len(paragraphs), "목차")
+            return PageInfo(page_num, 'toc', list(style_set), paragraph_count, "목차")
 
         # 3. Section 판단: Section 스타일(H1)이 존재하고, 본문 스타일 빈도가 낮을 때
         has_section_header = bool(style_set & self.section_styles)
@@ -165,10 +213,10 @@ class TemplatePageAnalyzer:
         
         # 제목만 덩그러니 있거나(글자 수 적음), 섹션 스타일이 명확할 때
         if has_section_header and body_style_count <= 2 and len(texts) < 5:
-            return PageInfo(page_num, 'section', list(style_set), len(paragraphs), str(texts))
+            return PageInfo(page_num, 'section', list(style_set), paragraph_count, str(texts))
 
         # 4. 나머지는 모두 Body
-        return PageInfo(page_num, 'body', list(style_set), len(paragraphs), str(texts))
+        return PageInfo(page_num, 'body', list(style_set), paragraph_count, str(texts))
 
     def get_page_mapping_rules(self) -> Dict:
         """매핑 규칙 반환 (동적으로 찾은 ID 중 하나를 대표로 반환)"""
@@ -17,6 +17,8 @@ from .models import (
     PLACEHOLDER_PATTERNS, parse_placeholder_id
 )
 from .template_analyzer import DocxTemplateAnalyzer
+from .cache import get_template_cache
+from .template_package import TemplatePackage
 
 
 class TemplateParser:
@@ -32,7 +34,8 @@ class TemplateParser:
     def __init__(
         self,
         docx_path: str,
-        placeholder_pattern: str = "default"
+        placeholder_pattern: str = "default",
+        package: Optional[TemplatePackage] = None,
     ):
         """
         Args:
@@ -42,22 +45,38 @@ class TemplateParser:
                 - "bracket": [[TITLE]]
                 - "angle": <<TITLE>>
                 - "underscore": ___TITLE___
+            package: 공유 템플릿 패키지 (없으면 새로 열기)
         """
         self.docx_path = Path(docx_path)
-        self.doc = Document(docx_path)
+        self.package = package or TemplatePackage(docx_path)
         self.pattern = PLACEHOLDER_PATTERNS.get(placeholder_pattern, PLACEHOLDER_PATTERNS["default"])
         self.regex = re.compile(self.pattern)
 
         # 템플릿 분석기 (스타일 정보 획득용)
         self._analyzer: Optional[DocxTemplateAnalyzer] = None
 
+    @property
+    def doc(self) -> Document:
+        """템플릿 문서 (캐시 적중 시에는 파싱하지 않도록 lazy loading)"""
+        return self.package.document
+
     def parse(self) -> ParsedTemplate:
         """
-        템플릿 파싱하여 플레이스홀더 추출
+        템플릿 파싱하여 플레이스홀더 추출 (템플릿 해시 기준 캐시 사용)
 
         Returns:
             ParsedTemplate 객체
         """
+        result = get_template_cache().get_or_compute(
+            ('parsed', self.pattern), self.package.sha256, self._parse
+        )
+        # 같은 내용의 템플릿이 다른 경로에 있을 수 있으므로 경로만 교체한 사본 반환
+        if result.file_path != str(self.docx_path):
+            result = result.model_copy(update={'file_path': str(self.docx_path)})
+        return result
+
+    def _parse(self) -> ParsedTemplate:
+        """플레이스홀더 추출 (캐시 미스 시 실행)"""
         result = ParsedTemplate(
             file_path=str(self.docx_path),
             total_paragraphs=len(self.doc.paragraphs)
@@ -165,14 +184,14 @@ class TemplateParser:
     def get_analyzer(self) -> DocxTemplateAnalyzer:
         """템플릿 분석기 인스턴스 반환 (lazy loading)"""
         if self._analyzer is None:
-            self._analyzer = DocxTemplateAnalyzer(str(self.docx_path))
+            self._analyzer = DocxTemplateAnalyzer(str(self.docx_path), package=self.package)
             self._analyzer.analyze()
         return self._analyzer
 
     def get_style_info(self, style_id: str) -> Optional[Dict[str, Any]]:
         """스타일 ID로 스타일 정보 가져오기"""
-        analyzer = self.get_analyzer()
-        style = analyzer.structure.styles.get(style_id)
+        structure = get_template_cache().get_structure(str(self.docx_path), package=self.package)
+        style = structure.styles.get(style_id)
         if style:
             return style.to_dict()
         return None
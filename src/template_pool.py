@@ -0,0 +1,94 @@
+"""
+템플릿 문서 풀
+
+- 템플릿(내용 해시)마다 파싱된 마스터 Document를 하나만 보관
+- 새 문서는 마스터를 복사해서 생성 (zip 해제/XML 파싱 없이 요소 트리 복사)
+- 이미지/폰트 등 바이너리 파트는 변경되지 않으므로 복사하지 않고 공유
+- 변형(variant)별 마스터 지원 (예: 본문을 비운 스켈레톤)
+"""
+
+import threading
+from typing import Any, Callable, Optional, Tuple
+
+from docx import Document
+from docx.document import Document as DocumentObject
+
+from .cache import CacheStats, LRUCache
+from .template_package import TemplatePackage, clone_document
+
+
+class TemplatePool:
+    """
+    마스터 문서 풀
+
+    사용 예:
+        pool = get_template_pool()
+        doc = pool.checkout(package)                          # 템플릿 그대로
+        doc = pool.checkout(package, 'skeleton', clear_body)  # 변형 마스터에서 복사
+
+    마스터는 절대 밖으로 내보내지 않으며, 반환되는 문서는 자유롭게 수정 가능.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        """
+        Args:
+            max_entries: 보관할 마스터 최대 개수 (초과 시 LRU 제거)
+        """
+        self._masters = LRUCache(max_entries)
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def master(self, key: Tuple[Any, ...], build: Callable[[], DocumentObject]) -> DocumentObject:
+        """마스터 조회 (없으면 build()로 생성하여 보관, 읽기 전용)"""
+        with self._lock:
+            master = self._masters.get(key)
+            if master is not None:
+                self.stats.hits += 1
+                return master
+
+            self.stats.misses += 1
+            master = build()
+            self._masters.put(key, master)
+            self.stats.evictions = self._masters.evictions
+            return master
+
+    def checkout(
+        self,
+        package: TemplatePackage,
+        variant: str = 'template',
+        prepare: Optional[Callable[[DocumentObject], None]] = None,
+    ) -> DocumentObject:
+        """
+        템플릿 문서 사본
+
+        Args:
+            package: 템플릿 패키지 (마스터가 없을 때만 파싱)
+            variant: 마스터 종류 이름 (prepare가 다르면 이름도 달라야 함)
+            prepare: 마스터를 만들 때 한 번만 적용할 변형 함수
+        """
+        def build() -> DocumentObject:
+            doc = package.clone_document()
+            if prepare is not None:
+                prepare(doc)
+            return doc
+
+        return clone_document(self.master((package.sha256, variant), build))
+
+    def checkout_default(self) -> DocumentObject:
+        """python-docx 기본 템플릿 문서 사본 (템플릿이 없을 때)"""
+        return clone_document(self.master(('default',), Document))
+
+    def clear(self):
+        with self._lock:
+            self._masters.clear()
+
+
+_default_pool: Optional[TemplatePool] = None
+
+
+def get_template_pool() -> TemplatePool:
+    """프로세스 공용 템플릿 풀"""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = TemplatePool()
+    return _default_pool
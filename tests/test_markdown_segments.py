@@ -0,0 +1,62 @@
+"""
+세그먼트 분할 회귀 테스트 (증분/스트리밍 파싱 결과가 MarkdownParser.parse()와 같은지)
+
+실행: uv run python -m pytest tests
+"""
+
+import pytest
+
+from src.incremental_parser import IncrementalMarkdownParser
+from src.markdown_parser import MarkdownParser
+
+
+# 빈 줄까지 이어지는 HTML 블록(유형 6·7) 안의 펜스 줄, 리스트/인용 안의 펜스 등
+BOUNDARY_CASES = [
+    '<div>\n```\n\n```\n\n# Top',
+    '</div>\n```\n\n```\n\n# Top',
+    '<div>\n~~~\n\n~~~\n\n# Top',
+    '<div>\n~~~\n\n~~~\n\n## Sub',
+    '<div>\n~~~\n\n~~~\n\npara **b** *i* `c`',
+    '<custom-tag>\n```\n\n# Top\n\n```\n\n# Two',
+    'text\n<span>\n```\n\n# Top\n\n```',
+    '<!-- note\n```\n-->\n\n# Top\n\n```\n\n# Two',
+    '<?php\n```\n?>\n\n# Top',
+    '- ```\n  text\n]]>\n   ```\n\n<div>\n\n# Top',
+    '- item\n  ```\n\n# Top\n\n```\n\n# Two',
+    '> quote\n\t```\n<a href="x">\n   ```\n\n# Top',
+    '-\n\n  ```\n\n# Top\n\n```\n\n# Two',
+    '1. x\n===\n   ```\n````\n\n# Top',
+    # 전처리에서 지우는 페이지 표식 줄 (리스트 항목으로 보면 안 됨)
+    '- Page 1 -\n  ```\ncode\n\n# x\n```\n',
+]
+
+
+@pytest.fixture(scope='module')
+def parser():
+    return MarkdownParser()
+
+
+@pytest.mark.parametrize('content', BOUNDARY_CASES)
+def test_incremental_parse_matches_full_parse(parser, content):
+    expected = parser.parse(content)
+    actual = IncrementalMarkdownParser().parse(content)
+
+    assert actual.raw_blocks == expected.raw_blocks
+    assert actual.sections == expected.sections
+
+
+@pytest.mark.parametrize('content', BOUNDARY_CASES)
+def test_streamed_blocks_match_full_parse(parser, content):
+    expected = parser._tokens_to_blocks(parser.md.parse(parser._preprocess(content)))
+
+    # segment_size=1: 안전한 경계마다 나눔
+    assert list(parser.iter_blocks([content], segment_size=1)) == expected
+
+
+def test_streamed_blocks_skip_page_markers(parser):
+    # 페이지 표식 줄은 전처리에서 지워지므로 리스트 항목으로 보고 펜스 경계를 판단하면 안 됨
+    content = '- Page 1 -\n  ```\ncode\n\n# x\n```\n'
+    expected = parser._tokens_to_blocks(parser.md.parse(parser._preprocess(content)))
+
+    assert list(parser.iter_blocks([content], segment_size=1)) == expected
+    assert [block.block_type for block in expected] == ['code']
@@ -0,0 +1,89 @@
+"""
+중첩 리스트/인용문 구조 테스트 (파서 children, 조립기 텍스트)
+
+실행: uv run python -m pytest tests
+"""
+
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+from src.docx_composer import DocxComposer
+from src.llm_content_mapper import ContentMapperSync
+from src.markdown_parser import MarkdownParser
+from src.template_parser import TemplateParser
+from src.template_package import TemplatePackage
+
+TEMPLATE_PATH = Path(__file__).resolve().parent.parent / 'test_template_with_placeholders.docx'
+
+NESTED_MARKDOWN = (
+    '# Title\n'
+    '\n'
+    '> outer quote\n'
+    '>\n'
+    '> > nested quote text\n'
+    '\n'
+    '- item\n'
+    '  - nested item\n'
+    '    - deep item\n'
+    '  > q1\n'
+    '  > > q2\n'
+)
+
+
+@pytest.fixture(scope='module')
+def blocks():
+    return MarkdownParser().parse(NESTED_MARKDOWN).raw_blocks
+
+
+@pytest.fixture(scope='module')
+def composer(tmp_path_factory):
+    return DocxComposer(str(TEMPLATE_PATH), output_dir=str(tmp_path_factory.mktemp('out')))
+
+
+def test_parser_keeps_nested_quotes_as_children(blocks):
+    quote = blocks[1]
+
+    assert quote.block_type == 'blockquote'
+    assert quote.content == 'outer quote'
+    assert [(c.block_type, c.content, c.level) for c in quote.children] == [
+        ('blockquote', 'nested quote text', 1),
+    ]
+
+
+def test_parser_keeps_nested_lists_as_children(blocks):
+    item = blocks[2].children[0]
+    nested_list, quote = item.children
+
+    assert item.content == 'item'
+    assert nested_list.block_type == 'list'
+    assert nested_list.children[0].content == 'nested item'
+    assert nested_list.children[0].children[0].children[0].content == 'deep item'
+    assert (quote.content, quote.children[0].content) == ('q1', 'q2')
+
+
+def test_composer_text_includes_nested_quotes(composer, blocks):
+    assert composer._get_block_text(blocks[1]) == 'outer quote\nnested quote text'
+
+
+def test_composer_list_lines_include_nested_blocks(composer, blocks):
+    assert composer._list_lines(blocks[2]) == [
+        '- item',
+        '  - nested item',
+        '    - deep item',
+        '  q1',
+        '  q2',
+    ]
+
+
+def test_compose_keeps_nested_quote_text(composer):
+    package = TemplatePackage(str(TEMPLATE_PATH))
+    template = TemplateParser(str(TEMPLATE_PATH), package=package).parse()
+    content = MarkdownParser().parse(NESTED_MARKDOWN)
+    plan = ContentMapperSync().create_mapping_plan(template, content)
+
+    output = composer.compose(mapping_plan=plan, content=content)
+    texts = [p.text for p in Document(output).paragraphs]
+
+    assert 'outer quote\nnested quote text' in texts
@@ -0,0 +1,43 @@
+"""
+공유 템플릿 패키지 테스트 (소비자 여럿이 zip 한 번, 파트별 파싱 한 번만 쓰는지)
+
+실행: uv run python -m pytest tests
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src import cache
+from src.docx_composer import DocxComposer
+from src.llm_content_mapper import ContentMapperSync
+from src.markdown_parser import MarkdownParser
+from src.template_analyzer import DocxTemplateAnalyzer
+from src.template_package import TemplatePackage
+from src.template_page_analyzer import TemplatePageAnalyzer
+from src.template_parser import TemplateParser
+
+TEMPLATE_PATH = str(Path(__file__).resolve().parent.parent / 'test_template_with_placeholders.docx')
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    # 디스크 캐시 적중으로 분석을 건너뛰지 않도록 빈 메모리 캐시 사용
+    monkeypatch.setattr(cache, '_default_cache', cache.TemplateCache(use_disk=False))
+
+
+def test_consumers_share_one_zip_read_and_parse_each_part_once(memory_cache, tmp_path):
+    package = TemplatePackage(TEMPLATE_PATH)
+
+    template = TemplateParser(TEMPLATE_PATH, package=package).parse()
+    DocxTemplateAnalyzer(TEMPLATE_PATH, package=package).analyze()
+    TemplatePageAnalyzer(TEMPLATE_PATH, package=package).analyze()
+
+    content = MarkdownParser().parse('# Title\n\n## Section\n\nBody text\n')
+    plan = ContentMapperSync().create_mapping_plan(template, content)
+    composer = DocxComposer(TEMPLATE_PATH, output_dir=str(tmp_path), package=package)
+    composer.compose(mapping_plan=plan, content=content)
+
+    assert package.zip_reads == 1
+    assert package.parse_counts
+    assert all(count == 1 for count in package.parse_counts.values()), package.parse_counts
@@ -0,0 +1,63 @@
+"""
+template_structure.json 저장/로드 테스트 (이미지 경로가 로드한 환경의 저장소를 따르는지)
+
+실행: uv run python -m pytest tests
+"""
+
+import pickle
+from pathlib import Path
+
+from src.asset_store import AssetStore
+from src.template_analyzer import DocxTemplateAnalyzer, PageTemplate, TemplateStructure
+from src.template_package import TemplatePackage
+
+TEMPLATE_PATH = str(Path(__file__).resolve().parent.parent / 'test_template_with_placeholders.docx')
+
+
+def test_load_moves_image_paths_to_given_store(tmp_path):
+    saved_store = AssetStore(str(tmp_path / 'saved'))
+    structure = DocxTemplateAnalyzer(TEMPLATE_PATH, asset_store=saved_store).analyze()
+    footer = next(img for img in structure.images if img.position == 'footer')
+    structure.page_templates['body'] = PageTemplate(
+        page_type='body', footer_image=footer.extracted_path
+    )
+    json_path = structure.save(str(tmp_path / 'template_structure.json'))
+
+    store = AssetStore(str(tmp_path / 'loaded'))
+    loaded = TemplateStructure.load(json_path, TEMPLATE_PATH, asset_store=store)
+    image = next(img for img in loaded.images if img.position == 'footer')
+
+    assert image.extracted_path.startswith(str(store.directory))
+    assert loaded.page_templates['body'].footer_image == image.extracted_path
+
+    path = loaded.image_path(image)
+    assert path == image.extracted_path
+    assert Path(path).is_file()
+    assert (store.writes, saved_store.writes) == (1, 0)
+
+
+def test_image_path_reads_from_analyzed_package(tmp_path):
+    package = TemplatePackage(TEMPLATE_PATH)
+    store = AssetStore(str(tmp_path / 'assets'))
+    structure = DocxTemplateAnalyzer(TEMPLATE_PATH, package=package, asset_store=store).analyze()
+    footer = next(img for img in structure.images if img.position == 'footer')
+    # 템플릿 파일이 옮겨져도 분석한 패키지에서 읽음
+    structure.file_path = str(tmp_path / 'missing.docx')
+
+    # PageTemplate 이미지 필드 값(extracted_path)으로도 요청 가능
+    path = structure.image_path(footer.extracted_path)
+
+    assert path == footer.extracted_path
+    assert Path(path).read_bytes() == package.part_blob(footer.original_path)
+    assert structure.image_path('') == ''
+
+
+def test_structure_pickles_without_package():
+    structure = DocxTemplateAnalyzer(TEMPLATE_PATH).analyze()
+
+    # 디스크 캐시는 pickle로 저장
+    restored = pickle.loads(pickle.dumps(structure))
+
+    assert structure._package is not None
+    assert restored._package is None
+    assert restored.images == structure.images